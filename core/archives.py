@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Archives для Dynamic Messe Stand V4
+Потокові стиснені архіви записів (gzip / xz / zip) з розбиттям на частини
+"""
+
+import io
+import os
+import gzip
+import json
+import lzma
+import base64
+import zipfile
+from datetime import datetime
+from core.logger import logger
+
+ARCHIVE_FORMAT = "dynamic-messe-stand-archive"
+ARCHIVE_VERSION = 1
+
+# Стиснення -> розширення файлу
+ARCHIVE_COMPRESSIONS = {
+    'gzip': '.gz',
+    'xz': '.xz',
+    'zip': '.zip'
+}
+
+# Кодування записів: JSON lines або потік YAML-документів
+ARCHIVE_CODECS = {
+    'json': '.jsonl',
+    'yaml': '.yaml'
+}
+
+# Розмір шматка для файлів та ассетів (до base64)
+CHUNK_SIZE = 1024 * 1024
+
+def archive_filename(stem, codec='json', compression='gzip'):
+    """Назва архіву для заданого кодування та стиснення"""
+    if compression == 'zip':
+        return f"{stem}.zip"
+    return f"{stem}{ARCHIVE_CODECS[codec]}{ARCHIVE_COMPRESSIONS[compression]}"
+
+def _part_path(filepath, part):
+    """Шлях до частини архіву: перша частина - сам файл, далі name.partN.ext"""
+    if part == 1:
+        return filepath
+    directory, name = os.path.split(filepath)
+    stem, dot, extensions = name.partition('.')
+    return os.path.join(directory, f"{stem}.part{part}{dot}{extensions}")
+
+def _detect(filepath):
+    """Визначає (codec, compression) за назвою файлу"""
+    name = filepath.lower()
+    if name.endswith('.zip'):
+        return None, 'zip'
+    for compression, extension in ARCHIVE_COMPRESSIONS.items():
+        if name.endswith(extension):
+            name = name[:-len(extension)]
+            break
+    else:
+        compression = None
+    codec = 'yaml' if name.endswith(('.yaml', '.yml')) else 'json'
+    return codec, compression
+
+def iter_file_chunks(filepath, chunk_size=CHUNK_SIZE):
+    """Читає файл шматками - пам'ять обмежена chunk_size"""
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            yield chunk
+
+def chunk_records(record_type, key, chunks):
+    """Розбиває бінарні дані на записи {type, key, offset, data(base64)}"""
+    offset = 0
+    for chunk in chunks:
+        yield {'type': record_type, 'key': key, 'offset': offset, 'data': base64.b64encode(chunk).decode('ascii')}
+        offset += len(chunk)
+
+def data_to_records(data):
+    """Розкладає документ на записи: кожен слайд окремо, решта ключів - як entry"""
+    for key, value in data.items():
+        if key == 'slides' and isinstance(value, dict):
+            for slide_id, slide in value.items():
+                yield {'type': 'slide', 'key': slide_id, 'data': slide}
+        else:
+            yield {'type': 'entry', 'key': key, 'data': value}
+
+def records_to_data(records):
+    """Збирає документ назад із записів data_to_records"""
+    data = {}
+    for record in records:
+        if record.get('type') == 'slide':
+            data.setdefault('slides', {})[record['key']] = record['data']
+        elif record.get('type') == 'entry':
+            data[record['key']] = record['data']
+    return data
+
+class ArchiveWriter:
+    """Записує записи по одному у стиснений потік
+
+    У пам'яті лише поточний запис і буфер компресора. При split_size архів
+    ділиться на самостійні частини (приблизно за стисненим розміром); остання
+    запис частини посилається на наступну.
+    """
+
+    def __init__(self, filepath, codec='json', compression='gzip', split_size=None, header=None):
+        if codec not in ARCHIVE_CODECS:
+            raise ValueError(f"Unknown archive codec: {codec}")
+        if compression not in ARCHIVE_COMPRESSIONS:
+            raise ValueError(f"Unknown archive compression: {compression}")
+
+        self.filepath = filepath
+        self.codec = codec
+        self.compression = compression
+        self.split_size = split_size
+        self.header = dict(header or {})
+        self.parts = []        # тимчасові шляхи записаних частин
+        self.paths = []        # опубліковані частини (після close)
+        self.record_count = 0
+        self._raw = None
+        self._zip = None
+        self._binary = None
+        self._stream = None
+
+    def _open_part(self):
+        """Відкриває наступну частину та пише її заголовок"""
+        part = len(self.parts) + 1
+        tmp_path = f"{_part_path(self.filepath, part)}.tmp"
+        os.makedirs(os.path.dirname(os.path.abspath(tmp_path)), exist_ok=True)
+        self.parts.append(tmp_path)
+
+        if self.compression == 'zip':
+            self._zip = zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED)
+            self._raw = self._zip.fp
+            self._binary = self._zip.open(f"records{ARCHIVE_CODECS[self.codec]}", 'w', force_zip64=True)
+        else:
+            self._raw = open(tmp_path, 'wb')
+            if self.compression == 'gzip':
+                self._binary = gzip.GzipFile(fileobj=self._raw, mode='wb')
+            else:
+                # preset 3: ~32 МБ пам'яті компресора замість ~94 МБ при стандартному 6
+                self._binary = lzma.LZMAFile(self._raw, 'wb', preset=3)
+
+        self._stream = io.TextIOWrapper(self._binary, encoding='utf-8', newline='\n')
+        self._write({
+            'type': 'header',
+            'format': ARCHIVE_FORMAT,
+            'version': ARCHIVE_VERSION,
+            'part': part,
+            'created_at': datetime.now().isoformat(),
+            **self.header
+        })
+
+    def _close_part(self):
+        """Закриває поточну частину (компресор, zip-запис, файл)"""
+        self._stream.close()
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._raw.close()
+        self._stream = self._binary = self._raw = self._zip = None
+
+    def _write(self, record):
+        """Серіалізує один запис у поточну частину"""
+        if self.codec == 'json':
+            self._stream.write(json.dumps(record, ensure_ascii=False))
+            self._stream.write('\n')
+        else:
+            from core.storage import yaml_dump
+            yaml_dump(record, self._stream, explicit_start=True, allow_unicode=True, default_flow_style=False)
+
+    def write(self, record):
+        """Додає запис (dict) до архіву"""
+        if self._stream is None:
+            self._open_part()
+        elif self.split_size and self._raw.tell() >= self.split_size:
+            next_part = _part_path(self.filepath, len(self.parts) + 1)
+            self._write({'type': 'continue', 'next': os.path.basename(next_part)})
+            self._close_part()
+            self._open_part()
+
+        self._write(record)
+        self.record_count += 1
+
+    def write_many(self, records):
+        """Додає всі записи з ітератора"""
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        """Завершує архів і атомарно публікує всі частини; повертає їх шляхи"""
+        if self._stream is None and not self.parts:
+            self._open_part()
+        if self._stream is not None:
+            self._close_part()
+
+        self.paths = []
+        for tmp_path in self.parts:
+            final_path = tmp_path[:-len('.tmp')]
+            os.replace(tmp_path, final_path)
+            self.paths.append(final_path)
+        self.parts = []
+
+        logger.debug("Archive written: %s (%d records, %d parts)", self.filepath, self.record_count, len(self.paths))
+        return self.paths
+
+    def abort(self):
+        """Відкидає незавершений архів"""
+        if self._stream is not None:
+            try:
+                self._close_part()
+            except Exception:
+                pass
+        for tmp_path in self.parts:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+def _open_reader(filepath):
+    """Відкриває частину архіву як текстовий потік; повертає (stream, codec)"""
+    codec, compression = _detect(filepath)
+    if compression == 'zip':
+        archive = zipfile.ZipFile(filepath, 'r')
+        name = next(n for n in archive.namelist() if n.startswith('records.'))
+        codec = 'yaml' if name.endswith('.yaml') else 'json'
+        binary = archive.open(name, 'r')
+        stream = io.TextIOWrapper(binary, encoding='utf-8')
+        # ZipFile закривається разом із потоком
+        original_close = stream.close
+        def close():
+            original_close()
+            archive.close()
+        stream.close = close
+        return stream, codec
+    if compression == 'gzip':
+        return io.TextIOWrapper(gzip.open(filepath, 'rb'), encoding='utf-8'), codec
+    if compression == 'xz':
+        return io.TextIOWrapper(lzma.open(filepath, 'rb'), encoding='utf-8'), codec
+    return open(filepath, 'r', encoding='utf-8'), codec
+
+def read_archive(filepath):
+    """Генератор записів архіву з усіх частин по черзі (без заголовків частин)
+
+    Перший заголовок повертається як звичайний запис type='header'.
+    """
+    part = 1
+    while filepath:
+        next_path = None
+        stream, codec = _open_reader(filepath)
+        try:
+            if codec == 'json':
+                records = (json.loads(line) for line in stream if line.strip())
+            else:
+                import yaml
+                from core.storage import YAML_LOADER
+                records = yaml.load_all(stream, Loader=YAML_LOADER)
+
+            for record in records:
+                record_type = record.get('type') if isinstance(record, dict) else None
+                if record_type == 'continue':
+                    next_path = os.path.join(os.path.dirname(filepath), record['next'])
+                    continue
+                if record_type == 'header' and part > 1:
+                    continue
+                yield record
+        finally:
+            stream.close()
+        filepath = next_path
+        part += 1
+
+def archive_parts(filepath):
+    """Шляхи всіх існуючих частин архіву"""
+    parts = []
+    part = 1
+    while os.path.exists(_part_path(filepath, part)):
+        parts.append(_part_path(filepath, part))
+        part += 1
+    return parts
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Asset Store для Dynamic Messe Stand V4
+Контентно-адресоване сховище медіафайлів з дедуплікацією
+"""
+
+import os
+import re
+import shutil
+import hashlib
+import tempfile
+from collections import OrderedDict
+from core.logger import logger
+from core.storage import storage_manager
+
+# Префікс посилань на ассети у canvas_elements
+ASSET_REF_PREFIX = "sha256:"
+_ASSET_REF_RE = re.compile(r'sha256:[0-9a-f]{64}')
+
+def is_asset_ref(value):
+    """Перевіряє чи є значення посиланням на ассет (префікс + 64 hex-символи)"""
+    return isinstance(value, str) and _ASSET_REF_RE.fullmatch(value) is not None
+
+def _temp_file_for(blob_path):
+    """Унікальний тимчасовий файл поруч із blob - паралельні процеси не пишуть в один"""
+    directory = os.path.dirname(blob_path)
+    os.makedirs(directory, exist_ok=True)
+    return tempfile.mkstemp(prefix=f"{os.path.basename(blob_path)[:8]}.", suffix='.tmp', dir=directory)
+
+class AssetWriter:
+    """Потоковий запис ассета з відомим посиланням (наприклад, з архіву)
+    
+    Дані пишуться у тимчасовий файл; commit() публікує blob лише якщо SHA-256
+    вмісту збігається з посиланням - пошкоджений архів не отруює сховище.
+    """
+
+    def __init__(self, blob_path, ref):
+        self.ref = ref
+        self.blob_path = blob_path
+        fd, self.tmp_path = _temp_file_for(blob_path)
+        self._file = os.fdopen(fd, 'wb')
+        self._digest = hashlib.sha256()
+
+    def write(self, data):
+        self._file.write(data)
+        self._digest.update(data)
+
+    def commit(self):
+        """Перевіряє хеш і атомарно публікує blob; False - вміст не відповідає посиланню"""
+        self._file.close()
+        if ASSET_REF_PREFIX + self._digest.hexdigest() != self.ref:
+            os.remove(self.tmp_path)
+            logger.warning(f"Asset content does not match its ref, discarded: {self.ref}")
+            return False
+        os.replace(self.tmp_path, self.blob_path)
+        return True
+
+    def abort(self):
+        """Відкидає недописаний ассет"""
+        self._file.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+class AssetStore:
+    """Сховище ассетів, де ключ - SHA-256 хеш вмісту"""
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root=None, cache_bytes=32 * 1024 * 1024):
+        self.root = root or os.path.join(storage_manager.data_dir, "assets")
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.cache_bytes = cache_bytes
+        self._cache = OrderedDict()  # ref -> bytes, спільні для всіх слайдів
+        self._cached_size = 0
+        self._sources = []  # додаткові джерела лише для читання (наприклад, відкриті bundle)
+
+    def add_source(self, source):
+        """Додає джерело з методами has_asset(ref) і read_asset(ref)"""
+        if source not in self._sources:
+            self._sources.append(source)
+
+    def remove_source(self, source):
+        """Прибирає джерело ассетів"""
+        if source in self._sources:
+            self._sources.remove(source)
+
+    def _blob_path(self, ref):
+        """Шлях до blob-файлу для посилання"""
+        digest = ref[len(ASSET_REF_PREFIX):]
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def has(self, ref):
+        """Перевіряє чи є ассет у сховищі"""
+        return is_asset_ref(ref) and os.path.exists(self._blob_path(ref))
+
+    def get_path(self, ref):
+        """Повертає шлях до файлу ассета або None"""
+        if not self.has(ref):
+            return None
+        return self._blob_path(ref)
+
+    def _store_blob(self, ref, write_func):
+        """Атомарно записує blob, якщо його ще немає"""
+        blob_path = self._blob_path(ref)
+        if os.path.exists(blob_path):
+            return False
+
+        fd, tmp_path = _temp_file_for(blob_path)
+        os.close(fd)
+        try:
+            write_func(tmp_path)
+            os.replace(tmp_path, blob_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
+
+    def open_writer(self, ref):
+        """AssetWriter для потокового запису ассета з перевіркою хешу"""
+        if not is_asset_ref(ref):
+            raise ValueError(f"Invalid asset ref: {ref!r}")
+        return AssetWriter(self._blob_path(ref), ref)
+
+    def put_bytes(self, data):
+        """Зберігає байти і повертає посилання sha256:..."""
+        ref = ASSET_REF_PREFIX + hashlib.sha256(data).hexdigest()
+
+        def write(tmp_path):
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+
+        if self._store_blob(ref, write):
+            logger.debug(f"Asset stored: {ref[:20]}... ({len(data)} bytes)")
+        return ref
+
+    def put_file(self, filepath):
+        """Додає файл у сховище (потоково) і повертає посилання"""
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        ref = ASSET_REF_PREFIX + digest.hexdigest()
+
+        if self._store_blob(ref, lambda tmp_path: shutil.copyfile(filepath, tmp_path)):
+            logger.debug(f"Asset stored from {filepath}: {ref[:20]}...")
+        return ref
+
+    def read_bytes(self, ref):
+        """Читає ассет; однакові ассети тримаються в пам'яті одним об'єктом"""
+        data = self._cache.get(ref)
+        if data is not None:
+            self._cache.move_to_end(ref)
+            return data
+
+        blob_path = self.get_path(ref)
+        if blob_path is not None:
+            with open(blob_path, 'rb') as f:
+                data = f.read()
+        else:
+            data = self._read_from_sources(ref)
+            if data is None:
+                return None
+
+        self._cache[ref] = data
+        self._cached_size += len(data)
+        while self._cached_size > self.cache_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_size -= len(evicted)
+
+        return data
+
+    def _read_from_sources(self, ref):
+        """Читає ассет з першого джерела, яке його містить"""
+        for source in self._sources:
+            if source.has_asset(ref):
+                return source.read_asset(ref)
+        return None
+
+    def iter_refs(self):
+        """Ітерує всі посилання у сховищі"""
+        if not os.path.isdir(self.objects_dir):
+            return
+        for prefix_entry in os.scandir(self.objects_dir):
+            if not prefix_entry.is_dir():
+                continue
+            for blob_entry in os.scandir(prefix_entry.path):
+                if not blob_entry.name.endswith('.tmp'):
+                    yield ASSET_REF_PREFIX + prefix_entry.name + blob_entry.name
+
+    def copy_missing_to(self, target_root, refs=None):
+        """Копіює в інше сховище лише відсутні там blob-и, повертає їх кількість"""
+        target = AssetStore(target_root, cache_bytes=0)
+        copied = 0
+
+        for ref in (refs if refs is not None else self.iter_refs()):
+            source_path = self.get_path(ref)
+            if source_path is None:
+                logger.warning(f"Asset missing in store: {ref}")
+                continue
+            if target._store_blob(ref, lambda tmp_path: shutil.copyfile(source_path, tmp_path)):
+                copied += 1
+
+        logger.debug(f"Copied {copied} missing assets to {target_root}")
+        return copied
+
+# Глобальна інстанція сховища ассетів
+asset_store = AssetStore()
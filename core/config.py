@@ -31,7 +31,10 @@ class Config:
             'min_height': 720,
             'fullscreen_on_start': True,
             'responsive_scaling': True,
-            'force_fullscreen': True
+            'force_fullscreen': True,
+            'resize_interval_ms': 16,     # höchstens ein Relayout pro Frame
+            'resize_burst_gap_ms': 250,   # Pause, nach der eine Resize-Interaktion als beendet gilt
+            'text_layout_cache_size': 2048  # gecachte Umbrüche/Textbreiten
         }
         
         # Design-Konfiguration
@@ -45,7 +48,33 @@ class Config:
         self.content = {
             'slides_per_page': 10,
             'auto_save_interval': 30,  # Sekunden
-            'demo_slide_duration': 5   # Sekunden
+            'demo_slide_duration': 5,  # Sekunden
+            'bitmap_playback': False,  # Demo-Folien als vorgerenderte Bitmaps anzeigen (Pillow)
+            'bitmap_cache_bytes': 64 * 1024 * 1024
+        }
+        
+        # Logging-Konfiguration
+        self.logging = {
+            'queue_size': 10000,     # Maximal gepufferte Log-Einträge (Überlauf wird gezählt)
+            'batch_size': 256,       # Einträge pro Schreibvorgang des Hintergrund-Threads
+            'flush_interval': 0.5,   # Sekunden bis zum Flush bei wenig Aufkommen
+            'max_bytes': 10 * 1024 * 1024,         # Rotation ab dieser Dateigröße
+            'max_age_days': 14,                    # ältere Log-Archive werden gelöscht
+            'max_total_bytes': 200 * 1024 * 1024,  # Obergrenze aller Log-Archive
+            'compress': True,                      # rotierte Logs im Hintergrund gzip-komprimieren
+            'active_grace_seconds': 300,           # kürzlich geänderte Logs gelten als aktiv (andere Prozesse)
+            'perf_events': True                    # JSON-Lines-Performance-Events (logs/perf_events_*.log)
+        }
+        
+        # Speicher-Konfiguration
+        self.storage = {
+            'backend': 'file',                        # 'file' oder 'sqlite'
+            'sqlite_filename': 'dynamic_messe_stand.db',
+            'backup_keep': 10,                        # Anzahl aufbewahrter Backups
+            'journal_filename': 'slides.journal',     # Write-Ahead-Journal der Folien-Änderungen
+            'journal_fsync': True,                    # Änderungen zeitnah auf Platte (fsync im Hintergrund)
+            'journal_sync_delay': 0.1,                # Sekunden, in denen Änderungen für einen fsync gesammelt werden
+            'journal_compact_entries': 500            # Einträge bis zur Übernahme ins Hauptspeicher
         }
 
 # Globale Konfigurationsinstanz
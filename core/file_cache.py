@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Parse Cache для Dynamic Messe Stand V4
+Бінарний sidecar-кеш для розпарсених JSON/YAML файлів
+"""
+
+import os
+import json
+import pickle
+import hashlib
+from core.logger import logger
+from core.storage import storage_manager, yaml_load
+
+class ParseCache:
+    """Кеш розпарсених файлів презентацій, ключ - шлях + mtime + хеш вмісту"""
+
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.join(storage_manager.data_dir, "cache")
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_path(self, filepath):
+        """Шлях до sidecar-файлу для вказаного файлу"""
+        key = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.pcache")
+
+    @staticmethod
+    def _parse(raw, filepath):
+        """Парсить сирі байти як JSON або YAML за розширенням"""
+        text = raw.decode('utf-8')
+        if filepath.lower().endswith(('.yaml', '.yml')):
+            return yaml_load(text)
+        return json.loads(text)
+
+    def _read_header(self, f):
+        """Читає заголовок кешу (без payload)"""
+        header = pickle.load(f)
+        if not isinstance(header, tuple) or len(header) != 4 or header[0] != self.CACHE_VERSION:
+            return None
+        return header
+
+    def _write_entry(self, cache_path, stat, digest, payload):
+        """Атомарно записує заголовок і payload у sidecar-файл"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((self.CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+
+    def load(self, filepath):
+        """Повертає розпарсені дані файлу, пропускаючи парсинг при влучанні в кеш"""
+        stat = os.stat(filepath)
+        cache_path = self._cache_path(filepath)
+        header = None
+
+        # Швидкий шлях: mtime і розмір не змінились - файл навіть не читаємо
+        try:
+            with open(cache_path, 'rb') as f:
+                header = self._read_header(f)
+                if header and header[1] == stat.st_mtime_ns and header[2] == stat.st_size:
+                    data = pickle.load(f)
+                    self.hits += 1
+                    return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable parse cache {cache_path}: {e}")
+            header = None
+
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+        # mtime змінився, але вміст той самий (копіювання, touch) - оновлюємо лише заголовок
+        if header and header[3] == digest:
+            try:
+                with open(cache_path, 'rb') as f:
+                    self._read_header(f)
+                    payload = f.read()
+                data = pickle.loads(payload)
+                self._write_entry(cache_path, stat, digest, payload)
+                self.hits += 1
+                return data
+            except Exception as e:
+                logger.debug(f"Parse cache refresh failed for {filepath}: {e}")
+
+        data = self._parse(raw, filepath)
+        self.misses += 1
+
+        try:
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_entry(cache_path, stat, digest, payload)
+        except Exception as e:
+            logger.warning(f"Could not write parse cache for {filepath}: {e}")
+
+        return data
+
+    def invalidate(self, filepath):
+        """Видаляє sidecar-файл для вказаного файлу"""
+        try:
+            os.remove(self._cache_path(filepath))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def clear(self):
+        """Видаляє всі sidecar-файли"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        removed = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.pcache'):
+                os.remove(entry.path)
+                removed += 1
+
+        logger.debug(f"Parse cache cleared: {removed} entries")
+        return removed
+
+# Глобальна інстанція кешу
+parse_cache = ParseCache()
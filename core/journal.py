@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Journal для Dynamic Messe Stand V4
+Журнал змін слайдів (write-ahead) та атомарний запис файлів
+"""
+
+import os
+import json
+import time
+import zlib
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from core.logger import logger
+
+@contextmanager
+def atomic_open(filepath, mode='w', encoding='utf-8'):
+    """Пише у тимчасовий файл, fsync і атомарно замінює ціль
+
+    Після збою на диску лишається або старий, або повністю новий файл.
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{filepath}.tmp"
+    f = open(tmp_path, mode, encoding=None if 'b' in mode else encoding)
+    try:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        f.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+def _fsync_directory(directory):
+    """Фіксує перейменування в каталозі (на Windows не підтримується)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class SlideJournal:
+    """Append-only журнал змін слайдів
+
+    Кожен рядок - "crc32<TAB>json" з полями seq, op ('upsert' / 'delete'),
+    slide_id та record. Обірваний або пошкоджений хвіст (збій живлення під час
+    запису) відкидається при читанні.
+
+    append_many лише пише у файл; fsync виконує фоновий потік, який збирає
+    зміни за sync_delay секунд (серія натискань клавіш - один fsync), тож потік
+    Tk не чекає на диск.
+    """
+
+    def __init__(self, filepath, fsync=True, sync_delay=0.1):
+        self.filepath = filepath
+        self.fsync = fsync
+        self.sync_delay = sync_delay
+        self._lock = threading.Lock()
+        self._file = None
+        self._sync_requested = threading.Event()
+        self._sync_thread = None
+        self.entry_count = 0
+        self._seq = 0
+        self.damaged = False  # у файлі був пошкоджений хвіст
+        if os.path.exists(filepath):
+            entries = self.read_entries()
+            if self.damaged:
+                # Нові записи не повинні опинитися за пошкодженим рядком
+                with atomic_open(filepath) as f:
+                    f.write(''.join(self._encode(entry) for entry in entries))
+            self.entry_count = len(entries)
+            self._seq = entries[-1]['seq'] if entries else 0
+
+    def _open(self):
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.filepath)), exist_ok=True)
+            self._file = open(self.filepath, 'a', encoding='utf-8')
+        return self._file
+
+    @staticmethod
+    def _encode(entry):
+        payload = json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+        return f"{zlib.crc32(payload.encode('utf-8')):08x}\t{payload}\n"
+
+    def _request_sync(self):
+        """Планує fsync у фоновому потоці"""
+        if self._sync_thread is None or not self._sync_thread.is_alive():
+            self._sync_thread = threading.Thread(target=self._sync_loop, name="journal-sync", daemon=True)
+            self._sync_thread.start()
+        self._sync_requested.set()
+
+    def _sync_loop(self):
+        while True:
+            self._sync_requested.wait()
+            time.sleep(self.sync_delay)
+            self._sync_requested.clear()
+            try:
+                self.sync()
+            except OSError as e:
+                logger.error(f"Journal {self.filepath}: fsync failed: {e}")
+
+    def sync(self):
+        """Скидає записане на диск (дескриптор дублюється - append не чекає на fsync)"""
+        with self._lock:
+            if self._file is None:
+                return
+            fd = os.dup(self._file.fileno())
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def append_many(self, changes):
+        """Дописує зміни [(op, slide_id, record), ...] одним записом; fsync - у фоні"""
+        with self._lock:
+            lines = []
+            for op, slide_id, record in changes:
+                self._seq += 1
+                lines.append(self._encode({
+                    'seq': self._seq,
+                    'op': op,
+                    'slide_id': slide_id,
+                    'record': record,
+                    'at': datetime.now().isoformat()
+                }))
+            if not lines:
+                return self.entry_count
+
+            f = self._open()
+            f.write(''.join(lines))
+            f.flush()
+            self.entry_count += len(lines)
+            if self.fsync:
+                self._request_sync()
+            return self.entry_count
+
+    def append(self, op, slide_id, record=None):
+        """Дописує одну зміну; повертає кількість записів у журналі"""
+        return self.append_many([(op, slide_id, record)])
+
+    def read_entries(self):
+        """Читає всі цілі записи до першого пошкодженого рядка"""
+        entries = []
+        if not os.path.exists(self.filepath):
+            return entries
+
+        with open(self.filepath, 'r', encoding='utf-8', errors='replace') as f:
+            for line_number, line in enumerate(f, 1):
+                checksum, _, payload = line.rstrip('\n').partition('\t')
+                try:
+                    if not line.endswith('\n') or int(checksum, 16) != zlib.crc32(payload.encode('utf-8')):
+                        raise ValueError("checksum mismatch")
+                    entries.append(json.loads(payload))
+                except ValueError:
+                    self.damaged = True
+                    logger.warning(f"Journal {self.filepath}: discarding damaged tail from line {line_number}")
+                    break
+        return entries
+
+    @property
+    def last_seq(self):
+        """Номер останнього записаного запису"""
+        return self._seq
+
+    def truncate(self, upto_seq=None):
+        """Очищає журнал після компактизації у основне сховище
+        
+        З upto_seq видаляються лише записи до нього включно - пізніші зміни
+        (дописані під час компактизації) лишаються в журналі.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            kept = [] if upto_seq is None else [entry for entry in self.read_entries() if entry['seq'] > upto_seq]
+            with atomic_open(self.filepath) as f:
+                f.write(''.join(self._encode(entry) for entry in kept))
+            self.entry_count = len(kept)
+
+    def close(self):
+        """Закриває файл; незсинхронізовані записи скидаються на диск"""
+        if self.fsync:
+            self.sync()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -4,9 +4,373 @@ Logger System для Dynamic Messe Stand V4
 Централізована система логування
 """
 
+import copy
 import logging
 import os
+import re
+import queue
+import atexit
+import threading
 from datetime import datetime
+from core.config import config
+
+# Форматує traceback у потоці, що логує (exc_info не передається в чергу)
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+class _DeferredFlushMixin:
+    """Handler без flush на кожен запис - flush виконує слухач раз на пакет"""
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+class BatchedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    pass
+
+class BatchedFileHandler(_DeferredFlushMixin, logging.FileHandler):
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        super().emit(record)
+
+class LogArchiver:
+    """Фоновий потік: стискає ротовані логи (gzip) і застосовує ліміти зберігання
+    
+    Обробляються лише файли власного префікса (prefix_ДАТА[_ЧАС[_N]].log[.gz]) -
+    чужі логи в каталозі не чіпаються.
+    """
+    
+    # Кілька handler-ів (текстовий лог, perf-події) обслуговують один каталог
+    _sweep_lock = threading.Lock()
+    
+    def __init__(self, log_dir, prefix, is_active, max_age_days=14, max_total_bytes=200 * 1024 * 1024, compress=True):
+        self.log_dir = log_dir
+        self.pattern = re.compile(rf"{re.escape(prefix)}_\d{{8}}(?:_\d{{6}}(?:_\d+)?)?\.log(?:\.gz)?")
+        self.is_active = is_active  # callable(entry) -> True для файлу, у який ще може писати процес
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_bytes
+        self.compress = compress
+        self._wakeup = threading.Event()
+        self._thread = None
+    
+    def request_sweep(self):
+        """Планує стиснення та очищення (не блокує потік логування)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="log-archiver", daemon=True)
+            self._thread.start()
+        self._wakeup.set()
+    
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                with self._sweep_lock:
+                    self.sweep()
+            except Exception as e:
+                # Логер не може логувати власні помилки через себе - лише stderr
+                import sys
+                print(f"Log archiver error: {e}", file=sys.stderr)
+    
+    def _compress_file(self, filepath):
+        """filepath -> filepath.gz (атомарно), оригінал видаляється"""
+        import gzip
+        import shutil
+        target = f"{filepath}.gz"
+        tmp_path = f"{target}.tmp"
+        with open(filepath, 'rb') as source, gzip.open(tmp_path, 'wb') as compressed:
+            shutil.copyfileobj(source, compressed, 1024 * 1024)
+        os.replace(tmp_path, target)
+        stat = os.stat(filepath)
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.remove(filepath)
+    
+    def _scan(self):
+        """Власні файли каталогу (DirEntry), включно з залишками .gz.tmp"""
+        entries = []
+        for entry in os.scandir(self.log_dir):
+            name = entry.name[:-len('.tmp')] if entry.name.endswith('.tmp') else entry.name
+            if entry.is_file() and self.pattern.fullmatch(name):
+                entries.append(entry)
+        return entries
+    
+    def sweep(self):
+        """Стискає неактивні .log файли і видаляє найстаріші архіви понад ліміти"""
+        entries = self._scan()
+        
+        # Залишки стиснення, перерваного завершенням процесу
+        stale = datetime.now().timestamp() - 60
+        # Той самий каталог прибирають кілька handler-ів і процесів: зниклий файл - не помилка
+        for entry in entries:
+            try:
+                if entry.name.endswith('.gz.tmp') and entry.stat().st_mtime < stale:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+        
+        if self.compress:
+            for entry in entries:
+                try:
+                    if entry.name.endswith('.log') and not self.is_active(entry):
+                        self._compress_file(entry.path)
+                except FileNotFoundError:
+                    # Файл уже стиснув/видалив інший процес
+                    pass
+            entries = self._scan()
+        
+        archives = []
+        for entry in entries:
+            if not entry.name.endswith(('.log', '.log.gz')):
+                continue
+            try:
+                if self.is_active(entry):
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            archives.append((stat.st_mtime, stat.st_size, entry.path))
+        archives.sort()
+        
+        cutoff = datetime.now().timestamp() - self.max_age_days * 86400
+        total = sum(size for _, size, _ in archives)
+        for mtime, size, path in archives:
+            if mtime >= cutoff and total <= self.max_total_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+class RotatingLogFileHandler(BatchedFileHandler):
+    """Денний лог-файл з ротацією за датою та розміром
+    
+    Ротований файл отримує час у назві (prefix_ДАТА_ЧАС.log); стиснення та
+    ліміти зберігання виконує LogArchiver у власному потоці - лише після ротації,
+    не під час імпорту/старту.
+    """
+    
+    def __init__(self, log_dir, prefix="dynamic_messe_stand", max_bytes=10 * 1024 * 1024,
+                 max_age_days=14, max_total_bytes=200 * 1024 * 1024, compress=True, active_grace=300):
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.active_grace = active_grace
+        self._daily_name = re.compile(rf"{re.escape(prefix)}_\d{{8}}\.log")
+        self._day = datetime.now().strftime('%Y%m%d')
+        super().__init__(self._path_for(self._day), encoding='utf-8', delay=True)
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        
+        self.archiver = LogArchiver(log_dir, prefix, self._is_active, max_age_days, max_total_bytes, compress)
+    
+    def _is_active(self, entry):
+        """Файл, у який ще може писати цей або інший процес
+        
+        Ротовані файли (з часом у назві) більше ніхто не пише. Денний файл активний,
+        якщо він поточний, має сьогоднішню дату (спільний для всіх процесів) або
+        змінювався протягом active_grace секунд.
+        """
+        if not self._daily_name.fullmatch(entry.name):
+            return False
+        path = os.path.abspath(entry.path)
+        if path in (self.baseFilename, self._path_for(datetime.now().strftime('%Y%m%d'))):
+            return True
+        return entry.stat().st_mtime > datetime.now().timestamp() - self.active_grace
+    
+    def _path_for(self, day):
+        return os.path.abspath(os.path.join(self.log_dir, f"{self.prefix}_{day}.log"))
+    
+    def emit(self, record):
+        try:
+            day = datetime.fromtimestamp(record.created).strftime('%Y%m%d')
+            if day != self._day or (self.max_bytes and self._size >= self.max_bytes):
+                self.rollover(day)
+            
+            message = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(message)
+            # Ліміт у байтах файлу, а не в символах (умлаути, кирилиця)
+            self._size += len(message.encode(self.encoding or 'utf-8'))
+        except Exception:
+            self.handleError(record)
+    
+    def rollover(self, day=None):
+        """Закриває поточний файл і починає новий"""
+        day = day or datetime.now().strftime('%Y%m%d')
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        
+        if day == self._day and os.path.exists(self.baseFilename):
+            # Переповнення за розміром - поточний файл іде в архів під іменем з часом
+            stamp = datetime.now().strftime('%H%M%S')
+            rotated = os.path.join(self.log_dir, f"{self.prefix}_{day}_{stamp}.log")
+            suffix = 1
+            while os.path.exists(rotated) or os.path.exists(f"{rotated}.gz"):
+                rotated = os.path.join(self.log_dir, f"{self.prefix}_{day}_{stamp}_{suffix}.log")
+                suffix += 1
+            os.replace(self.baseFilename, rotated)
+        
+        self._day = day
+        self.baseFilename = self._path_for(day)
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        self.archiver.request_sweep()
+
+class AsyncQueueHandler(logging.Handler):
+    """Кладе записи в обмежену чергу; вивід робить фоновий потік-слухач
+    
+    Виклик логера в потоці Tk не блокується на I/O: при переповненні черги запис
+    рівня нижче WARNING відкидається і враховується в лічильнику dropped;
+    WARNING і вище чекають на місце в черзі й ніколи не губляться.
+    """
+    
+    def __init__(self, handlers, maxsize=10000, batch_size=256, flush_interval=0.5):
+        super().__init__(logging.DEBUG)
+        self.handlers = list(handlers)
+        self.queue = queue.Queue(maxsize)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0           # відкинуті через переповнення
+        self._reported_dropped = 0
+        self._thread = None
+        self._stop = object()
+        self.start()
+    
+    def start(self):
+        """Запускає потік-слухач"""
+        self._thread = threading.Thread(target=self._listen, name="log-listener", daemon=True)
+        self._thread.start()
+    
+    def _after_fork(self):
+        """У дочірньому процесі (fork) потік-слухач не існує - створюємо новий"""
+        self.queue = queue.Queue(self.queue.maxsize)
+        self.dropped = self._reported_dropped = 0
+        self.start()
+    
+    def prepare(self, record):
+        """Як QueueHandler.prepare: повідомлення й traceback фіксуються до постановки в чергу
+        
+        Аргументи та exc_info можуть змінитися (або звільнитися) до того, як
+        слухач дійде до запису, тому в чергу йде копія з готовим текстом.
+        """
+        record = copy.copy(record)
+        if record.args or isinstance(record.msg, str):
+            record.msg = record.getMessage()
+        # інакше - структуроване повідомлення (dict perf-події), яке форматує власний Formatter
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def emit(self, record):
+        try:
+            record = self.prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+        
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if record.levelno < logging.WARNING:
+                self.dropped += 1
+                return
+        
+        # Попередження й помилки не відкидаються: чекаємо, поки слухач звільнить місце
+        while True:
+            try:
+                self.queue.put(record, timeout=self.flush_interval)
+                return
+            except queue.Full:
+                if self._thread is None or not self._thread.is_alive():
+                    # Слухача немає (зупинено) - пишемо напряму
+                    self._dispatch(record)
+                    return
+    
+    def _dispatch(self, record):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+    
+    def _listen(self):
+        """Вибирає записи пакетами і робить один flush на пакет"""
+        stopping = False
+        while not stopping:
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                batch = []
+            
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            waiters = []
+            for record in batch:
+                if record is self._stop:
+                    stopping = True
+                    continue
+                if isinstance(record, threading.Event):
+                    # Маркер flush(): підтверджується після запису пакета
+                    waiters.append(record)
+                    continue
+                self._dispatch(record)
+            
+            if self.dropped != self._reported_dropped:
+                lost = self.dropped - self._reported_dropped
+                self._reported_dropped = self.dropped
+                self._dispatch(logging.LogRecord(
+                    "DynamicMesseStand", logging.WARNING, __file__, 0,
+                    "Log queue overflow: %d records dropped", (lost,), None
+                ))
+            
+            if batch or stopping:
+                for handler in self.handlers:
+                    try:
+                        handler.flush()
+                    except Exception:
+                        # Напр. закритий stderr при завершенні - слухач має жити далі
+                        pass
+            for waiter in waiters:
+                waiter.set()
+    
+    def flush(self, timeout=2.0):
+        """Чекає, доки все, що було в черзі до виклику, буде записано і скинуто на диск
+        
+        Повертає False, якщо слухач не підтвердив запис за timeout секунд.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return False
+        written = threading.Event()
+        try:
+            self.queue.put(written, timeout=timeout)
+        except queue.Full:
+            return False
+        return written.wait(timeout)
+    
+    def stop(self, timeout=2.0):
+        """Доставляє залишок черги і зупиняє слухача"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self.queue.put(self._stop, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+    
+    def close(self):
+        self.stop()
+        for handler in self.handlers:
+            handler.close()
+        super().close()
 
 class BertrandtLogger:
     """Кастомний логер для Bertrandt Dynamic Messe Stand"""
@@ -25,15 +389,22 @@ class BertrandtLogger:
         """Налаштовує handlers для логування"""
         
         # Console handler
-        console_handler = logging.StreamHandler()
+        console_handler = BatchedStreamHandler()
         console_handler.setLevel(logging.INFO)
         
         # File handler
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
+        self.log_dir = log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
         os.makedirs(log_dir, exist_ok=True)
         
-        log_file = os.path.join(log_dir, f"dynamic_messe_stand_{datetime.now().strftime('%Y%m%d')}.log")
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        settings = config.logging
+        file_handler = RotatingLogFileHandler(
+            log_dir,
+            max_bytes=settings['max_bytes'],
+            max_age_days=settings['max_age_days'],
+            max_total_bytes=settings['max_total_bytes'],
+            compress=settings['compress'],
+            active_grace=settings['active_grace_seconds']
+        )
         file_handler.setLevel(logging.DEBUG)
         
         # Formatter
@@ -45,29 +416,57 @@ class BertrandtLogger:
         console_handler.setFormatter(formatter)
         file_handler.setFormatter(formatter)
         
-        # Додати handlers
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        # Консоль і файл обслуговує фоновий потік - UI-потік лише кладе запис у чергу
+        self.queue_handler = AsyncQueueHandler(
+            [console_handler, file_handler],
+            maxsize=settings['queue_size'],
+            batch_size=settings['batch_size'],
+            flush_interval=settings['flush_interval']
+        )
+        self.logger.addHandler(self.queue_handler)
+        
+        atexit.register(self.queue_handler.stop)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self.queue_handler._after_fork)
+    
+    @property
+    def dropped(self):
+        """Кількість записів, відкинутих через переповнення черги"""
+        return self.queue_handler.dropped
+    
+    def flush(self, timeout=2.0):
+        """Чекає, доки черга буде записана (наприклад, перед аварійним виходом)"""
+        return self.queue_handler.flush(timeout)
+    
+    def is_enabled(self, level=logging.DEBUG):
+        """Дешева перевірка рівня перед дорогою підготовкою повідомлення"""
+        return self.logger.isEnabledFor(level)
     
-    def debug(self, message):
+    # Аргументи форматуються (%-стиль) лише якщо рівень увімкнено - у AsyncQueueHandler.prepare
+    def debug(self, message, *args):
         """Debug level logging"""
-        self.logger.debug(message)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args)
     
-    def info(self, message):
+    def info(self, message, *args):
         """Info level logging"""
-        self.logger.info(message)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args)
     
-    def warning(self, message):
+    def warning(self, message, *args):
         """Warning level logging"""
-        self.logger.warning(message)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args)
     
-    def error(self, message):
+    def error(self, message, *args):
         """Error level logging"""
-        self.logger.error(message)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(message, *args)
     
-    def critical(self, message):
+    def critical(self, message, *args):
         """Critical level logging"""
-        self.logger.critical(message)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(message, *args)
 
 # Глобальний логер
 logger = BertrandtLogger()
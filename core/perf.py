@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Performance Events для Dynamic Messe Stand V4
+Структурований журнал подій (JSON lines) та офлайн-аналіз затримок
+"""
+
+import os
+import json
+import time
+import gzip
+import logging
+import functools
+from contextlib import contextmanager
+from core.config import config
+from core.logger import logger, AsyncQueueHandler, RotatingLogFileHandler
+
+# Префікс файлів подій у logs/ (perf_events_ДАТА.log, по JSON-об'єкту на рядок)
+PERF_LOG_PREFIX = "perf_events"
+
+class JsonLineFormatter(logging.Formatter):
+    """Запис події (dict у record.msg) -> компактний JSON-рядок"""
+    
+    def format(self, record):
+        return json.dumps(record.msg, ensure_ascii=False, separators=(',', ':'), default=str)
+
+class PerfEvents:
+    """Канал подій поряд із BertrandtLogger
+    
+    Запис: event, t (time.monotonic, початок події), ts (час доби початку), dur_ms (для span) та поля.
+    Серіалізація й запис відбуваються у фоновому потоці логування.
+    """
+    
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._logger = None
+    
+    def _get_logger(self):
+        """Лінива ініціалізація окремого логера з власним файлом"""
+        if self._logger is None:
+            settings = config.logging
+            file_handler = RotatingLogFileHandler(
+                logger.log_dir,
+                prefix=PERF_LOG_PREFIX,
+                max_bytes=settings['max_bytes'],
+                max_age_days=settings['max_age_days'],
+                max_total_bytes=settings['max_total_bytes'],
+                compress=settings['compress'],
+                active_grace=settings['active_grace_seconds']
+            )
+            file_handler.setFormatter(JsonLineFormatter())
+            
+            perf_logger = logging.getLogger("DynamicMesseStand.perf")
+            perf_logger.handlers.clear()
+            perf_logger.setLevel(logging.INFO)
+            perf_logger.propagate = False  # події не потрапляють у текстовий лог
+            perf_logger.addHandler(AsyncQueueHandler(
+                [file_handler],
+                maxsize=settings['queue_size'],
+                batch_size=settings['batch_size'],
+                flush_interval=settings['flush_interval']
+            ))
+            self._logger = perf_logger
+        return self._logger
+    
+    def event(self, name, duration=None, **fields):
+        """Записує подію; duration - у секундах
+        
+        t/ts - момент початку: для span віднімається тривалість від часу запису.
+        """
+        if not self.enabled:
+            return
+        offset = duration or 0.0
+        record = {'event': name, 't': round(time.monotonic() - offset, 6), 'ts': time.time() - offset}
+        if duration is not None:
+            record['dur_ms'] = round(duration * 1000, 3)
+        if fields:
+            record.update(fields)
+        self._get_logger().info(record)
+    
+    @contextmanager
+    def span(self, name, **fields):
+        """Вимірює тривалість блоку; поля можна доповнити через отриманий dict"""
+        if not self.enabled:
+            yield fields
+            return
+        start = time.perf_counter()
+        try:
+            yield fields
+        except Exception as e:
+            fields['error'] = type(e).__name__
+            raise
+        finally:
+            self.event(name, time.perf_counter() - start, **fields)
+    
+    def timed(self, name):
+        """Декоратор: span навколо кожного виклику функції"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+def iter_events(paths):
+    """Читає події з файлів журналу (.log або .log.gz), пошкоджені рядки пропускаються"""
+    for path in paths:
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and 'event' in record:
+                    yield record
+
+def _percentile(sorted_values, fraction):
+    """Перцентиль (найближчий ранг) для відсортованого списку"""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+# Межі кошиків гістограми в мілісекундах (логарифмічна шкала)
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+def latency_histograms(events, buckets=HISTOGRAM_BUCKETS_MS):
+    """Статистика затримок за типом події
+    
+    Повертає {event: {'count', 'p50', 'p90', 'p99', 'max', 'mean', 'buckets': [(межа, кількість)]}};
+    остання межа None означає "понад найбільшу межу".
+    """
+    durations = {}
+    for record in events:
+        if 'dur_ms' in record:
+            durations.setdefault(record['event'], []).append(float(record['dur_ms']))
+    
+    stats = {}
+    for name, values in durations.items():
+        values.sort()
+        counts = [0] * (len(buckets) + 1)
+        for value in values:
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+        
+        stats[name] = {
+            'count': len(values),
+            'p50': _percentile(values, 0.50),
+            'p90': _percentile(values, 0.90),
+            'p99': _percentile(values, 0.99),
+            'max': values[-1],
+            'mean': sum(values) / len(values),
+            'buckets': list(zip(list(buckets) + [None], counts))
+        }
+    return stats
+
+def find_event_logs(log_dir=None, day=None):
+    """Файли подій у logs/ (опційно лише за день YYYYMMDD), включно з ротованими"""
+    log_dir = log_dir or logger.log_dir
+    prefix = f"{PERF_LOG_PREFIX}_{day}" if day else f"{PERF_LOG_PREFIX}_"
+    if not os.path.isdir(log_dir):
+        return []
+    return sorted(
+        entry.path for entry in os.scandir(log_dir)
+        if entry.is_file() and entry.name.startswith(prefix) and entry.name.endswith(('.log', '.log.gz'))
+    )
+
+# Глобальний канал подій
+perf_events = PerfEvents(config.logging['perf_events'])
@@ -5,10 +5,33 @@ Storage Manager для Dynamic Messe Stand V4
 """
 
 import os
+import re
 import json
 import yaml
+import shutil
+import hashlib
 from datetime import datetime
 from core.logger import logger
+from core.config import config
+from core.storage_backends import FileBackend, SQLiteBackend
+from core.journal import atomic_open
+from core.archives import (ArchiveWriter, read_archive, data_to_records, records_to_data,
+                           chunk_records, iter_file_chunks, archive_filename)
+
+# C-прискорені YAML loader/dumper, якщо PyYAML зібрано з libyaml
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
+
+# Дозволені частини шляху в архіві: літери, цифри, '_', '-', '.', пробіл (не на початку)
+ARCHIVE_PATH_PART = re.compile(r'\w[\w .-]*')
+
+def yaml_load(stream):
+    """Безпечне завантаження YAML найшвидшим доступним loader"""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+def yaml_dump(data, stream=None, **kwargs):
+    """Збереження YAML найшвидшим доступним dumper"""
+    return yaml.dump(data, stream, Dumper=YAML_DUMPER, **kwargs)
 
 class StorageManager:
     """Менеджер для роботи з файловою системою"""
@@ -18,6 +41,69 @@ class StorageManager:
         self.data_dir = os.path.join(self.base_dir, "data")
         self.exports_dir = os.path.join(self.base_dir, "exports")
         self.ensure_directories()
+        self.backend = self.create_backend(config.storage['backend'])
+    
+    def create_backend(self, name):
+        """Створює бекенд зберігання за назвою ('file' або 'sqlite')"""
+        if name == 'sqlite':
+            return SQLiteBackend(os.path.join(self.data_dir, config.storage['sqlite_filename']))
+        if name != 'file':
+            logger.warning(f"Unknown storage backend '{name}', using file backend")
+        return FileBackend(self.data_dir)
+    
+    def set_backend(self, backend):
+        """Замінює активний бекенд (старий закривається)"""
+        if isinstance(backend, str):
+            backend = self.create_backend(backend)
+        previous = self.backend
+        self.backend = backend
+        if previous is not None and previous is not backend:
+            previous.close()
+        logger.info(f"Storage backend: {backend.name}")
+        return backend
+    
+    def save_document(self, key, data):
+        """Зберігає документ (налаштування, індекси) в активному бекенді"""
+        try:
+            self.backend.save_document(key, data)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving document {key}: {e}")
+            return False
+    
+    def load_document(self, key):
+        """Завантажує документ з активного бекенду"""
+        try:
+            return self.backend.load_document(key)
+        except Exception as e:
+            logger.error(f"Error loading document {key}: {e}")
+            return None
+    
+    def write_slides(self, upserts=(), deletes=()):
+        """Записує пакет змін слайдів однією транзакцією"""
+        try:
+            self.backend.write_slides(upserts, deletes)
+            logger.debug(f"Slides written: {len(upserts)} updated, {len(deletes)} deleted")
+            return True
+        except Exception as e:
+            logger.error(f"Error writing slides: {e}")
+            return False
+    
+    def load_slides(self):
+        """Завантажує всі записи слайдів з активного бекенду"""
+        try:
+            return self.backend.load_slides()
+        except Exception as e:
+            logger.error(f"Error loading slides: {e}")
+            return None
+    
+    def query_slides(self, title_contains=None, modified_since=None, limit=None):
+        """Пошук слайдів у сховищі за назвою та/або часом зміни"""
+        try:
+            return self.backend.query_slides(title_contains, modified_since, limit)
+        except Exception as e:
+            logger.error(f"Error querying slides: {e}")
+            return []
     
     def ensure_directories(self):
         """Створює необхідні директорії"""
@@ -37,7 +123,7 @@ class StorageManager:
             
             filepath = os.path.join(directory, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with atomic_open(filepath) as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
             logger.debug(f"Data saved to JSON: {filepath}")
@@ -81,8 +167,8 @@ class StorageManager:
             
             filepath = os.path.join(directory, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
+            with atomic_open(filepath) as f:
+                yaml_dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
             
             logger.debug(f"Data saved to YAML: {filepath}")
             return filepath
@@ -105,7 +191,7 @@ class StorageManager:
                 return None
             
             with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml_load(f)
             
             logger.debug(f"Data loaded from YAML: {filepath}")
             return data
@@ -114,12 +200,18 @@ class StorageManager:
             logger.error(f"Error loading YAML: {e}")
             return None
     
-    def export_json(self, data, filename):
-        """Експортує дані у JSON файл в exports директорії"""
+    def export_json(self, data, filename, compression=None, split_size=None):
+        """Експортує дані у JSON файл в exports директорії
+        
+        З compression ('gzip', 'xz', 'zip') - потоковий архів JSON lines, слайд за слайдом.
+        """
+        if compression:
+            return self.export_archive(data_to_records(data), filename, 'json', compression, split_size)
+        
         try:
             filepath = os.path.join(self.exports_dir, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with atomic_open(filepath) as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Data exported to JSON: {filepath}")
@@ -129,13 +221,19 @@ class StorageManager:
             logger.error(f"Error exporting JSON: {e}")
             return None
     
-    def export_yaml(self, data, filename):
-        """Експортує дані у YAML файл в exports директорії"""
+    def export_yaml(self, data, filename, compression=None, split_size=None):
+        """Експортує дані у YAML файл в exports директорії
+        
+        З compression - потоковий архів YAML-документів, слайд за слайдом.
+        """
+        if compression:
+            return self.export_archive(data_to_records(data), filename, 'yaml', compression, split_size)
+        
         try:
             filepath = os.path.join(self.exports_dir, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
+            with atomic_open(filepath) as f:
+                yaml_dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
             
             logger.info(f"Data exported to YAML: {filepath}")
             return filepath
@@ -144,6 +242,38 @@ class StorageManager:
             logger.error(f"Error exporting YAML: {e}")
             return None
     
+    def export_archive(self, records, filename, codec='json', compression='gzip', split_size=None, header=None):
+        """Потоково записує записи (ітератор dict) у стиснений архів в exports
+        
+        Повертає шлях першої частини; наступні частини пов'язані з нею.
+        """
+        filepath = os.path.join(self.exports_dir, filename)
+        writer = ArchiveWriter(filepath, codec, compression, split_size, header)
+        try:
+            with writer:
+                writer.write_many(records)
+            
+            logger.info(f"Data exported to archive: {filepath} ({writer.record_count} records, {len(writer.paths)} parts)")
+            return filepath
+            
+        except Exception as e:
+            logger.error(f"Error exporting archive: {e}")
+            return None
+    
+    def iter_archive(self, filepath):
+        """Потоково читає записи архіву (усі частини)"""
+        if not os.path.isabs(filepath) and not os.path.exists(filepath):
+            filepath = os.path.join(self.exports_dir, filepath)
+        return read_archive(filepath)
+    
+    def import_archive(self, filepath):
+        """Збирає документ, експортований export_json/export_yaml з compression"""
+        try:
+            return records_to_data(self.iter_archive(filepath))
+        except Exception as e:
+            logger.error(f"Error importing archive: {e}")
+            return None
+    
     def file_exists(self, filename, subdirectory=None):
         """Перевіряє чи існує файл"""
         if subdirectory:
@@ -224,24 +354,272 @@ class StorageManager:
             logger.error(f"Error getting file info: {e}")
             return None
     
-    def backup_data(self):
-        """Створює резервну копію всіх даних"""
+    # Службові файли, які не потрапляють у знімок
+    BACKUP_SKIP_TOP = ('assets', 'cache')
+    BACKUP_SKIP_SUFFIXES = ('.tmp', '-wal', '-shm')
+    BACKUP_MANIFEST = "manifest.json"
+    
+    @staticmethod
+    def _hash_file(filepath):
+        """SHA-256 файлу (читання блоками)"""
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def list_backups(self):
+        """Інкрементальні знімки (з маніфестом), від найстарішого до найновішого"""
+        if not os.path.isdir(self.exports_dir):
+            return []
+        backups = []
+        for entry in os.scandir(self.exports_dir):
+            if not entry.is_dir() or not entry.name.startswith("backup_") or entry.name.endswith(".tmp"):
+                continue
+            manifest_path = os.path.join(entry.path, self.BACKUP_MANIFEST)
+            if os.path.exists(manifest_path):
+                # Порядок за часом запису маніфесту, а не за назвою каталогу
+                backups.append((os.stat(manifest_path).st_mtime_ns, entry.path))
+        return [path for _, path in sorted(backups)]
+    
+    def _iter_data_files(self):
+        """Відносні шляхи файлів data/, що входять у знімок"""
+        for directory, dirnames, filenames in os.walk(self.data_dir):
+            if directory == self.data_dir:
+                dirnames[:] = [name for name in dirnames if name not in self.BACKUP_SKIP_TOP]
+            for filename in filenames:
+                if filename.endswith(self.BACKUP_SKIP_SUFFIXES):
+                    continue
+                yield os.path.relpath(os.path.join(directory, filename), self.data_dir)
+    
+    def backup_data(self, keep=None):
+        """Створює інкрементальний знімок даних
+        
+        Незмінені файли - жорсткі посилання на попередній знімок, змінені копіюються.
+        manifest.json містить розмір, mtime і SHA-256 кожного файлу.
+        """
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_dir = os.path.join(self.exports_dir, f"backup_{timestamp}")
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            # Копіювати всі файли з data директорії
-            import shutil
-            if os.path.exists(self.data_dir):
-                shutil.copytree(self.data_dir, os.path.join(backup_dir, "data"))
-            
-            logger.info(f"Backup created: {backup_dir}")
+            suffix = 1
+            while os.path.exists(backup_dir):
+                backup_dir = os.path.join(self.exports_dir, f"backup_{timestamp}_{suffix}")
+                suffix += 1
+            
+            previous = self.list_backups()
+            previous_dir = previous[-1] if previous else None
+            previous_files = {}
+            if previous_dir:
+                with open(os.path.join(previous_dir, self.BACKUP_MANIFEST), 'r', encoding='utf-8') as f:
+                    previous_files = json.load(f).get('files', {})
+            
+            tmp_dir = f"{backup_dir}.tmp"
+            target_root = os.path.join(tmp_dir, "data")
+            os.makedirs(target_root, exist_ok=True)
+            
+            files = {}
+            linked = copied = copied_bytes = 0
+            sqlite_path = getattr(self.backend, 'db_path', None)
+            
+            for relpath in self._iter_data_files():
+                source = os.path.join(self.data_dir, relpath)
+                target = os.path.join(target_root, relpath)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                
+                if sqlite_path and os.path.abspath(source) == os.path.abspath(sqlite_path):
+                    # Живу WAL-базу копіюємо через backup API - узгоджений стан без -wal файлів
+                    self.backend.backup_to(target)
+                    stat = os.stat(target)
+                    source = target
+                else:
+                    stat = os.stat(source)
+                
+                old = previous_files.get(relpath)
+                if source != target and old and old['size'] == stat.st_size and old['mtime_ns'] == stat.st_mtime_ns:
+                    # Швидкий шлях: розмір і mtime не змінились - файл навіть не читаємо
+                    digest = old['sha256']
+                else:
+                    digest = self._hash_file(source)
+                
+                unchanged = old is not None and old['sha256'] == digest
+                if unchanged:
+                    if source == target:
+                        os.remove(target)
+                    try:
+                        os.link(os.path.join(previous_dir, "data", relpath), target)
+                        linked += 1
+                    except OSError:
+                        # Файлова система без hardlink-ів - звичайна копія
+                        shutil.copy2(os.path.join(previous_dir, "data", relpath), target)
+                        copied += 1
+                        copied_bytes += stat.st_size
+                else:
+                    if source != target:
+                        shutil.copy2(source, target)
+                    copied += 1
+                    copied_bytes += stat.st_size
+                
+                files[relpath] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+            
+            with open(os.path.join(tmp_dir, self.BACKUP_MANIFEST), 'w', encoding='utf-8') as f:
+                json.dump({
+                    'created_at': datetime.now().isoformat(),
+                    'parent': os.path.basename(previous_dir) if previous_dir else None,
+                    'files': files
+                }, f, indent=2)
+            
+            # Знімок з'являється лише повністю записаним
+            os.replace(tmp_dir, backup_dir)
+            
+            # Ассети в спільне сховище бекапів - копіюються лише відсутні blob-и
+            from core.assets import asset_store
+            asset_store.copy_missing_to(os.path.join(self.exports_dir, "assets"))
+            
+            self.prune_backups(keep)
+            
+            logger.info(f"Backup created: {backup_dir} ({linked} linked, {copied} copied, {copied_bytes} bytes)")
             return backup_dir
             
         except Exception as e:
             logger.error(f"Error creating backup: {e}")
             return None
+    
+    def prune_backups(self, keep=None):
+        """Видаляє найстаріші знімки, залишаючи keep останніх"""
+        keep = config.storage['backup_keep'] if keep is None else keep
+        backups = self.list_backups()
+        removed = 0
+        
+        for backup_dir in backups[:max(0, len(backups) - keep)]:
+            try:
+                # Спільні з новішими знімками файли залишаються завдяки hardlink-ам
+                shutil.rmtree(backup_dir)
+                removed += 1
+            except Exception as e:
+                logger.error(f"Error removing backup {backup_dir}: {e}")
+        
+        if removed:
+            logger.debug(f"Pruned {removed} old backups")
+        return removed
+
+    def archive_data(self, compression='gzip', split_size=None):
+        """Стиснена потокова копія даних та ассетів в одному архіві
+        
+        Файли та ассети записуються шматками - пам'ять не залежить від розміру даних.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = archive_filename(f"backup_{timestamp}", 'json', compression)
+        snapshot_db = None
+        
+        def records():
+            nonlocal snapshot_db
+            sqlite_path = getattr(self.backend, 'db_path', None)
+            for relpath in self._iter_data_files():
+                source = os.path.join(self.data_dir, relpath)
+                if sqlite_path and os.path.abspath(source) == os.path.abspath(sqlite_path):
+                    snapshot_db = os.path.join(self.exports_dir, f"{filename}.db.tmp")
+                    self.backend.backup_to(snapshot_db)
+                    source = snapshot_db
+                yield {'type': 'file', 'key': relpath.replace(os.sep, '/'), 'size': os.path.getsize(source)}
+                yield from chunk_records('file_chunk', relpath.replace(os.sep, '/'), iter_file_chunks(source))
+            
+            from core.assets import asset_store
+            for ref in asset_store.iter_refs():
+                yield {'type': 'asset', 'key': ref}
+                yield from chunk_records('asset_chunk', ref, iter_file_chunks(asset_store.get_path(ref)))
+        
+        try:
+            return self.export_archive(records(), filename, 'json', compression, split_size, {'kind': 'backup'})
+        finally:
+            if snapshot_db and os.path.exists(snapshot_db):
+                os.remove(snapshot_db)
+    
+    @staticmethod
+    def _restore_path(root, key):
+        """Безпечний шлях для ключа архіву всередині root або None
+        
+        Дозволені лише відносні шляхи з '/', кожна частина - з ARCHIVE_PATH_PART
+        (тобто без '.', '..', '\\', ':' і порожніх частин); результат має лишатися всередині root.
+        """
+        if not isinstance(key, str) or not key:
+            return None
+        parts = key.split('/')
+        if not all(ARCHIVE_PATH_PART.fullmatch(part) for part in parts):
+            return None
+        root = os.path.realpath(root)
+        target = os.path.realpath(os.path.join(root, *parts))
+        if os.path.commonpath([root, target]) != root or target == root:
+            return None
+        return target
+    
+    def restore_archive(self, filepath, target_dir=None):
+        """Відновлює файли та ассети з archive_data (за замовчуванням - у data/)
+        
+        Записи з небезпечними ключами (вихід за межі цільового каталогу,
+        невалідні посилання на ассети) пропускаються разом з їх шматками;
+        ассети, вміст яких не відповідає SHA-256 посиланню, відкидаються.
+        """
+        import base64
+        target_dir = target_dir or self.data_dir
+        from core.assets import asset_store, is_asset_ref
+        current = None
+        current_key = None
+        restored = 0
+        
+        try:
+            for record in self.iter_archive(filepath):
+                record_type = record.get('type')
+                if record_type in ('file', 'asset'):
+                    if current:
+                        restored += current.commit()
+                        current = None
+                    key = record.get('key')
+                    if record_type == 'file':
+                        target = self._restore_path(target_dir, key)
+                        current = _RestoredFile(target) if target else None
+                    else:
+                        current = asset_store.open_writer(key) if is_asset_ref(key) else None
+                    if current is None:
+                        logger.warning(f"Skipping unsafe archive entry {record_type} {key!r}")
+                        current_key = None
+                        continue
+                    current_key = key
+                elif record_type in ('file_chunk', 'asset_chunk') and current and record.get('key') == current_key:
+                    current.write(base64.b64decode(record['data']))
+            
+            if current:
+                restored += current.commit()
+                current = None
+            
+            logger.info(f"Archive restored: {filepath} ({restored} files)")
+            return restored
+            
+        except Exception as e:
+            if current:
+                current.abort()
+            logger.error(f"Error restoring archive: {e}")
+            return None
+
+class _RestoredFile:
+    """Файл з архіву: запис у target.tmp, commit() атомарно замінює ціль"""
+    
+    def __init__(self, target):
+        self.target = target
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        self._file = open(f"{target}.tmp", 'wb')
+    
+    def write(self, data):
+        self._file.write(data)
+    
+    def commit(self):
+        self._file.close()
+        os.replace(self._file.name, self.target)
+        return True
+    
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self._file.name):
+            os.remove(self._file.name)
 
 # Глобальна інстанція storage manager
 storage_manager = StorageManager()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Storage Backends для Dynamic Messe Stand V4
+Змінні бекенди зберігання: JSON-файли або SQLite (WAL)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from core.logger import logger
+from core.journal import atomic_open
+
+class StorageBackend:
+    """Інтерфейс бекенду: документи (ключ -> JSON) та слайди (один запис на слайд)"""
+
+    name = "base"
+
+    def save_document(self, key, data):
+        raise NotImplementedError
+
+    def load_document(self, key):
+        raise NotImplementedError
+
+    def delete_document(self, key):
+        raise NotImplementedError
+
+    def list_documents(self):
+        raise NotImplementedError
+
+    def write_slides(self, upserts=(), deletes=()):
+        """Атомарно записує змінені слайди (записи to_dict) і видаляє вказані ID"""
+        raise NotImplementedError
+
+    def load_slides(self):
+        """Повертає всі записи слайдів, відсортовані за slide_id"""
+        raise NotImplementedError
+
+    def query_slides(self, title_contains=None, modified_since=None, limit=None):
+        """Пошук слайдів за назвою та/або часом зміни"""
+        records = self.load_slides()
+        if title_contains:
+            needle = title_contains.casefold()
+            records = [r for r in records if needle in r.get('title', '').casefold()]
+        if modified_since:
+            since = modified_since.isoformat() if isinstance(modified_since, datetime) else str(modified_since)
+            records = [r for r in records if r.get('last_modified', '') >= since]
+        return records[:limit] if limit else records
+
+    def close(self):
+        pass
+
+class FileBackend(StorageBackend):
+    """Класичне зберігання: по JSON-файлу на документ, усі слайди в slides.json"""
+
+    name = "file"
+    SLIDES_FILENAME = "slides.json"
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+
+    def _document_path(self, key):
+        return os.path.join(self.data_dir, f"{key}.json")
+
+    def _write_json(self, filepath, data):
+        """Атомарний запис через тимчасовий файл"""
+        with atomic_open(filepath) as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def save_document(self, key, data):
+        with self._lock:
+            self._write_json(self._document_path(key), data)
+
+    def load_document(self, key):
+        filepath = self._document_path(key)
+        if not os.path.exists(filepath):
+            return None
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def delete_document(self, key):
+        try:
+            os.remove(self._document_path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def list_documents(self):
+        if not os.path.isdir(self.data_dir):
+            return []
+        return sorted(
+            name[:-5] for name in os.listdir(self.data_dir)
+            if name.endswith('.json') and name != self.SLIDES_FILENAME
+        )
+
+    def write_slides(self, upserts=(), deletes=()):
+        """Файловий бекенд завжди переписує slides.json повністю"""
+        filepath = os.path.join(self.data_dir, self.SLIDES_FILENAME)
+        with self._lock:
+            slides = {}
+            if os.path.exists(filepath):
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    slides = json.load(f).get('slides', {})
+
+            for slide_id in deletes:
+                slides.pop(str(slide_id), None)
+            for record in upserts:
+                slides[str(record['slide_id'])] = record
+
+            self._write_json(filepath, {
+                'slides': slides,
+                'exported_at': datetime.now().isoformat(),
+                'version': "4.0.0"
+            })
+
+    def load_slides(self):
+        filepath = os.path.join(self.data_dir, self.SLIDES_FILENAME)
+        if not os.path.exists(filepath):
+            return []
+        with open(filepath, 'r', encoding='utf-8') as f:
+            slides = json.load(f).get('slides', {})
+        return sorted(slides.values(), key=lambda record: int(record.get('slide_id', 0)))
+
+class SQLiteBackend(StorageBackend):
+    """SQLite у режимі WAL: рядок на слайд, транзакційні пакетні записи, індекси
+
+    Кожен потік має власне з'єднання; WAL дозволяє паралельне читання з інших
+    процесів (наприклад, headless CLI) під час запису GUI.
+    """
+
+    name = "sqlite"
+    SCHEMA_VERSION = 1
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            key TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS slides (
+            slide_id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL DEFAULT '',
+            content TEXT NOT NULL DEFAULT '',
+            config_data TEXT NOT NULL DEFAULT '{}',
+            last_modified TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_slides_last_modified ON slides(last_modified);
+    """
+
+    def __init__(self, db_path, busy_timeout=5.0):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        connection = self._connection()
+        connection.executescript(self.SCHEMA)
+        connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        logger.debug(f"SQLite storage opened: {db_path}")
+
+    def _connection(self):
+        """З'єднання поточного потоку (створюється при першому зверненні)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # isolation_level=None - транзакції керуються явно через transaction()
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT; відкат при помилці"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        else:
+            connection.execute("COMMIT")
+
+    def save_document(self, key, data):
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT INTO documents (key, data, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (key, json.dumps(data, ensure_ascii=False), datetime.now().isoformat())
+            )
+
+    def load_document(self, key):
+        row = self._connection().execute("SELECT data FROM documents WHERE key = ?", (key,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def delete_document(self, key):
+        with self.transaction() as connection:
+            return connection.execute("DELETE FROM documents WHERE key = ?", (key,)).rowcount > 0
+
+    def list_documents(self):
+        return [row['key'] for row in self._connection().execute("SELECT key FROM documents ORDER BY key")]
+
+    def write_slides(self, upserts=(), deletes=()):
+        """Одна транзакція на пакет змін - лише змінені рядки"""
+        rows = [
+            (
+                int(record['slide_id']),
+                record.get('title', ''),
+                record.get('content', ''),
+                json.dumps(record.get('config_data') or {}, ensure_ascii=False),
+                record.get('last_modified') or datetime.now().isoformat()
+            )
+            for record in upserts
+        ]
+        with self.transaction() as connection:
+            if deletes:
+                connection.executemany("DELETE FROM slides WHERE slide_id = ?", [(int(i),) for i in deletes])
+            if rows:
+                connection.executemany(
+                    "INSERT INTO slides (slide_id, title, content, config_data, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(slide_id) DO UPDATE SET title = excluded.title, content = excluded.content, "
+                    "config_data = excluded.config_data, last_modified = excluded.last_modified",
+                    rows
+                )
+
+    @staticmethod
+    def _row_to_record(row):
+        return {
+            'slide_id': row['slide_id'],
+            'title': row['title'],
+            'content': row['content'],
+            'config_data': json.loads(row['config_data']),
+            'last_modified': row['last_modified']
+        }
+
+    def load_slides(self):
+        cursor = self._connection().execute("SELECT * FROM slides ORDER BY slide_id")
+        return [self._row_to_record(row) for row in cursor]
+
+    def query_slides(self, title_contains=None, modified_since=None, limit=None):
+        """Запит через індекси замість читання всіх слайдів"""
+        clauses = []
+        params = []
+        if title_contains:
+            clauses.append("title LIKE ? ESCAPE '\\'")
+            escaped = title_contains.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(f"%{escaped}%")
+        if modified_since:
+            clauses.append("last_modified >= ?")
+            params.append(modified_since.isoformat() if isinstance(modified_since, datetime) else str(modified_since))
+
+        sql = "SELECT * FROM slides"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY slide_id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        return [self._row_to_record(row) for row in self._connection().execute(sql, params)]
+
+    def backup_to(self, target_path):
+        """Узгоджена копія бази (sqlite3 backup API) - безпечно під час запису"""
+        target = sqlite3.connect(target_path)
+        try:
+            self._connection().backup(target)
+        finally:
+            target.close()
+
+    def close(self):
+        """Закриває всі з'єднання (усіх потоків)"""
+        with self._connections_lock:
+            for connection in self._connections:
+                try:
+                    connection.close()
+                except sqlite3.ProgrammingError:
+                    # З'єднання іншого потоку - SQLite дозволяє закривати лише у власному
+                    pass
+            self._connections = []
+        self._local = threading.local()
@@ -44,6 +44,12 @@ def create_and_run_gui(esp32_port=None):
     try:
         # Dynamischer Import der GUI-Klasse aus ui/ директории
         from ui.main_window import MainWindow
+        from models.content import content_manager
+        
+        # Gespeicherte Folien laden und Journal nach einem Stromausfall nachspielen
+        content_manager.recover()
+        # Layouts aus dem Creator (content/page_N/config.json) einmalig kompilieren
+        content_manager.load_page_layouts()
         
         logger.info("🖥️ GUI wird initialisiert...")
         gui_app = MainWindow(esp32_port=esp32_port)
@@ -54,6 +60,11 @@ def create_and_run_gui(esp32_port=None):
         # GUI-Hauptschleife starten
         gui_app.run()
         
+        # Journal beim Beenden in den Hauptspeicher übernehmen
+        content_manager.compact_journal()
+        if content_manager.journal is not None:
+            content_manager.journal.close()  # letzter fsync, falls die Übernahme fehlschlug
+        
     except ImportError as e:
         logger.error(f"GUI-Import-Fehler: {e}")
         logger.info("🔄 Fallback: Textbasierte Anwendung wird gestartet...")
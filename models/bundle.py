@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Presentation Bundle für Dynamic Messe Stand V4
+Einzeldatei-Format (ZIP + Manifest) mit lazy geladenen Slides und Assets
+"""
+
+import os
+import json
+import mmap
+import struct
+import zipfile
+import threading
+from core.logger import logger
+from core.assets import asset_store, is_asset_ref, ASSET_REF_PREFIX
+from models.content import SlideData
+
+# Dateiendung und Kennung des Bundle-Formats
+BUNDLE_EXTENSION = ".dmsz"
+BUNDLE_FORMAT = "dms-bundle"
+BUNDLE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# Lokaler ZIP-Dateikopf (30 Bytes) - für direkten mmap-Zugriff auf unkomprimierte Einträge
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+def _slide_entry(slide_id):
+    """Archiv-Pfad einer Slide"""
+    return f"slides/{slide_id}.json"
+
+def _asset_entry(ref):
+    """Archiv-Pfad eines Assets"""
+    return f"assets/{ref[len(ASSET_REF_PREFIX):]}"
+
+def _slide_asset_refs(config_data):
+    """Sortierte Asset-Referenzen der Canvas-Elemente einer Slide"""
+    return sorted({
+        element['asset']
+        for element in config_data.get('canvas_elements', ())
+        if isinstance(element, dict) and is_asset_ref(element.get('asset'))
+    })
+
+def write_bundle(filepath, slides, metadata=None, settings=None, store=asset_store, task=None):
+    """Schreibt Slides und ihre Assets atomar in eine Bundle-Datei
+
+    Slides werden komprimiert, Assets unkomprimiert gespeichert (Bilder sind bereits
+    komprimiert und lassen sich so direkt per mmap lesen). Jedes Asset nur einmal.
+    Mit task (Hintergrund-Export) wird Fortschritt gemeldet und vor dem Ersetzen
+    ein letztes Mal auf Abbruch geprüft.
+    """
+    manifest_slides = []
+    manifest_assets = {}
+    tmp_path = f"{filepath}.tmp"
+
+    try:
+        with zipfile.ZipFile(tmp_path, 'w') as archive:
+            for index, slide_id in enumerate(sorted(slides)):
+                slide = slides[slide_id]
+                if task is not None and index % 50 == 0:
+                    task.report(index, len(slides), "Bundle wird geschrieben")
+                config_data = slide.config_data
+                refs = _slide_asset_refs(config_data)
+
+                record = {
+                    'slide_id': slide.slide_id,
+                    'title': slide.title,
+                    'content': slide.content,
+                    'config_data': config_data,
+                    'last_modified': slide.last_modified.isoformat()
+                }
+                archive.writestr(
+                    _slide_entry(slide.slide_id),
+                    json.dumps(record, ensure_ascii=False),
+                    compress_type=zipfile.ZIP_DEFLATED
+                )
+                manifest_slides.append({
+                    'slide_id': slide.slide_id,
+                    'title': slide.title,
+                    'entry': _slide_entry(slide.slide_id),
+                    'assets': refs
+                })
+
+                for ref in refs:
+                    if ref in manifest_assets:
+                        continue
+
+                    entry = _asset_entry(ref)
+                    blob_path = store.get_path(ref)
+                    if blob_path is not None:
+                        archive.write(blob_path, entry, compress_type=zipfile.ZIP_STORED)
+                        size = os.path.getsize(blob_path)
+                    else:
+                        # z.B. Asset aus einem anderen, noch geöffneten Bundle
+                        data = store.read_bytes(ref)
+                        if data is None:
+                            logger.warning(f"Asset fehlt, nicht im Bundle: {ref}")
+                            continue
+                        archive.writestr(entry, data, compress_type=zipfile.ZIP_STORED)
+                        size = len(data)
+
+                    manifest_assets[ref] = {'entry': entry, 'size': size}
+
+            manifest = {
+                'format': BUNDLE_FORMAT,
+                'version': BUNDLE_VERSION,
+                'metadata': dict(metadata or {}, total_slides=len(manifest_slides)),
+                'settings': dict(settings or {}),
+                'slides': manifest_slides,
+                'assets': manifest_assets
+            }
+            archive.writestr(
+                MANIFEST_NAME,
+                json.dumps(manifest, ensure_ascii=False, indent=2),
+                compress_type=zipfile.ZIP_DEFLATED
+            )
+
+        if task is not None:
+            task.check_cancelled()
+        os.replace(tmp_path, filepath)
+
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logger.info(f"Bundle geschrieben: {filepath} ({len(manifest_slides)} Slides, {len(manifest_assets)} Assets)")
+    return len(manifest_slides)
+
+class PresentationBundle:
+    """Geöffnetes Bundle - beim Öffnen wird nur das Manifest gelesen"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._lock = threading.Lock()
+        self._file = open(filepath, 'rb')
+        self._mmap = None
+        self._archive = None
+
+        try:
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError) as e:
+                logger.debug(f"mmap nicht verfügbar für {filepath}: {e}")
+
+            self._archive = zipfile.ZipFile(self._file)
+            manifest = json.loads(self._archive.read(MANIFEST_NAME).decode('utf-8'))
+
+            if manifest.get('format') != BUNDLE_FORMAT:
+                raise ValueError(f"Kein Präsentations-Bundle: {filepath}")
+            if manifest.get('version', 0) > BUNDLE_VERSION:
+                raise ValueError(f"Bundle-Version {manifest.get('version')} wird nicht unterstützt")
+
+            self.metadata = manifest.get('metadata', {})
+            self.settings = manifest.get('settings', {})
+            self._slides = {int(entry['slide_id']): entry for entry in manifest.get('slides', [])}
+            self._assets = manifest.get('assets', {})
+
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Schließt Archiv, mmap und Datei"""
+        asset_store.remove_source(self)
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_slide_ids(self):
+        """Sortierte Slide-IDs laut Manifest"""
+        return sorted(self._slides)
+
+    def get_slide_title(self, slide_id):
+        """Titel aus dem Manifest, ohne die Slide zu dekodieren"""
+        return self._slides[slide_id].get('title', '')
+
+    def get_slide_assets(self, slide_id):
+        """Asset-Referenzen einer Slide laut Manifest"""
+        return list(self._slides[slide_id].get('assets', []))
+
+    def get_slide_record(self, slide_id):
+        """Liest und dekodiert eine einzelne Slide aus dem Archiv"""
+        entry = self._slides[slide_id]['entry']
+        with self._lock:
+            raw = self._archive.read(entry)
+        return json.loads(raw.decode('utf-8'))
+
+    def iter_records(self):
+        """Liest alle Slides als ContentManager-Records"""
+        for slide_id in self.get_slide_ids():
+            yield self.get_slide_record(slide_id)
+
+    def has_asset(self, ref):
+        return ref in self._assets
+
+    def read_asset(self, ref):
+        """Liest ein Asset - unkomprimierte Einträge direkt aus dem mmap"""
+        info = self._assets.get(ref)
+        if info is None:
+            return None
+
+        with self._lock:
+            zinfo = self._archive.getinfo(info['entry'])
+
+            if self._mmap is not None and zinfo.compress_type == zipfile.ZIP_STORED:
+                offset = zinfo.header_offset
+                header = _LOCAL_HEADER.unpack_from(self._mmap, offset)
+                if header[0] == _LOCAL_HEADER_SIGNATURE:
+                    name_length, extra_length = header[9], header[10]
+                    start = offset + _LOCAL_HEADER.size + name_length + extra_length
+                    return self._mmap[start:start + zinfo.file_size]
+
+            return self._archive.read(zinfo)
+
+    def lazy_slides(self):
+        """SlideData-Objekte, deren Inhalt erst beim ersten Zugriff gelesen wird"""
+        slides = {}
+        for slide_id, entry in self._slides.items():
+            slides[slide_id] = SlideData.lazy(
+                slide_id,
+                entry.get('title', ''),
+                lambda slide_id=slide_id: self.get_slide_record(slide_id)
+            )
+        return slides
+
+    def register_assets(self):
+        """Macht die Assets des Bundles über den globalen Asset-Store verfügbar"""
+        asset_store.add_source(self)
@@ -6,20 +6,227 @@ Content Manager для Dynamic Messe Stand V4
 
 import os
 import json
-import yaml
+import hashlib
+import threading
+from bisect import bisect_left
+from collections import namedtuple
 from datetime import datetime
 from core.logger import logger
-from core.storage import storage_manager
+from core.config import config
+from core.storage import storage_manager, yaml_dump
+from core.file_cache import parse_cache
+from core.assets import asset_store, is_asset_ref
+from core.journal import SlideJournal, atomic_open
+from core.perf import perf_events
+from models.display_list import compile_canvas_elements, SLIDE_WIDTH, SLIDE_HEIGHT, EDITOR_SCALE
+
+# Компактний типізований запис елемента canvas зі збереженого layout Creator
+CanvasElement = namedtuple('CanvasElement', [
+    'type', 'widget_type', 'coords', 'text', 'font', 'fg', 'bg',
+    'fill', 'outline', 'width', 'height', 'anchor', 'tags', 'image'
+])
+
+def _to_number(value, default=0):
+    """Перетворює значення з config у число (Tk зберігає '2.0' як рядок)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def parse_canvas_element(data):
+    """Створює CanvasElement з словника canvas_elements"""
+    tags = data.get('tags', ())
+    if isinstance(tags, str):
+        tags = tuple(tags.split())
+    return CanvasElement(
+        type=data.get('type', ''),
+        widget_type=data.get('widget_type'),
+        coords=tuple(_to_number(c) for c in data.get('coords', ())),
+        text=data.get('text', ''),
+        font=data.get('font'),
+        fg=data.get('fg'),
+        bg=data.get('bg'),
+        fill=data.get('fill'),
+        outline=data.get('outline'),
+        width=_to_number(data.get('width', 0)),
+        height=_to_number(data.get('height', 0)),
+        anchor=data.get('anchor'),
+        tags=tuple(tags),
+        image=data.get('asset') or data.get('image_path', data.get('image'))
+    )
+
+def intern_canvas_assets(canvas_elements):
+    """Переносить зображення canvas_elements у сховище ассетів (поле 'asset')"""
+    interned = 0
+    for element in canvas_elements or ():
+        if not isinstance(element, dict) or is_asset_ref(element.get('asset')):
+            continue
+        image_path = element.get('image_path') or element.get('image')
+        if isinstance(image_path, str) and os.path.isfile(image_path):
+            element['asset'] = asset_store.put_file(image_path)
+            interned += 1
+    return interned
 
 class SlideData:
     """Клас для представлення даних слайду"""
     
+    __slots__ = (
+        'slide_id', '_title', '_content', '_config_data', 'last_modified',
+        '_content_lines', '_content_hash', '_canvas_elements', '_display_list', '_config_version',
+        '_loader', '_origin'
+    )
+    
     def __init__(self, slide_id, title="", content="", config_data=None):
         self.slide_id = slide_id
-        self.title = title
-        self.content = content
-        self.config_data = config_data or {}
+        self._title = title
+        self._content = content
+        self._config_data = config_data or {}
         self.last_modified = datetime.now()
+        
+        # Похідні поля обчислюються ліниво і кешуються
+        self._content_lines = None
+        self._content_hash = None
+        self._canvas_elements = None
+        self._display_list = None
+        self._config_version = 0
+        
+        # Лінивe завантаження контенту (наприклад, з bundle-архіву)
+        self._loader = None
+        self._origin = None
+    
+    @classmethod
+    def lazy(cls, slide_id, title, loader):
+        """Створює слайд, контент і config_data якого завантажуються при першому доступі
+        
+        loader() повертає словник з 'content', 'config_data' і 'last_modified'.
+        """
+        slide = cls(slide_id, title)
+        slide._loader = loader
+        slide._origin = loader
+        return slide
+    
+    @property
+    def is_loaded(self):
+        """Чи завантажено контент слайду"""
+        return self._loader is None
+    
+    def _ensure_loaded(self):
+        """Завантажує відкладений контент при першому зверненні"""
+        loader = self._loader
+        if loader is None:
+            return
+        self._loader = None
+        
+        record = loader()
+        self._content = str(record.get('content') or '')
+        self._config_data = dict(record.get('config_data') or {})
+        try:
+            self.last_modified = datetime.fromisoformat(str(record['last_modified']))
+        except (KeyError, ValueError):
+            pass
+    
+    def original_record(self):
+        """Повторно читає початковий запис лінивого слайду (None для звичайних)"""
+        if self._origin is None:
+            return None
+        return self._origin()
+    
+    @property
+    def title(self):
+        return self._title
+    
+    @title.setter
+    def title(self, value):
+        if value != self._title:
+            self._title = value
+            self._content_hash = None
+    
+    @property
+    def content(self):
+        if self._loader is not None:
+            self._ensure_loaded()
+        return self._content
+    
+    @content.setter
+    def content(self, value):
+        if self._loader is not None:
+            self._ensure_loaded()
+        if value != self._content:
+            self._content = value
+            self._content_lines = None
+            self._content_hash = None
+    
+    @property
+    def config_data(self):
+        if self._loader is not None:
+            self._ensure_loaded()
+        return self._config_data
+    
+    @config_data.setter
+    def config_data(self, value):
+        if self._loader is not None:
+            self._ensure_loaded()
+        self._config_data = value or {}
+        self._canvas_elements = None
+        self._display_list = None
+        self._config_version += 1
+    
+    @property
+    def config_version(self):
+        """Лічильник змін config_data (для спільного використання знімків)"""
+        return self._config_version
+    
+    @property
+    def content_lines(self):
+        """Непорожні рядки контенту без зайвих пробілів (кешовано)"""
+        if self._content_lines is None:
+            self._content_lines = tuple(
+                line.strip() for line in self.content.split('\n') if line.strip()
+            )
+        return self._content_lines
+    
+    @property
+    def content_hash(self):
+        """Хеш заголовку та контенту для швидкого порівняння версій"""
+        if self._content_hash is None:
+            digest = hashlib.blake2b(digest_size=8)
+            digest.update(self._title.encode('utf-8'))
+            digest.update(b'\0')
+            digest.update(self.content.encode('utf-8'))
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+    
+    @property
+    def canvas_elements(self):
+        """Розпарсені canvas_elements як кортеж CanvasElement (кешовано)"""
+        if self._canvas_elements is None:
+            self._canvas_elements = tuple(
+                parse_canvas_element(element)
+                for element in self.config_data.get('canvas_elements', ())
+                if isinstance(element, dict)
+            )
+        return self._canvas_elements
+    
+    @property
+    def display_list(self):
+        """Скомпільований layout Creator (DisplayList) або None без canvas_elements (кешовано)"""
+        if self._display_list is None:
+            elements = self.canvas_elements
+            if not elements:
+                return None
+            self._display_list = compile_canvas_elements(
+                elements,
+                _to_number(self.config_data.get('slide_width'), SLIDE_WIDTH) or SLIDE_WIDTH,
+                _to_number(self.config_data.get('slide_height'), SLIDE_HEIGHT) or SLIDE_HEIGHT,
+                _to_number(self.config_data.get('editor_scale'), EDITOR_SCALE) or EDITOR_SCALE
+            )
+        return self._display_list
+    
+    def invalidate_canvas_elements(self):
+        """Скидає кеш canvas_elements після зміни config_data на місці"""
+        self._canvas_elements = None
+        self._display_list = None
+        self._config_version += 1
     
     def to_dict(self):
         """Конвертація в словник для збереження"""
@@ -31,6 +238,19 @@ class SlideData:
             'last_modified': self.last_modified.isoformat()
         }
     
+    def to_storage_dict(self):
+        """Запис для сховища; лінивий слайд не завантажується - береться початковий запис"""
+        if self._loader is None:
+            return self.to_dict()
+        record = self._origin()
+        return {
+            'slide_id': self.slide_id,
+            'title': self._title,
+            'content': str(record.get('content') or ''),
+            'config_data': dict(record.get('config_data') or {}),
+            'last_modified': str(record.get('last_modified') or self.last_modified.isoformat())
+        }
+    
     @classmethod
     def from_dict(cls, data):
         """Створення об'єкта з словника"""
@@ -55,6 +275,12 @@ class ContentManager:
     def __init__(self):
         self.slides = {}
         self.content_observers = []  # Для сповіщення про зміни
+        self._lock = threading.RLock()  # Захищає атомарну заміну слайдів
+        self._slide_order = ()  # Відсортовані ID слайдів для посторінкового доступу
+        self._dirty_slides = set()    # змінені з останнього save_to_storage
+        self._deleted_slides = set()  # видалені з останнього save_to_storage
+        self.journal = None           # SlideJournal після enable_journal()
+        self._compaction_lock = threading.Lock()  # одна компактизація за раз
         self.load_default_content()
     
     def load_default_content(self):
@@ -76,7 +302,9 @@ class ContentManager:
             if slide_id not in self.slides:
                 self.slides[slide_id] = slide_data
         
-        logger.debug(f"Loaded {len(default_slides)} default slides")
+        self._reindex()
+        
+        logger.debug("Loaded %d default slides", len(default_slides))
     
     def get_slide(self, slide_id):
         """Отримання слайду за ID"""
@@ -90,22 +318,121 @@ class ContentManager:
         """Отримання кількості слайдів"""
         return len(self.slides)
     
+    def _reindex(self):
+        """Перебудовує впорядкований індекс ID після структурних змін"""
+        self._slide_order = tuple(sorted(self.slides))
+    
+    def get_slide_ids(self):
+        """Впорядковані ID слайдів (незмінний кортеж, без копіювання)"""
+        return self._slide_order
+    
+    def iter_slides(self, start=0, stop=None):
+        """Ітерує (slide_id, slide) у порядку ID без копіювання словника"""
+        slides = self.slides
+        for slide_id in self._slide_order[start:stop]:
+            slide = slides.get(slide_id)
+            if slide is not None:
+                yield slide_id, slide
+    
+    def get_slide_range(self, start, stop):
+        """Повертає слайди з позиціями [start, stop) у порядку ID"""
+        return list(self.iter_slides(start, stop))
+    
+    def get_page_size(self, per_page=None):
+        """Розмір сторінки з config.content['slides_per_page']"""
+        return max(1, int(per_page or config.content.get('slides_per_page', 10)))
+    
+    def get_page_count(self, per_page=None):
+        """Кількість сторінок (мінімум одна)"""
+        per_page = self.get_page_size(per_page)
+        return max(1, -(-len(self._slide_order) // per_page))
+    
+    def get_page(self, page, per_page=None):
+        """Повертає сторінку слайдів (нумерація з 0)"""
+        per_page = self.get_page_size(per_page)
+        start = max(0, page) * per_page
+        return self.get_slide_range(start, start + per_page)
+    
+    def get_slide_position(self, slide_id):
+        """Позиція слайду у впорядкованому індексі або None"""
+        order = self._slide_order
+        position = bisect_left(order, slide_id)
+        if position < len(order) and order[position] == slide_id:
+            return position
+        return None
+    
+    def get_page_for_slide(self, slide_id, per_page=None):
+        """Номер сторінки, на якій знаходиться слайд (0 якщо не знайдено)"""
+        position = self.get_slide_position(slide_id)
+        if position is None:
+            return 0
+        return position // self.get_page_size(per_page)
+    
+    def get_adjacent_slide_id(self, slide_id, step=1):
+        """ID сусіднього слайду з циклічним переходом"""
+        order = self._slide_order
+        if not order:
+            return None
+        position = self.get_slide_position(slide_id)
+        if position is None:
+            return order[0]
+        return order[(position + step) % len(order)]
+    
+    def get_asset_refs(self):
+        """Множина посилань на ассети, які використовують слайди"""
+        refs = set()
+        for _, slide in self.iter_slides():
+            for element in slide.config_data.get('canvas_elements', ()):
+                if isinstance(element, dict) and is_asset_ref(element.get('asset')):
+                    refs.add(element['asset'])
+        return refs
+    
     def update_slide_content(self, slide_id, title, content, config_data=None):
         """Оновлення контенту слайду"""
         if slide_id not in self.slides:
             self.slides[slide_id] = SlideData(slide_id)
+            self._reindex()
         
         slide = self.slides[slide_id]
         slide.title = title
         slide.content = content
         if config_data:
+            intern_canvas_assets(config_data.get('canvas_elements'))
             slide.config_data.update(config_data)
+            slide.invalidate_canvas_elements()
         slide.last_modified = datetime.now()
+        self._dirty_slides.add(slide_id)
+        self._journal_changes([('upsert', slide_id, slide.to_dict())])
         
         # Сповістити спостерігачів про зміни
         self.notify_observers(slide_id, slide)
         
-        logger.debug(f"Updated slide {slide_id}: {title[:30]}...")
+        logger.debug("Updated slide %s: %.30s...", slide_id, title)
+        return True
+    
+    def set_slide_state(self, slide_id, title, content, config_data):
+        """Встановлює заголовок, контент і config_data одним кроком (undo/redo)
+        
+        На відміну від update_slide_content config_data замінюється повністю;
+        слайд позначається зміненим, журналюється та сповіщається рівно один раз.
+        """
+        with self._lock:
+            if slide_id not in self.slides:
+                self.slides[slide_id] = SlideData(slide_id)
+                self._reindex()
+            
+            slide = self.slides[slide_id]
+            slide.title = title
+            slide.content = content
+            slide.config_data = config_data
+            slide.last_modified = datetime.now()
+            self._dirty_slides.add(slide_id)
+            record = slide.to_dict()
+        
+        self._journal_changes([('upsert', slide_id, record)])
+        self.notify_observers(slide_id, slide)
+        
+        logger.debug("Restored slide %s: %.30s...", slide_id, title)
         return True
     
     def create_slide(self, slide_id, title="", content=""):
@@ -114,20 +441,118 @@ class ContentManager:
             logger.warning(f"Slide {slide_id} already exists, updating instead")
         
         self.slides[slide_id] = SlideData(slide_id, title, content)
+        self._reindex()
+        self._dirty_slides.add(slide_id)
+        self._journal_changes([('upsert', slide_id, self.slides[slide_id].to_dict())])
         self.notify_observers(slide_id, self.slides[slide_id])
         
-        logger.info(f"Created new slide {slide_id}")
+        logger.info("Created new slide %s", slide_id)
         return True
     
     def delete_slide(self, slide_id):
         """Видалення слайду"""
         if slide_id in self.slides:
             del self.slides[slide_id]
+            self._reindex()
+            self._dirty_slides.discard(slide_id)
+            self._deleted_slides.add(slide_id)
+            self._journal_changes([('delete', slide_id, None)])
             self.notify_observers(slide_id, None, action='delete')
-            logger.info(f"Deleted slide {slide_id}")
+            logger.info("Deleted slide %s", slide_id)
             return True
         return False
     
+    @staticmethod
+    def build_slides(records, intern_assets=True):
+        """Валідує записи та будує SlideData без зміни стану менеджера
+        
+        Не торкається UI і спостерігачів, тому може виконуватись у робочому потоці.
+        intern_assets=False - лише читання (індексація, перевірка): без запису в сховище ассетів.
+        Повертає (slides, errors), де slides - словник {slide_id: SlideData}.
+        """
+        slides = {}
+        errors = []
+        
+        for index, record in enumerate(records):
+            if not isinstance(record, dict):
+                errors.append(f"Record {index}: expected dict, got {type(record).__name__}")
+                continue
+            
+            try:
+                slide_id = int(record.get('slide_id'))
+            except (TypeError, ValueError):
+                errors.append(f"Record {index}: invalid slide_id {record.get('slide_id')!r}")
+                continue
+            
+            config_data = record.get('config_data') or {}
+            if not isinstance(config_data, dict):
+                errors.append(f"Slide {slide_id}: config_data must be a dict")
+                continue
+            
+            if intern_assets:
+                intern_canvas_assets(config_data.get('canvas_elements'))
+            
+            slide = SlideData(
+                slide_id,
+                str(record.get('title') or ''),
+                str(record.get('content') or ''),
+                dict(config_data)
+            )
+            
+            last_modified = record.get('last_modified')
+            if last_modified:
+                try:
+                    slide.last_modified = datetime.fromisoformat(str(last_modified))
+                except ValueError:
+                    pass
+            
+            if slide_id in slides:
+                logger.warning(f"Duplicate slide {slide_id} in import, keeping the last one")
+            slides[slide_id] = slide
+        
+        return slides, errors
+    
+    def replace_slides(self, new_slides, merge=False, journal=True):
+        """Атомарно замінює (або доповнює при merge=True) всі слайди
+        
+        Спостерігачі отримують рівно одну подію 'reload' замість подій на кожен слайд.
+        Масова заміна при увімкненому журналі переноситься в основне сховище у фоновому
+        потоці - декодування лінивих слайдів (bundle) не блокує UI.
+        """
+        with self._lock:
+            if merge:
+                combined = dict(self.slides)
+                combined.update(new_slides)
+            else:
+                combined = dict(new_slides)
+            
+            # Одне присвоєння - читачі бачать або старий, або новий стан
+            order = tuple(sorted(combined))
+            if not merge:
+                self._deleted_slides.update(set(self.slides) - set(combined))
+            self._dirty_slides.update(new_slides)
+            self.slides = combined
+            self._slide_order = order
+        
+        self.notify_observers(None, None, action='reload')
+        
+        if journal and self.journal is not None:
+            self.compact_journal_async()
+        
+        logger.info("%s %d slides (%d total)",
+                    'Merged' if merge else 'Replaced', len(new_slides), len(self.slides))
+        return len(new_slides)
+    
+    def bulk_import(self, records, merge=False):
+        """Валідує записи, будує слайди та атомарно застосовує їх однією подією"""
+        slides, errors = self.build_slides(records)
+        
+        for error in errors:
+            logger.error(f"Skipped invalid slide during import: {error}")
+        
+        self.replace_slides(slides, merge=merge)
+        return len(slides), errors
+    
     def add_observer(self, callback):
         """Додавання спостерігача для отримання сповіщень про зміни"""
         self.content_observers.append(callback)
@@ -140,6 +565,7 @@ class ContentManager:
             except Exception as e:
                 logger.error(f"Error notifying observer: {e}")
     
+    @perf_events.timed("content.save_file")
     def save_to_file(self, filepath=None):
         """Збереження всіх слайдів у файл"""
         if not filepath:
@@ -155,15 +581,195 @@ class ContentManager:
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Тимчасовий файл + os.replace - збій живлення не лишає обрізаний JSON
+            with atomic_open(filepath) as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
-            logger.info(f"Slides saved to {filepath}")
+            logger.info("Slides saved to %s", filepath)
             return True
         except Exception as e:
             logger.error(f"Error saving slides: {e}")
             return False
     
+    @perf_events.timed("content.save_storage")
+    def save_to_storage(self, full=False):
+        """Інкрементальне збереження в бекенд storage_manager - лише змінені та видалені слайди"""
+        with self._lock:
+            dirty = set(self.slides) if full else self._dirty_slides & set(self.slides)
+            deleted = set(self._deleted_slides)
+            self._dirty_slides = set()
+            self._deleted_slides = set()
+        
+        if not dirty and not deleted:
+            return True
+        
+        slides = self.slides
+        upserts = [slides[slide_id].to_storage_dict() for slide_id in sorted(dirty) if slide_id in slides]
+        if storage_manager.write_slides(upserts, sorted(deleted)):
+            logger.debug("Saved %d changed slides, %d deleted", len(upserts), len(deleted))
+            return True
+        
+        # Невдала транзакція - зміни залишаються позначеними для наступної спроби
+        with self._lock:
+            self._dirty_slides |= dirty
+            self._deleted_slides |= deleted
+        return False
+    
+    def load_from_storage(self):
+        """Завантаження всіх слайдів з бекенду storage_manager"""
+        records = storage_manager.load_slides()
+        if not records:
+            return False
+        
+        slides, errors = self.build_slides(records)
+        for error in errors:
+            logger.error(f"Skipped invalid slide from storage: {error}")
+        
+        self.replace_slides(slides, journal=False)
+        
+        # Стан збігається зі сховищем - нічого не позначено до збереження
+        with self._lock:
+            self._dirty_slides.clear()
+            self._deleted_slides.clear()
+        
+        logger.info("Loaded %d slides from %s storage", len(slides), storage_manager.backend.name)
+        return True
+    
+    def load_page_layouts(self, content_dir=None):
+        """Підтягує layout Creator з content/page_N/config.json і компілює display list
+        
+        Слайди, що вже мають canvas_elements, не змінюються. Доповнені слайди
+        позначаються зміненими й журналюються, як і будь-яке інше редагування.
+        Повертає кількість слайдів.
+        """
+        content_dir = content_dir or config.content_dir
+        if not os.path.isdir(content_dir):
+            return 0
+        
+        changes = []
+        with self._lock:
+            for name in os.listdir(content_dir):
+                if not name.startswith('page_') or not name[5:].isdigit():
+                    continue
+                slide = self.slides.get(int(name[5:]))
+                filepath = os.path.join(content_dir, name, 'config.json')
+                if slide is None or slide.canvas_elements or not os.path.isfile(filepath):
+                    continue
+                
+                try:
+                    page_config = parse_cache.load(filepath)
+                except Exception as e:
+                    logger.error(f"Error loading page layout {filepath}: {e}")
+                    continue
+                if not page_config.get('canvas_elements'):
+                    continue
+                
+                slide.config_data = dict(slide.config_data, **{
+                    key: page_config[key]
+                    for key in ('canvas_elements', 'slide_width', 'slide_height')
+                    if key in page_config
+                })
+                slide.display_list  # одноразова компіляція
+                self._dirty_slides.add(slide.slide_id)
+                changes.append(('upsert', slide.slide_id, slide.to_dict()))
+        
+        if changes:
+            self._journal_changes(changes)
+        
+        logger.debug("Loaded %d page layouts from %s", len(changes), content_dir)
+        return len(changes)
+    
+    def enable_journal(self, filepath=None):
+        """Вмикає write-ahead журнал змін слайдів"""
+        if self.journal is None:
+            filepath = filepath or os.path.join(storage_manager.data_dir, config.storage['journal_filename'])
+            self.journal = SlideJournal(filepath, fsync=config.storage['journal_fsync'],
+                                        sync_delay=config.storage['journal_sync_delay'])
+            logger.debug("Slide journal enabled: %s (%d pending entries)", filepath, self.journal.entry_count)
+        return self.journal
+    
+    def _journal_changes(self, changes):
+        """Дописує зміни в журнал; при переповненні - компактизація"""
+        if self.journal is None:
+            return
+        try:
+            with self._lock:
+                entry_count = self.journal.append_many(changes)
+        except Exception as e:
+            logger.error(f"Error writing slide journal: {e}")
+            return
+        
+        if entry_count >= config.storage['journal_compact_entries']:
+            self.compact_journal()
+    
+    def compact_journal(self):
+        """Переносить зміни в основне сховище та очищає журнал
+        
+        Запис у сховище йде без блокування менеджера - правки в потоці Tk не чекають.
+        Записи журналу до початку знімка вже є у сховищі й видаляються; дописані
+        під час збереження лишаються для наступної компактизації.
+        """
+        with self._compaction_lock:
+            if self.journal is None:
+                return self.save_to_storage()
+            
+            # Позиція журналу до знімка змінених слайдів (позначка dirty ставиться до запису в журнал)
+            with self._lock:
+                upto_seq = self.journal.last_seq
+            if not self.save_to_storage():
+                return False
+            try:
+                self.journal.truncate(upto_seq)
+            except Exception as e:
+                # Журнал лишається - повторне відтворення ідемпотентне
+                logger.error(f"Error truncating slide journal: {e}")
+                return False
+        
+        logger.debug("Slide journal compacted")
+        return True
+    
+    def compact_journal_async(self):
+        """Компактизація у фоновому потоці (наприклад, після імпорту bundle)"""
+        thread = threading.Thread(target=self.compact_journal, name="journal-compaction", daemon=True)
+        thread.start()
+        return thread
+    
+    def recover(self):
+        """Старт: завантажує основне сховище та відтворює хвіст журналу"""
+        if not self.load_from_storage():
+            # Порожнє сховище - перша компактизація запише повний початковий стан
+            with self._lock:
+                self._dirty_slides.update(self.slides)
+        entries = self.enable_journal().read_entries()
+        if not entries:
+            return 0
+        
+        with self._lock:
+            slides = dict(self.slides)
+            for entry in entries:
+                slide_id = entry['slide_id']
+                if entry['op'] == 'delete':
+                    slides.pop(slide_id, None)
+                    self._dirty_slides.discard(slide_id)
+                    self._deleted_slides.add(slide_id)
+                    continue
+                
+                built, errors = self.build_slides([entry['record']])
+                for error in errors:
+                    logger.error(f"Skipped invalid journal entry {entry['seq']}: {error}")
+                slides.update(built)
+                self._dirty_slides.update(built)
+                self._deleted_slides.difference_update(built)
+            
+            self.slides = slides
+            self._slide_order = tuple(sorted(slides))
+        
+        self.notify_observers(None, None, action='reload')
+        logger.info("Replayed %d journal entries", len(entries))
+        
+        self.compact_journal()
+        return len(entries)
+    
     def load_from_file(self, filepath=None):
         """Завантаження слайдів з файлу"""
         if not filepath:
@@ -174,21 +780,19 @@ class ContentManager:
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Повторні завантаження беруться з бінарного кешу без парсингу
+            data = parse_cache.load(filepath)
             
             if 'slides' in data:
-                self.slides.clear()
-                for slide_id_str, slide_data in data['slides'].items():
-                    slide_id = int(slide_id_str)
-                    self.slides[slide_id] = SlideData.from_dict(slide_data)
-                
-                logger.info(f"Loaded {len(self.slides)} slides from {filepath}")
+                slides = {
+                    int(slide_id_str): SlideData.from_dict(slide_data)
+                    for slide_id_str, slide_data in data['slides'].items()
+                }
                 
-                # Сповістити всіх спостерігачів
-                for slide_id, slide_data in self.slides.items():
-                    self.notify_observers(slide_id, slide_data, action='load')
+                # Одна атомарна заміна та одна подія 'reload' для спостерігачів
+                self.replace_slides(slides)
                 
+                logger.info("Loaded %d slides from %s", len(self.slides), filepath)
                 return True
         except Exception as e:
             logger.error(f"Error loading slides: {e}")
@@ -218,15 +822,86 @@ class ContentManager:
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
+            with atomic_open(filepath) as f:
+                yaml_dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
             
-            logger.info(f"Slides exported to YAML: {filepath}")
+            logger.info("Slides exported to YAML: %s", filepath)
             return filepath
         except Exception as e:
             logger.error(f"Error exporting to YAML: {e}")
             return None
     
+    def iter_archive_records(self, include_assets=True):
+        """Записи потокового архіву: слайди по одному, потім ассети шматками"""
+        from core.archives import chunk_records, iter_file_chunks
+        
+        for slide_id, slide in self.iter_slides():
+            yield {'type': 'slide', 'key': str(slide_id), 'data': slide.to_dict()}
+        
+        if not include_assets:
+            return
+        for ref in sorted(self.get_asset_refs()):
+            blob_path = asset_store.get_path(ref)
+            if blob_path is not None:
+                chunks = iter_file_chunks(blob_path)
+            else:
+                data = asset_store.read_bytes(ref)
+                if data is None:
+                    logger.warning(f"Asset missing from archive export: {ref[:20]}...")
+                    continue
+                chunks = (data,)
+            yield {'type': 'asset', 'key': ref}
+            yield from chunk_records('asset_chunk', ref, chunks)
+    
+    def export_archive(self, filename=None, compression='gzip', codec='json', split_size=None, include_assets=True):
+        """Потоковий стиснений експорт слайдів (та їх ассетів) в exports"""
+        from core.archives import archive_filename
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = archive_filename(f"presentation_{timestamp}", codec, compression)
+        
+        return storage_manager.export_archive(
+            self.iter_archive_records(include_assets), filename, codec, compression, split_size,
+            {'kind': 'slides', 'exported_at': datetime.now().isoformat(), 'version': "4.0.0"}
+        )
+    
+    def load_from_archive(self, filepath, merge=False):
+        """Завантажує слайди з потокового архіву; ассети повертаються в asset_store"""
+        import base64
+        records = []
+        asset_ref = None
+        asset_chunks = []
+        
+        def store_asset():
+            if asset_ref and asset_chunks:
+                stored = asset_store.put_bytes(b''.join(asset_chunks))
+                if stored != asset_ref:
+                    logger.warning(f"Asset hash mismatch in archive: {asset_ref[:20]}...")
+        
+        try:
+            for record in storage_manager.iter_archive(filepath):
+                record_type = record.get('type')
+                if record_type == 'slide':
+                    records.append(record['data'])
+                elif record_type == 'asset':
+                    # В пам'яті лише один ассет одночасно
+                    store_asset()
+                    asset_ref, asset_chunks = record['key'], []
+                elif record_type == 'asset_chunk' and record['key'] == asset_ref:
+                    asset_chunks.append(base64.b64decode(record['data']))
+            store_asset()
+        except Exception as e:
+            logger.error(f"Error loading archive: {e}")
+            return False
+        
+        slides, errors = self.build_slides(records)
+        for error in errors:
+            logger.error(f"Skipped invalid slide from archive: {error}")
+        self.replace_slides(slides, merge)
+        
+        logger.info("Loaded %d slides from archive %s", len(slides), filepath)
+        return True
+    
     def load_presentation_from_file(self):
         """Завантаження презентації з файлу через діалог"""
         try:
@@ -255,21 +930,18 @@ class ContentManager:
     def load_from_yaml(self, filepath):
         """Завантаження з YAML файлу"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = parse_cache.load(filepath)
             
             if 'slides' in data:
-                self.slides.clear()
-                for slide_id_str, slide_data in data['slides'].items():
-                    slide_id = int(slide_id_str)
-                    self.slides[slide_id] = SlideData.from_dict(slide_data)
-                
-                logger.info(f"Loaded {len(self.slides)} slides from YAML: {filepath}")
+                slides = {
+                    int(slide_id_str): SlideData.from_dict(slide_data)
+                    for slide_id_str, slide_data in data['slides'].items()
+                }
                 
-                # Сповістити всіх спостерігачів
-                for slide_id, slide_data in self.slides.items():
-                    self.notify_observers(slide_id, slide_data, action='load')
+                # Одна атомарна заміна та одна подія 'reload' для спостерігачів
+                self.replace_slides(slides)
                 
+                logger.info("Loaded %d slides from YAML: %s", len(self.slides), filepath)
                 return True
         except Exception as e:
             logger.error(f"Error loading from YAML: {e}")
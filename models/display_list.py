@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Display List für Dynamic Messe Stand V4
+Kompiliert gespeicherte canvas_elements des Creators in eine kompakte Zeichenliste
+"""
+
+import re
+from collections import namedtuple
+
+# Ein Zeichenbefehl in Slide-Koordinaten (0..width, 0..height)
+# op: 'rect', 'oval', 'line', 'text' oder 'image' (Punkt oder Zielbox); role: 'title' / 'body' für die Creator-Editoren
+DisplayOp = namedtuple('DisplayOp', [
+    'op', 'coords', 'fill', 'outline', 'line_width', 'text', 'font', 'anchor', 'wrap', 'image', 'role'
+])
+
+# Kompilierte Folie: Slide-Größe, Befehle in Zeichenreihenfolge und Faktor Schriftgröße -> Slide-Punkte
+DisplayList = namedtuple('DisplayList', ['width', 'height', 'ops', 'font_scale'])
+
+SLIDE_WIDTH = 1920
+SLIDE_HEIGHT = 1080
+
+# Schriftgrößen stammen aus der verkleinerten Creator-Canvas (32-pt-Titel wird als 15 pt gespeichert)
+EDITOR_SCALE = 0.47
+
+# Canvas-Typ -> Befehl
+SHAPE_OPS = {'rectangle': 'rect', 'oval': 'oval', 'line': 'line', 'text': 'text', 'image': 'image'}
+
+_FONT_PATTERN = re.compile(r'^\s*(?:\{([^}]*)\}|(\S+))\s+(-?\d+)(.*)$')
+
+def parse_font(value, default=('Segoe UI', 12)):
+    """Tk-Fontangabe ('{Segoe UI} 28 bold' oder Tupel) -> Tupel (Familie, Größe, Stile...)"""
+    if isinstance(value, (tuple, list)) and len(value) >= 2:
+        return (str(value[0]), int(float(value[1]))) + tuple(str(style) for style in value[2:])
+    if isinstance(value, str):
+        match = _FONT_PATTERN.match(value)
+        if match:
+            family = match.group(1) if match.group(1) is not None else match.group(2)
+            return (family, int(match.group(3))) + tuple(match.group(4).split())
+    return default
+
+def _is_editor_chrome(coords, width, height):
+    """Schatten/Rahmen des Creators: ragen über die Folie hinaus und bedecken sie fast ganz"""
+    x1, y1, x2, y2 = coords
+    outside = x1 < -0.5 or y1 < -0.5 or x2 > width + 0.5 or y2 > height + 0.5
+    return outside and (x2 - x1) >= width * 0.9 and (y2 - y1) >= height * 0.9
+
+def _slide_transform(elements, width, height):
+    """(Ursprung x, Ursprung y, Faktor) aus dem Folien-Hintergrund des Creators
+
+    Der Creator speichert Koordinaten seiner Canvas; liegt der Hintergrund nicht
+    bei (0, 0, width, height), wird darauf normalisiert.
+    """
+    for element in elements:
+        if element.type == 'rectangle' and 'slide_background_main' in element.tags and len(element.coords) == 4:
+            x1, y1, x2, _ = element.coords
+            if x2 > x1:
+                return x1, y1, width / (x2 - x1)
+    return 0.0, 0.0, 1.0
+
+def compile_canvas_elements(elements, width=SLIDE_WIDTH, height=SLIDE_HEIGHT, editor_scale=EDITOR_SCALE):
+    """Übersetzt CanvasElement-Tupel einmalig in eine DisplayList
+
+    Editor-Chrome (Schatten, Rahmen) und doppelte Befehle entfallen; Flächen und
+    Linien werden vor Texten gezeichnet, damit später gespeicherte Hintergründe
+    keinen Text verdecken. Text-Widgets erhalten Rollen, damit bei der Wiedergabe
+    der aktuelle Titel/Inhalt der Folie eingesetzt werden kann.
+    """
+    origin_x, origin_y, factor = _slide_transform(elements, width, height)
+
+    def transform(coords):
+        return tuple(
+            round((value - (origin_x if index % 2 == 0 else origin_y)) * factor, 2)
+            for index, value in enumerate(coords)
+        )
+
+    shapes = []
+    texts = []
+    seen = set()
+    title_assigned = False
+
+    for element in elements:
+        if len(element.coords) < 2:
+            continue
+        coords = transform(element.coords)
+
+        if element.type == 'window':
+            if not element.text and element.image:
+                # Label mit Bild: width/height sind Pixel - als Zielbox übernehmen
+                if element.width > 0 and element.height > 0:
+                    x, y = element.coords[:2]
+                    coords = transform((x, y, x + element.width, y + element.height))
+                else:
+                    coords = coords[:2]
+                op = DisplayOp('image', coords, None, None, 0, '', None, 'nw', 0, element.image, None)
+            else:
+                font = parse_font(element.font)
+                role = None
+                if element.widget_type == 'Text':
+                    # Erster fetter Editor = Titel (wie im Creator), weitere = Inhalt
+                    role = 'title' if 'bold' in font[2:] and not title_assigned else 'body'
+                    title_assigned = title_assigned or role == 'title'
+                # Text-Widgets brechen bis zum symmetrischen rechten Rand um
+                wrap = max(0.0, width - 2 * coords[0]) if element.widget_type == 'Text' else 0
+                op = DisplayOp('text', coords[:2], element.fg, None, 0, element.text, font, 'nw', wrap, None, role)
+        else:
+            op_type = SHAPE_OPS.get(element.type)
+            if op_type is None:
+                continue
+            if op_type == 'rect' and len(coords) == 4 and _is_editor_chrome(coords, width, height):
+                continue
+            if op_type == 'text':
+                op = DisplayOp('text', coords[:2], element.fill, None, 0, element.text,
+                               parse_font(element.font), element.anchor or 'center', element.width * factor, None, None)
+            elif op_type == 'image':
+                op = DisplayOp('image', coords[:2], None, None, 0, '', None, element.anchor or 'center', 0, element.image, None)
+            else:
+                op = DisplayOp(op_type, coords, element.fill or None, element.outline or None,
+                               element.width or 1, '', None, None, 0, None, None)
+
+        if op in seen:
+            continue
+        seen.add(op)
+        (texts if op.op in ('text', 'image') else shapes).append(op)
+
+    return DisplayList(width, height, tuple(shapes + texts), 1.0 / editor_scale)
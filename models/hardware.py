@@ -10,6 +10,7 @@ import time
 import queue
 from core.logger import logger
 from core.config import config
+from core.perf import perf_events
 
 class HardwareConnection:
     """Basis-Klasse für Hardware-Verbindungen"""
@@ -83,13 +84,15 @@ class HardwareConnection:
         if not self.connection or not self.connection.is_open:
             return False
         
-        try:
-            self.connection.write(f"{data}\n".encode('utf-8'))
-            logger.debug(f"Gesendet an {self.name}: {data}")
-            return True
-        except Exception as e:
-            logger.error(f"Fehler beim Senden an {self.name}: {e}")
-            return False
+        with perf_events.span("hardware.send", device=self.name) as fields:
+            try:
+                self.connection.write(f"{data}\n".encode('utf-8'))
+                logger.debug("Gesendet an %s: %s", self.name, data)
+                return True
+            except Exception as e:
+                fields['ok'] = False
+                logger.error(f"Fehler beim Senden an {self.name}: {e}")
+                return False
 
 class ESP32Connection(HardwareConnection):
     """ESP32-spezifische Verbindungsklasse"""
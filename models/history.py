@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Edit History für Dynamic Messe Stand V4
+Undo/Redo für Slide-Bearbeitungen mit unveränderlichen Snapshots
+"""
+
+import copy
+import time
+from collections import deque, namedtuple
+from core.logger import logger
+from models.content import SlideData, content_manager
+
+# Unveränderlicher Zustand einer Slide. config_data wird nach dem Erstellen nie
+# verändert und zwischen Snapshots geteilt, solange sich die Konfiguration nicht ändert.
+SlideSnapshot = namedtuple('SlideSnapshot', ['title', 'content', 'config_data', 'config_version', 'content_hash'])
+
+# Platzhalter für noch nicht geladene (lazy) Slides - der Snapshot wird erst bei
+# der ersten Änderung aus dem Originaldatensatz erstellt
+PendingSnapshot = namedtuple('PendingSnapshot', ['slide', 'title'])
+
+# Ein Eintrag beschreibt nur die geänderte Slide (vorher/nachher), nie das ganze Deck
+HistoryEntry = namedtuple('HistoryEntry', ['slide_id', 'before', 'after', 'timestamp', 'size'])
+
+def _snapshot_size(snapshot, shared_config):
+    """Geschätzter Speicherbedarf eines Snapshots in Bytes"""
+    if snapshot is None:
+        return 0
+    size = len(snapshot.title) + len(snapshot.content) + 64
+    if snapshot.config_data is not shared_config:
+        # Grobe Schätzung für eine eigene Kopie der Konfiguration
+        size += 256 + 128 * len(snapshot.config_data.get('canvas_elements', ()))
+    return size
+
+class EditHistory:
+    """Begrenzte Undo/Redo-Historie auf Basis der ContentManager-Events"""
+
+    def __init__(self, max_bytes=4 * 1024 * 1024, merge_window=1.0, max_entries=1000):
+        self.max_bytes = max_bytes
+        self.merge_window = merge_window  # Sekunden, in denen Tastenanschläge zusammengefasst werden
+        self.max_entries = max_entries
+        self._undo = deque()
+        self._redo = deque()
+        self._latest = {}  # slide_id -> zuletzt bekannter Snapshot
+        self._bytes = 0
+        self._applying = False
+        self._manager = None
+
+    def attach(self, manager):
+        """Registriert die Historie als Observer des ContentManagers"""
+        self._manager = manager
+        self._reseed()
+        manager.add_observer(self.on_content_changed)
+
+    def _reseed(self):
+        """Merkt sich den aktuellen Zustand aller Slides als Ausgangspunkt"""
+        self._latest = {
+            slide_id: self._snapshot(slide, None) if slide.is_loaded else PendingSnapshot(slide, slide.title)
+            for slide_id, slide in self._manager.iter_slides()
+        }
+    
+    @staticmethod
+    def _resolve_pending(pending):
+        """Erstellt den Snapshot einer lazy Slide aus ihrem Originaldatensatz"""
+        record = pending.slide.original_record() or {}
+        original = SlideData(
+            pending.slide.slide_id,
+            pending.title,
+            str(record.get('content') or ''),
+            dict(record.get('config_data') or {})
+        )
+        return EditHistory._snapshot(original, None)
+
+    @staticmethod
+    def _snapshot(slide, previous):
+        """Erstellt einen Snapshot und teilt die Konfiguration mit dem Vorgänger"""
+        if previous is not None and previous.config_version == slide.config_version:
+            config_data = previous.config_data
+        else:
+            config_data = copy.deepcopy(slide.config_data)
+        return SlideSnapshot(slide.title, slide.content, config_data, slide.config_version, slide.content_hash)
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def clear(self):
+        """Leert Undo- und Redo-Stapel"""
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+
+    def on_content_changed(self, slide_id, slide_data, action='update'):
+        """Observer für ContentManager - zeichnet Änderungen auf"""
+        try:
+            if action == 'reload':
+                # Massen-Import ist ein neuer Ausgangspunkt, keine einzelne Bearbeitung
+                self.clear()
+                self._reseed()
+                return
+
+            before = self._latest.get(slide_id)
+            if isinstance(before, PendingSnapshot):
+                before = self._resolve_pending(before)
+            if action == 'delete' or slide_data is None:
+                after = None
+                self._latest.pop(slide_id, None)
+            else:
+                after = self._snapshot(slide_data, before)
+                self._latest[slide_id] = after
+
+            if self._applying:
+                return
+
+            if before is not None and after is not None \
+                    and before.content_hash == after.content_hash \
+                    and before.config_data is after.config_data:
+                # Keine echte Änderung (z.B. Auto-Save ohne Bearbeitung)
+                return
+
+            self._record(slide_id, before, after)
+
+        except Exception as e:
+            logger.error(f"Fehler in der Bearbeitungs-Historie: {e}")
+
+    def _record(self, slide_id, before, after):
+        """Legt einen Eintrag an oder fasst ihn mit dem vorherigen zusammen"""
+        now = time.monotonic()
+
+        # Neue Bearbeitung verwirft die Redo-Kette
+        while self._redo:
+            self._bytes -= self._redo.pop().size
+
+        top = self._undo[-1] if self._undo else None
+        if (top is not None and top.slide_id == slide_id
+                and top.before is not None and top.after is not None and after is not None
+                and now - top.timestamp <= self.merge_window):
+            # Aufeinanderfolgende Tastenanschläge: nur den "nachher"-Zustand ersetzen
+            self._undo.pop()
+            self._bytes -= top.size
+            before = top.before
+
+        size = _snapshot_size(before, None) + _snapshot_size(after, before.config_data if before else None)
+        self._undo.append(HistoryEntry(slide_id, before, after, now, size))
+        self._bytes += size
+
+        # Speicherbudget einhalten - älteste Einträge zuerst verwerfen
+        while len(self._undo) > 1 and (self._bytes > self.max_bytes or len(self._undo) > self.max_entries):
+            self._bytes -= self._undo.popleft().size
+
+    def _apply(self, slide_id, snapshot):
+        """Stellt einen Snapshot im ContentManager wieder her"""
+        self._applying = True
+        try:
+            if snapshot is None:
+                self._manager.delete_slide(slide_id)
+                return
+
+            current = self._latest.get(slide_id)
+            if current is None or current.config_data is not snapshot.config_data:
+                # Layout geändert: alles in einem Schritt, damit Journal und Speicher stimmen
+                self._manager.set_slide_state(
+                    slide_id, snapshot.title, snapshot.content, copy.deepcopy(snapshot.config_data)
+                )
+            else:
+                self._manager.update_slide_content(slide_id, snapshot.title, snapshot.content)
+        finally:
+            self._applying = False
+
+    def undo(self):
+        """Macht die letzte Bearbeitung rückgängig, gibt die Slide-ID zurück"""
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self._apply(entry.slide_id, entry.before)
+        self._redo.append(entry._replace(timestamp=0.0))
+        logger.debug("Undo für Slide %s", entry.slide_id)
+        return entry.slide_id
+
+    def redo(self):
+        """Stellt die zuletzt rückgängig gemachte Bearbeitung wieder her"""
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self._apply(entry.slide_id, entry.after)
+        # timestamp=0 verhindert, dass der nächste Tastenanschlag damit verschmilzt
+        self._undo.append(entry._replace(timestamp=0.0))
+        logger.debug("Redo für Slide %s", entry.slide_id)
+        return entry.slide_id
+
+    def get_status(self):
+        """Gibt den aktuellen Zustand der Historie zurück"""
+        return {
+            'undo_entries': len(self._undo),
+            'redo_entries': len(self._redo),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes
+        }
+
+# Globale Bearbeitungs-Historie
+edit_history = EditHistory()
+edit_history.attach(content_manager)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Presentation Library für Dynamic Messe Stand V4
+Persistenter Index über alle Präsentationsdateien (Titel, Folienanzahl, Vorschau)
+"""
+
+import os
+import hashlib
+from datetime import datetime
+from core.logger import logger
+from core.storage import storage_manager
+from core.file_cache import parse_cache
+from core.assets import is_asset_ref
+from models.bundle import BUNDLE_EXTENSION, PresentationBundle
+
+# Unterstützte Dateiendungen (Bundles werden über das Manifest gelesen)
+LIBRARY_EXTENSIONS = ('.json', '.yaml', '.yml', BUNDLE_EXTENSION)
+
+def _file_hash(filepath):
+    """Inhalts-Hash einer Datei (blockweise gelesen)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _first_asset_ref(slides):
+    """Erstes Asset der ersten Slide als Vorschau-Referenz"""
+    for slide_data in slides:
+        if not isinstance(slide_data, dict):
+            continue
+        config_data = slide_data.get('config_data', slide_data.get('config')) or {}
+        elements = slide_data.get('canvas_elements', config_data.get('canvas_elements', ()))
+        for element in elements or ():
+            if isinstance(element, dict) and is_asset_ref(element.get('asset')):
+                return element['asset']
+        return None
+    return None
+
+class PresentationLibrary:
+    """Index der Präsentationen eines Verzeichnisses, inkrementell per mtime aktualisiert"""
+
+    INDEX_VERSION = 1
+    INDEX_FILENAME = "presentation_library.json"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._entries = None  # filename -> Metadaten, lazy aus dem Index geladen
+        self.scanned = 0      # Anzahl neu eingelesener Dateien (letzter refresh)
+
+    def _load_index(self):
+        """Lädt den gespeicherten Index (verwirft ihn bei anderer Version/Verzeichnis)"""
+        self._entries = {}
+        data = storage_manager.load_json(self.INDEX_FILENAME) if storage_manager.file_exists(self.INDEX_FILENAME) else None
+        if not isinstance(data, dict):
+            return
+        if data.get('version') != self.INDEX_VERSION or data.get('directory') != os.path.abspath(self.directory):
+            logger.debug("Presentation library index outdated, rebuilding")
+            return
+        self._entries = data.get('entries', {})
+
+    def _save_index(self):
+        """Speichert den Index im data-Verzeichnis"""
+        storage_manager.save_json({
+            'version': self.INDEX_VERSION,
+            'directory': os.path.abspath(self.directory),
+            'entries': self._entries
+        }, self.INDEX_FILENAME)
+
+    def _scan_file(self, filepath, stat):
+        """Liest die Metadaten einer einzelnen Datei"""
+        entry = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': None,
+            'title': None,
+            'slide_count': 0,
+            'thumbnail': None,
+            'format': os.path.splitext(filepath)[1].lower().lstrip('.'),
+            'error': None
+        }
+
+        try:
+            entry['hash'] = _file_hash(filepath)
+
+            if filepath.lower().endswith(BUNDLE_EXTENSION):
+                with PresentationBundle(filepath) as bundle:
+                    entry['title'] = bundle.metadata.get('title')
+                    slide_ids = bundle.get_slide_ids()
+                    entry['slide_count'] = len(slide_ids)
+                    if slide_ids:
+                        entry['thumbnail'] = next(iter(bundle.get_slide_assets(slide_ids[0])), None)
+            else:
+                data = parse_cache.load(filepath)
+                if not isinstance(data, dict):
+                    raise ValueError("Ungültige Präsentationsstruktur")
+                metadata = data.get('metadata', data.get('presentation', {}).get('metadata', {})) or {}
+                slides = data.get('slides', {}) or {}
+                entry['title'] = metadata.get('title')
+                entry['slide_count'] = len(slides)
+                entry['thumbnail'] = _first_asset_ref(slides.values())
+
+        except Exception as e:
+            logger.warning(f"Präsentation {filepath} konnte nicht indiziert werden: {e}")
+            entry['error'] = str(e)
+
+        return entry
+
+    def refresh(self):
+        """Gleicht den Index mit dem Verzeichnis ab - nur geänderte Dateien werden gelesen"""
+        if self._entries is None:
+            self._load_index()
+
+        self.scanned = 0
+        changed = False
+        seen = set()
+
+        if os.path.isdir(self.directory):
+            for dir_entry in os.scandir(self.directory):
+                if not dir_entry.is_file() or not dir_entry.name.lower().endswith(LIBRARY_EXTENSIONS):
+                    continue
+
+                seen.add(dir_entry.name)
+                stat = dir_entry.stat()
+                cached = self._entries.get(dir_entry.name)
+                if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                    continue
+
+                self._entries[dir_entry.name] = self._scan_file(dir_entry.path, stat)
+                self.scanned += 1
+                changed = True
+
+        for filename in [name for name in self._entries if name not in seen]:
+            del self._entries[filename]
+            changed = True
+
+        if changed:
+            self._save_index()
+            logger.debug(f"Presentation library updated: {self.scanned} scanned, {len(self._entries)} total")
+
+    def get_entries(self, refresh=True):
+        """Alle Präsentationen, neueste zuerst"""
+        if refresh or self._entries is None:
+            self.refresh()
+
+        presentations = []
+        for filename, entry in self._entries.items():
+            presentations.append({
+                'filename': filename,
+                'filepath': os.path.join(self.directory, filename),
+                'size': entry['size'],
+                'modified': datetime.fromtimestamp(entry['mtime_ns'] / 1e9),
+                'title': entry['title'] or os.path.splitext(filename)[0],
+                'slide_count': entry['slide_count'],
+                'thumbnail': entry['thumbnail'],
+                'hash': entry['hash'],
+                'format': entry['format'],
+                'error': entry['error']
+            })
+
+        return sorted(presentations, key=lambda x: x['modified'], reverse=True)
+
+    def invalidate(self, filename=None):
+        """Erzwingt das Neueinlesen einer Datei (oder aller Dateien)"""
+        if self._entries is None:
+            self._load_index()
+        if filename is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.path.basename(filename), None)
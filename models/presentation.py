@@ -1,24 +1,69 @@
 #!/usr/bin/env python3
 """
 Presentation Manager für Dynamic Messe Stand V4
-Speichern und Laden von kompletten Präsentationen als JSON/YAML
+Speichern und Laden von kompletten Präsentationen als JSON/YAML/Bundle
+
+Reine Datenschicht ohne GUI-Abhängigkeit - Dialoge liegen in
+ui/components/presentation_dialogs.py.
 """
 
 import json
-import yaml
 import os
+import copy
+from collections import namedtuple
 from datetime import datetime
-from tkinter import filedialog, messagebox
 from core.logger import logger
-from models.content import content_manager
+from core.perf import perf_events
+from core.storage import yaml_dump
+from core.file_cache import parse_cache
+from core.journal import atomic_open
+from core.assets import asset_store
+from models.content import SlideData, content_manager
+from models.bundle import BUNDLE_EXTENSION, PresentationBundle, write_bundle
+from models.library import PresentationLibrary
+from services.presentation_worker import presentation_worker
+
+# Unterstützte Dateiformate (Endung -> Format)
+PRESENTATION_FORMATS = {
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    BUNDLE_EXTENSION: 'bundle'
+}
+
+# Standard-Einstellungen einer exportierten Präsentation
+DEFAULT_SETTINGS = {
+    'slide_duration': 5,
+    'loop_mode': True,
+    'auto_start': False
+}
+
+# Ergebnis eines Ladevorgangs
+LoadResult = namedtuple('LoadResult', ['filename', 'file_format', 'slide_count', 'errors'])
+
+class PresentationError(Exception):
+    """Fehler beim Laden, Speichern oder Validieren einer Präsentation"""
+    pass
+
+def get_presentation_format(filename):
+    """Bestimmt das Format anhand der Dateiendung (PresentationError wenn unbekannt)"""
+    file_ext = os.path.splitext(filename)[1].lower()
+    if file_ext not in PRESENTATION_FORMATS:
+        raise PresentationError(f"Unbekanntes Dateiformat: {file_ext}")
+    return PRESENTATION_FORMATS[file_ext]
 
 class PresentationManager:
     """Verwaltet das Speichern und Laden von kompletten Präsentationen"""
     
+    # Slides pro Fortschrittsmeldung beim Hintergrund-Import
+    IMPORT_CHUNK_SIZE = 200
+    
     def __init__(self):
         self.current_presentation = None
         self.presentations_dir = "presentations"
+        self.open_bundles = []  # Bundles, aus denen noch Slides lazy geladen werden
         self.ensure_presentations_directory()
+        self.library = PresentationLibrary(self.presentations_dir)
     
     def ensure_presentations_directory(self):
         """Stellt sicher, dass das Presentations-Verzeichnis existiert"""
@@ -26,208 +71,293 @@ class PresentationManager:
             os.makedirs(self.presentations_dir)
             logger.info(f"Presentations-Verzeichnis erstellt: {self.presentations_dir}")
     
-    def export_presentation_as_json(self, filename=None):
-        """Exportiert die aktuelle Präsentation als JSON"""
-        try:
-            # Alle Slides sammeln
-            slides_data = {}
-            all_slides = content_manager.get_all_slides()
-            
-            for slide_id, slide in all_slides.items():
-                slides_data[str(slide_id)] = {
-                    'slide_id': slide.slide_id,
-                    'title': slide.title,
-                    'content': slide.content,
-                    'layout': slide.layout,
-                    'config_data': slide.config_data,
-                    'canvas_elements': slide.config_data.get('canvas_elements', []),
-                    'slide_width': slide.config_data.get('slide_width', 1920),
-                    'slide_height': slide.config_data.get('slide_height', 1080),
-                    'created_at': slide.created_at.isoformat(),
-                    'modified_at': slide.modified_at.isoformat()
-                }
-            
-            # Präsentations-Metadaten
-            presentation_data = {
-                'metadata': {
-                    'title': 'BumbleB Präsentation',
-                    'description': 'Automatisierte Shuttle-Präsentation',
-                    'created_at': datetime.now().isoformat(),
-                    'version': '1.0',
-                    'total_slides': len(slides_data),
-                    'format': 'json'
-                },
-                'settings': {
-                    'slide_duration': 5,
-                    'loop_mode': True,
-                    'auto_start': False
-                },
-                'slides': slides_data
+    def build_metadata(self, file_format, total_slides):
+        """Metadaten-Block einer exportierten Präsentation"""
+        return {
+            'title': 'BumbleB Präsentation',
+            'description': 'Automatisierte Shuttle-Präsentation',
+            'created_at': datetime.now().isoformat(),
+            'version': '1.0',
+            'total_slides': total_slides,
+            'format': file_format
+        }
+    
+    def snapshot_slide_records(self):
+        """Unabhängige Kopie aller Slides als Records (im Tk-Thread aufrufen)"""
+        return [
+            {
+                'slide_id': slide.slide_id,
+                'title': slide.title,
+                'content': slide.content,
+                'config_data': copy.deepcopy(slide.config_data),
+                'last_modified': slide.last_modified.isoformat()
             }
-            
-            # Dateiname bestimmen
-            if not filename:
-                filename = filedialog.asksaveasfilename(
-                    title="Präsentation speichern",
-                    defaultextension=".json",
-                    filetypes=[
-                        ("JSON-Dateien", "*.json"),
-                        ("Alle Dateien", "*.*")
-                    ],
-                    initialdir=self.presentations_dir,
-                    initialname=f"bumbleb_presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                )
-            
-            if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(presentation_data, f, indent=2, ensure_ascii=False)
-                
-                logger.info(f"Präsentation als JSON gespeichert: {filename}")
-                messagebox.showinfo(
-                    "Export erfolgreich", 
-                    f"Präsentation wurde erfolgreich gespeichert:\n{os.path.basename(filename)}\n\n"
-                    f"Folien: {len(slides_data)}\n"
-                    f"Format: JSON"
-                )
-                return filename
-            
-        except Exception as e:
-            logger.error(f"Fehler beim JSON-Export: {e}")
-            messagebox.showerror("Export-Fehler", f"Präsentation konnte nicht gespeichert werden:\n{e}")
-        
-        return None
+            for _, slide in content_manager.iter_slides()
+        ]
     
-    def export_presentation_as_yaml(self, filename=None):
-        """Exportiert die aktuelle Präsentation als YAML"""
-        try:
-            # Alle Slides sammeln
-            slides_data = {}
-            all_slides = content_manager.get_all_slides()
+    def build_presentation_data(self, records, file_format, task=None):
+        """Baut die JSON- bzw. YAML-Struktur einer Präsentation aus Records"""
+        slides_data = {}
+        total = len(records)
+        
+        for index, record in enumerate(records):
+            config_data = record['config_data']
             
-            for slide_id, slide in all_slides.items():
-                slides_data[f"slide_{slide_id}"] = {
-                    'id': slide.slide_id,
-                    'title': slide.title,
-                    'content': slide.content,
-                    'layout': slide.layout,
-                    'config': slide.config_data,
-                    'canvas_elements': slide.config_data.get('canvas_elements', []),
+            if file_format == 'yaml':
+                slides_data[f"slide_{record['slide_id']}"] = {
+                    'id': record['slide_id'],
+                    'title': record['title'],
+                    'content': record['content'],
+                    'layout': config_data.get('layout', 'text'),
+                    'config': config_data,
+                    'canvas_elements': config_data.get('canvas_elements', []),
                     'slide_dimensions': {
-                        'width': slide.config_data.get('slide_width', 1920),
-                        'height': slide.config_data.get('slide_height', 1080)
+                        'width': config_data.get('slide_width', 1920),
+                        'height': config_data.get('slide_height', 1080)
                     },
                     'timestamps': {
-                        'created': slide.created_at.isoformat(),
-                        'modified': slide.modified_at.isoformat()
+                        'modified': record['last_modified']
                     }
                 }
+            else:
+                slides_data[str(record['slide_id'])] = {
+                    'slide_id': record['slide_id'],
+                    'title': record['title'],
+                    'content': record['content'],
+                    'layout': config_data.get('layout', 'text'),
+                    'config_data': config_data,
+                    'canvas_elements': config_data.get('canvas_elements', []),
+                    'slide_width': config_data.get('slide_width', 1920),
+                    'slide_height': config_data.get('slide_height', 1080),
+                    'modified_at': record['last_modified']
+                }
             
-            # Präsentations-Metadaten (YAML-freundlich)
-            presentation_data = {
+            if task is not None and index % 50 == 0:
+                task.report(index, total, "Folien werden vorbereitet")
+        
+        # Präsentations-Metadaten
+        metadata = self.build_metadata(file_format, len(slides_data))
+        settings = dict(DEFAULT_SETTINGS)
+        
+        if file_format == 'yaml':
+            # YAML-freundlich verschachtelt
+            return {
                 'presentation': {
-                    'metadata': {
-                        'title': 'BumbleB Präsentation',
-                        'description': 'Automatisierte Shuttle-Präsentation',
-                        'created_at': datetime.now().isoformat(),
-                        'version': '1.0',
-                        'total_slides': len(slides_data),
-                        'format': 'yaml'
-                    },
-                    'settings': {
-                        'slide_duration': 5,
-                        'loop_mode': True,
-                        'auto_start': False
-                    }
+                    'metadata': metadata,
+                    'settings': settings
                 },
                 'slides': slides_data
             }
-            
-            # Dateiname bestimmen
-            if not filename:
-                filename = filedialog.asksaveasfilename(
-                    title="Präsentation speichern (YAML)",
-                    defaultextension=".yaml",
-                    filetypes=[
-                        ("YAML-Dateien", "*.yaml"),
-                        ("YML-Dateien", "*.yml"),
-                        ("Alle Dateien", "*.*")
-                    ],
-                    initialdir=self.presentations_dir,
-                    initialname=f"bumbleb_presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yaml"
+        
+        return {
+            'metadata': metadata,
+            'settings': settings,
+            'slides': slides_data
+        }
+    
+    def write_presentation_file(self, filename, presentation_data, file_format, task=None):
+        """Serialisiert und schreibt die Präsentation atomar (temporäre Datei, fsync, Ersetzen)"""
+        if file_format == 'yaml':
+            text = yaml_dump(presentation_data, default_flow_style=False, allow_unicode=True, indent=2)
+        else:
+            text = json.dumps(presentation_data, indent=2, ensure_ascii=False)
+        
+        with atomic_open(filename) as f:
+            f.write(text)
+            # Abbruch während des Serialisierens: Zieldatei bleibt unverändert
+            if task is not None:
+                task.check_cancelled()
+    
+    @perf_events.timed("presentation.export")
+    def export_presentation(self, filename, file_format=None):
+        """Exportiert die aktuelle Präsentation; das Format folgt sonst der Dateiendung"""
+        file_format = file_format or get_presentation_format(filename)
+        try:
+            if file_format == 'bundle':
+                total_slides = write_bundle(
+                    filename,
+                    content_manager.get_all_slides(),
+                    self.build_metadata(file_format, content_manager.get_slide_count()),
+                    DEFAULT_SETTINGS
                 )
+            else:
+                presentation_data = self.build_presentation_data(self.snapshot_slide_records(), file_format)
+                self.write_presentation_file(filename, presentation_data, file_format)
+                self.export_assets(filename)
+                total_slides = len(presentation_data['slides'])
+        except Exception as e:
+            logger.error(f"Fehler beim {file_format.upper()}-Export: {e}")
+            raise PresentationError(f"Präsentation konnte nicht gespeichert werden: {e}") from e
+        
+        logger.info(f"Präsentation als {file_format.upper()} gespeichert: {filename} ({total_slides} Folien)")
+        return total_slides
+    
+    def export_presentation_as_json(self, filename):
+        """Exportiert die aktuelle Präsentation als JSON"""
+        return self.export_presentation(filename, 'json')
+    
+    def export_presentation_as_yaml(self, filename):
+        """Exportiert die aktuelle Präsentation als YAML"""
+        return self.export_presentation(filename, 'yaml')
+    
+    def export_presentation_as_bundle(self, filename):
+        """Exportiert die aktuelle Präsentation als Bundle (Slides + Assets in einer Datei)"""
+        return self.export_presentation(filename, 'bundle')
+    
+    def export_presentation_async(self, root, filename, file_format=None, on_progress=None, on_done=None):
+        """Exportiert im Hintergrund; nur der Snapshot der Slides läuft im Aufrufer-Thread
+        
+        on_done erhält ein TaskResult mit dem Dateinamen als value.
+        """
+        file_format = file_format or get_presentation_format(filename)
+        records = self.snapshot_slide_records()
+        refs = content_manager.get_asset_refs()
+        
+        if file_format == 'bundle':
+            # Eigene SlideData-Kopien - der Worker fasst den ContentManager nicht an
+            slides = {record['slide_id']: SlideData.from_dict(record) for record in records}
+            metadata = self.build_metadata(file_format, len(slides))
             
-            if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    yaml.dump(presentation_data, f, default_flow_style=False, allow_unicode=True, indent=2)
-                
-                logger.info(f"Präsentation als YAML gespeichert: {filename}")
-                messagebox.showinfo(
-                    "Export erfolgreich", 
-                    f"Präsentation wurde erfolgreich gespeichert:\n{os.path.basename(filename)}\n\n"
-                    f"Folien: {len(slides_data)}\n"
-                    f"Format: YAML"
-                )
+            def work(task):
+                write_bundle(filename, slides, metadata, DEFAULT_SETTINGS, task=task)
                 return filename
             
+            return presentation_worker.submit(root, "export-bundle", work, on_progress, on_done)
+        
+        def work(task):
+            presentation_data = self.build_presentation_data(records, file_format, task)
+            task.report(len(records), len(records), "Datei wird geschrieben")
+            self.write_presentation_file(filename, presentation_data, file_format, task)
+            self.export_assets(filename, refs)
+            logger.info(f"Präsentation als {file_format.upper()} gespeichert: {filename}")
+            return filename
+        
+        return presentation_worker.submit(root, f"export-{file_format}", work, on_progress, on_done)
+    
+    def export_assets(self, filename, refs=None):
+        """Kopiert die verwendeten Assets neben die Export-Datei (nur fehlende Blobs)"""
+        if refs is None:
+            refs = content_manager.get_asset_refs()
+        if not refs:
+            return 0
+        
+        target_root = os.path.join(os.path.dirname(os.path.abspath(filename)), "assets")
+        copied = asset_store.copy_missing_to(target_root, refs)
+        logger.info(f"{copied} von {len(refs)} Assets exportiert nach {target_root}")
+        return copied
+    
+    def read_presentation_data(self, filename):
+        """Liest und validiert eine JSON/YAML-Präsentation (geparst über den Sidecar-Cache)"""
+        if not os.path.exists(filename):
+            raise PresentationError(f"Datei nicht gefunden: {filename}")
+        
+        try:
+            data = parse_cache.load(filename)
         except Exception as e:
-            logger.error(f"Fehler beim YAML-Export: {e}")
-            messagebox.showerror("Export-Fehler", f"Präsentation konnte nicht gespeichert werden:\n{e}")
+            raise PresentationError(f"Datei konnte nicht gelesen werden: {e}") from e
+        
+        if not isinstance(data, dict) or not self.validate_presentation_data(data):
+            raise PresentationError("Ungültige Präsentationsstruktur")
+        return data
+    
+    def load_presentation_from_file(self, filename, merge=False):
+        """Lädt eine Präsentation (JSON, YAML oder Bundle) und gibt ein LoadResult zurück"""
+        file_format = get_presentation_format(filename)
+        
+        if file_format == 'bundle':
+            return self.load_presentation_bundle(filename, merge)
         
-        return None
+        data = self.read_presentation_data(filename)
+        imported_count, errors = self.import_slides_from_data(data, merge)
+        self.current_presentation = filename
+        
+        logger.info(f"Präsentation geladen: {filename}")
+        return LoadResult(filename, file_format, imported_count, errors)
     
-    def load_presentation_from_file(self, filename=None):
-        """Lädt eine Präsentation aus einer JSON/YAML-Datei"""
+    def load_presentation_bundle(self, filename, merge=False):
+        """Öffnet ein Bundle - nur das Manifest wird gelesen, Slides laden beim ersten Zugriff"""
+        if not os.path.exists(filename):
+            raise PresentationError(f"Datei nicht gefunden: {filename}")
+        
         try:
-            if not filename:
-                filename = filedialog.askopenfilename(
-                    title="Präsentation laden",
-                    filetypes=[
-                        ("Präsentations-Dateien", "*.json *.yaml *.yml"),
-                        ("JSON-Dateien", "*.json"),
-                        ("YAML-Dateien", "*.yaml *.yml"),
-                        ("Alle Dateien", "*.*")
-                    ],
-                    initialdir=self.presentations_dir
-                )
-            
-            if not filename or not os.path.exists(filename):
-                return False
-            
-            # Dateiformat bestimmen
-            file_ext = os.path.splitext(filename)[1].lower()
+            bundle = PresentationBundle(filename)
+        except Exception as e:
+            raise PresentationError(f"Bundle konnte nicht geöffnet werden: {e}") from e
+        
+        try:
+            slide_count = self.activate_bundle(bundle, merge)
+        except Exception:
+            bundle.close()
+            raise
+        
+        logger.info(f"Bundle geladen: {filename}")
+        return LoadResult(filename, 'bundle', slide_count, [])
+    
+    def activate_bundle(self, bundle, merge=False):
+        """Übernimmt die Slides eines geöffneten Bundles in den ContentManager"""
+        bundle.register_assets()
+        content_manager.replace_slides(bundle.lazy_slides(), merge=merge)
+        
+        # Ersetzte Bundles werden nicht mehr gebraucht
+        if not merge:
+            for previous in self.open_bundles:
+                previous.close()
+            self.open_bundles = []
+        self.open_bundles.append(bundle)
+        self.current_presentation = bundle.filepath
+        return len(bundle.get_slide_ids())
+    
+    def load_presentation_async(self, root, filename, merge=False, on_progress=None, on_done=None):
+        """Lädt im Hintergrund: Parsen und Aufbau der Slides im Worker,
+        der Austausch erfolgt danach atomar im Tk-Thread (oder bei Abbruch gar nicht).
+        
+        on_done erhält ein TaskResult mit einem LoadResult als value.
+        """
+        file_format = get_presentation_format(filename)
+        
+        def work(task):
+            task.report(0, 1, "Datei wird gelesen")
+            if file_format == 'bundle':
+                return PresentationBundle(filename)
             
-            with open(filename, 'r', encoding='utf-8') as f:
-                if file_ext == '.json':
-                    data = json.load(f)
-                elif file_ext in ['.yaml', '.yml']:
-                    data = yaml.safe_load(f)
-                else:
-                    raise ValueError(f"Unbekanntes Dateiformat: {file_ext}")
+            data = self.read_presentation_data(filename)
+            task.check_cancelled()
             
-            # Daten validieren und laden
-            if self.validate_presentation_data(data):
-                self.import_slides_from_data(data)
+            records = self.extract_slide_records(data)
+            slides = {}
+            errors = []
+            for start in range(0, len(records), self.IMPORT_CHUNK_SIZE):
+                chunk = records[start:start + self.IMPORT_CHUNK_SIZE]
+                chunk_slides, chunk_errors = content_manager.build_slides(chunk)
+                slides.update(chunk_slides)
+                errors.extend(chunk_errors)
+                task.report(start + len(chunk), len(records), "Folien werden aufgebaut")
+            return slides, errors
+        
+        def finish(result):
+            value = result.value
+            if value is not None and task.cancelled:
+                # Abbruch nach Abschluss des Workers - nichts übernehmen
+                if isinstance(value, PresentationBundle):
+                    value.close()
+                result = result._replace(value=None, cancelled=True)
+            elif isinstance(value, PresentationBundle):
+                result = result._replace(value=LoadResult(filename, file_format, self.activate_bundle(value, merge), []))
+            elif value is not None:
+                slides, errors = value
+                for error in errors:
+                    logger.error(f"Fehler beim Importieren: {error}")
+                content_manager.replace_slides(slides, merge=merge)
                 self.current_presentation = filename
-                
-                # Erfolgs-Nachricht
-                metadata = data.get('metadata', data.get('presentation', {}).get('metadata', {}))
-                total_slides = metadata.get('total_slides', 0)
-                
-                messagebox.showinfo(
-                    "Import erfolgreich", 
-                    f"Präsentation wurde erfolgreich geladen:\n{os.path.basename(filename)}\n\n"
-                    f"Folien: {total_slides}\n"
-                    f"Format: {file_ext[1:].upper()}"
-                )
-                
-                logger.info(f"Präsentation geladen: {filename}")
-                return True
+                result = result._replace(value=LoadResult(filename, file_format, len(slides), errors))
             
-        except Exception as e:
-            logger.error(f"Fehler beim Laden der Präsentation: {e}")
-            messagebox.showerror("Import-Fehler", f"Präsentation konnte nicht geladen werden:\n{e}")
+            if result.value is not None:
+                logger.info(f"Präsentation geladen: {filename} ({result.value.slide_count} Folien)")
+            if on_done:
+                on_done(result)
         
-        return False
+        task = presentation_worker.submit(root, "load", work, on_progress, finish)
+        return task
     
     def validate_presentation_data(self, data):
         """Validiert die Struktur der Präsentationsdaten"""
@@ -247,97 +377,62 @@ class PresentationManager:
             logger.error(f"Fehler bei der Datenvalidierung: {e}")
             return False
     
-    def import_slides_from_data(self, data):
-        """Importiert Slides aus den Präsentationsdaten"""
-        try:
-            # Format bestimmen und Slides extrahieren
-            if 'slides' in data and 'metadata' in data:
-                # JSON-Format
-                slides_data = data['slides']
-                settings = data.get('settings', {})
-            else:
-                # YAML-Format
-                slides_data = data['slides']
-                settings = data.get('presentation', {}).get('settings', {})
-            
-            # Bestehende Slides löschen (nach Bestätigung)
-            if content_manager.get_slide_count() > 0:
-                result = messagebox.askyesno(
-                    "Bestehende Folien", 
-                    "Sollen die bestehenden Folien überschrieben werden?\n\n"
-                    "Ja = Alle bestehenden Folien löschen und neue laden\n"
-                    "Nein = Neue Folien zu bestehenden hinzufügen"
-                )
-                
-                if result:
-                    # Alle bestehenden Slides löschen
-                    for slide_id in list(content_manager.slides.keys()):
-                        content_manager.delete_slide(slide_id)
-            
-            # Neue Slides importieren
-            imported_count = 0
-            for slide_key, slide_data in slides_data.items():
-                try:
-                    # Slide-ID extrahieren
-                    if isinstance(slide_data, dict):
-                        slide_id = slide_data.get('slide_id', slide_data.get('id', 1))
-                        title = slide_data.get('title', f'Slide {slide_id}')
-                        content = slide_data.get('content', '')
-                        layout = slide_data.get('layout', 'text')
-                        config_data = slide_data.get('config_data', slide_data.get('config', {}))
-                        
-                        # Canvas-Elemente und Dimensionen
-                        canvas_elements = slide_data.get('canvas_elements', [])
-                        slide_width = slide_data.get('slide_width', slide_data.get('slide_dimensions', {}).get('width', 1920))
-                        slide_height = slide_data.get('slide_height', slide_data.get('slide_dimensions', {}).get('height', 1080))
-                        
-                        # Slide erstellen oder aktualisieren
-                        if content_manager.create_slide(slide_id, title, content, layout):
-                            # Config-Daten mit Canvas-Elementen aktualisieren
-                            slide = content_manager.get_slide(slide_id)
-                            if slide:
-                                slide.config_data.update(config_data)
-                                slide.config_data['canvas_elements'] = canvas_elements
-                                slide.config_data['slide_width'] = slide_width
-                                slide.config_data['slide_height'] = slide_height
-                                content_manager.save_slide(slide_id)
-                            
-                            imported_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Fehler beim Importieren von Slide {slide_key}: {e}")
+    def extract_slide_records(self, data):
+        """Normalisiert die Slides aus JSON- oder YAML-Format zu ContentManager-Records"""
+        records = []
+        
+        for slide_key, slide_data in data.get('slides', {}).items():
+            if not isinstance(slide_data, dict):
+                logger.error(f"Ungültige Slide-Daten für {slide_key}")
+                continue
             
-            logger.info(f"{imported_count} Slides erfolgreich importiert")
+            slide_id = slide_data.get('slide_id', slide_data.get('id', 1))
+            config_data = dict(slide_data.get('config_data', slide_data.get('config', {})) or {})
             
-            # Demo-Service über neue Slides informieren
-            from services.demo import demo_service
-            demo_service.reset_to_first_slide()
+            # Canvas-Elemente, Layout und Dimensionen
+            dimensions = slide_data.get('slide_dimensions', {})
+            config_data['layout'] = slide_data.get('layout', config_data.get('layout', 'text'))
+            config_data['canvas_elements'] = slide_data.get('canvas_elements', config_data.get('canvas_elements', []))
+            config_data['slide_width'] = slide_data.get('slide_width', dimensions.get('width', 1920))
+            config_data['slide_height'] = slide_data.get('slide_height', dimensions.get('height', 1080))
             
-        except Exception as e:
-            logger.error(f"Fehler beim Importieren der Slides: {e}")
-            raise
+            records.append({
+                'slide_id': slide_id,
+                'title': slide_data.get('title', f'Slide {slide_id}'),
+                'content': slide_data.get('content', ''),
+                'config_data': config_data,
+                'last_modified': slide_data.get('modified_at', slide_data.get('timestamps', {}).get('modified'))
+            })
+        
+        return records
     
-    def get_available_presentations(self):
-        """Gibt eine Liste verfügbarer Präsentationen zurück"""
-        presentations = []
+    def import_slides_from_data(self, data, merge=False):
+        """Importiert Slides aus den Präsentationsdaten in einem Schritt
         
-        try:
-            if os.path.exists(self.presentations_dir):
-                for filename in os.listdir(self.presentations_dir):
-                    if filename.endswith(('.json', '.yaml', '.yml')):
-                        filepath = os.path.join(self.presentations_dir, filename)
-                        stat = os.stat(filepath)
-                        presentations.append({
-                            'filename': filename,
-                            'filepath': filepath,
-                            'size': stat.st_size,
-                            'modified': datetime.fromtimestamp(stat.st_mtime)
-                        })
+        Gibt (imported_count, errors) zurück.
+        """
+        records = self.extract_slide_records(data)
         
+        # Validieren, aufbauen und atomar austauschen - genau ein Reload-Event
+        imported_count, errors = content_manager.bulk_import(records, merge=merge)
+        
+        for error in errors:
+            logger.error(f"Fehler beim Importieren: {error}")
+        
+        logger.info(f"{imported_count} Slides erfolgreich importiert")
+        return imported_count, errors
+    
+    def get_available_presentations(self, refresh=True):
+        """Gibt eine Liste verfügbarer Präsentationen zurück (mit Titel und Folienanzahl)
+        
+        Die Metadaten kommen aus dem persistenten Bibliotheks-Index; nur seit dem
+        letzten Aufruf geänderte Dateien werden neu gelesen.
+        """
+        try:
+            return self.library.get_entries(refresh=refresh)
         except Exception as e:
             logger.error(f"Fehler beim Auflisten der Präsentationen: {e}")
-        
-        return sorted(presentations, key=lambda x: x['modified'], reverse=True)
+            return []
 
 # Globale Presentation-Manager Instanz
-presentation_manager = PresentationManager()
\ No newline at end of file
+presentation_manager = PresentationManager()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Slide Search für Dynamic Messe Stand V4
+Invertierter Volltext-Index über Titel, Inhalt und Canvas-Texte
+"""
+
+import re
+import math
+from bisect import bisect_left, insort
+from collections import namedtuple
+from core.logger import logger
+from models.content import content_manager
+
+# Ergebnis einer Suche
+SearchResult = namedtuple('SearchResult', ['source', 'slide_id', 'title', 'score'])
+
+# Quelle für die Slides im ContentManager
+CURRENT_SOURCE = 'current'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+def tokenize(text):
+    """Zerlegt Text in normalisierte Suchbegriffe"""
+    if not text:
+        return []
+    return [token for token in _TOKEN_RE.findall(text.casefold()) if len(token) > 1]
+
+class SlideSearchIndex:
+    """Invertierter Index mit Präfix-Suche und gewichteter Rangfolge"""
+
+    # Gewichtung der Felder bei der Rangfolge
+    FIELD_WEIGHTS = {
+        'title': 3.0,
+        'canvas': 1.5,
+        'content': 1.0
+    }
+
+    # Maximale Anzahl von Tokens, auf die ein Präfix expandiert wird
+    MAX_PREFIX_EXPANSION = 256
+
+    def __init__(self):
+        self._postings = {}     # token -> {doc_key: gewichtete Häufigkeit}
+        self._doc_tokens = {}   # doc_key -> Tokens des Dokuments (für Updates)
+        self._titles = {}       # doc_key -> Titel für die Ergebnisanzeige
+        self._vocabulary = []   # sortierte Tokens für Präfix-Abfragen
+        self._lazy = {}         # doc_key -> noch nicht geladene Slide (nur Titel indiziert)
+        self._manager = None
+
+    def __len__(self):
+        return len(self._doc_tokens)
+
+    def index_document(self, source, slide_id, title="", content="", canvas_texts=()):
+        """Indiziert (oder aktualisiert) eine einzelne Slide"""
+        doc_key = (source, slide_id)
+        self.remove_document(source, slide_id)
+
+        weights = {}
+        fields = (
+            ('title', title),
+            ('content', content),
+            ('canvas', ' '.join(text for text in canvas_texts if text))
+        )
+        for field, text in fields:
+            field_weight = self.FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                weights[token] = weights.get(token, 0.0) + field_weight
+
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                insort(self._vocabulary, token)
+            postings[doc_key] = weight
+
+        self._doc_tokens[doc_key] = tuple(weights)
+        self._titles[doc_key] = title
+
+    def index_slide(self, slide, source=CURRENT_SOURCE):
+        """Indiziert ein SlideData-Objekt inklusive Canvas-Texten"""
+        if not slide.is_loaded:
+            # Lazy Slide (Bundle): nur den Titel indizieren, ohne sie zu dekodieren
+            self.index_document(source, slide.slide_id, slide.title)
+            self._lazy[(source, slide.slide_id)] = slide
+            return
+        canvas_texts = [element.text for element in slide.canvas_elements if element.text]
+        self.index_document(source, slide.slide_id, slide.title, slide.content, canvas_texts)
+
+    def index_records(self, source, records):
+        """Indiziert ContentManager-Records (z.B. aus einer Präsentationsdatei)"""
+        self.clear_source(source)
+        slides, errors = content_manager.build_slides(records, intern_assets=False)
+        for slide in slides.values():
+            self.index_slide(slide, source)
+        return len(slides)
+
+    def remove_document(self, source, slide_id):
+        """Entfernt eine Slide aus dem Index"""
+        doc_key = (source, slide_id)
+        self._lazy.pop(doc_key, None)
+        tokens = self._doc_tokens.pop(doc_key, None)
+        if tokens is None:
+            return False
+
+        self._titles.pop(doc_key, None)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_key, None)
+            if not postings:
+                del self._postings[token]
+                position = bisect_left(self._vocabulary, token)
+                if position < len(self._vocabulary) and self._vocabulary[position] == token:
+                    del self._vocabulary[position]
+        return True
+
+    def clear_source(self, source):
+        """Entfernt alle Slides einer Quelle"""
+        for doc_key in [key for key in self._doc_tokens if key[0] == source]:
+            self.remove_document(*doc_key)
+
+    def _refresh_loaded(self):
+        """Indiziert Lazy Slides vollständig, die inzwischen geladen wurden"""
+        for (source, _), slide in [item for item in self._lazy.items() if item[1].is_loaded]:
+            self.index_slide(slide, source)
+
+    def _expand(self, term, prefix):
+        """Liefert (token, Faktor) für einen Suchbegriff - exakt und per Präfix"""
+        matches = []
+        if term in self._postings:
+            matches.append((term, 1.0))
+
+        if prefix:
+            position = bisect_left(self._vocabulary, term)
+            vocabulary = self._vocabulary
+            end = min(len(vocabulary), position + self.MAX_PREFIX_EXPANSION)
+            for index in range(position, end):
+                token = vocabulary[index]
+                if not token.startswith(term):
+                    break
+                if token != term:
+                    # Kürzere Ergänzungen sind relevanter als lange
+                    matches.append((token, 0.5 * len(term) / len(token)))
+
+        return matches
+
+    def search(self, query, limit=20, source=None, prefix=True):
+        """Sucht Slides, bei denen jeder Begriff (bzw. Präfix) vorkommt"""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        self._refresh_loaded()
+
+        total_docs = len(self._doc_tokens) or 1
+        scores = None
+
+        for term in terms:
+            term_scores = {}
+            for token, factor in self._expand(term, prefix):
+                postings = self._postings[token]
+                idf = math.log(1.0 + total_docs / len(postings))
+                for doc_key, weight in postings.items():
+                    if source is not None and doc_key[0] != source:
+                        continue
+                    score = weight * idf * factor
+                    if score > term_scores.get(doc_key, 0.0):
+                        term_scores[doc_key] = score
+
+            # UND-Verknüpfung: nur Dokumente, die alle Begriffe enthalten
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {key: scores[key] + value for key, value in term_scores.items() if key in scores}
+
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0][0], item[0][1]))
+        return [
+            SearchResult(doc_key[0], doc_key[1], self._titles.get(doc_key, ''), score)
+            for doc_key, score in ranked[:limit]
+        ]
+
+    def attach(self, manager):
+        """Hält den Index über die ContentManager-Events aktuell"""
+        self._manager = manager
+        self.rebuild_current()
+        manager.add_observer(self.on_content_changed)
+
+    def rebuild_current(self):
+        """Indiziert alle Slides des ContentManagers neu"""
+        if self._manager is None:
+            return
+        self.clear_source(CURRENT_SOURCE)
+        for slide in list(self._manager.slides.values()):
+            self.index_slide(slide)
+
+    def on_content_changed(self, slide_id, slide_data, action='update'):
+        """Observer für ContentManager - inkrementelle Aktualisierung"""
+        try:
+            if action == 'delete':
+                self.remove_document(CURRENT_SOURCE, slide_id)
+            elif action == 'reload':
+                self.rebuild_current()
+            elif slide_data is not None:
+                self.index_slide(slide_data)
+        except Exception as e:
+            logger.error(f"Fehler beim Aktualisieren des Suchindex: {e}")
+
+    def index_presentation_file(self, filepath):
+        """Indiziert eine Präsentationsdatei als eigene Quelle"""
+        try:
+            from models.presentation import presentation_manager
+
+            data = presentation_manager.read_presentation_data(filepath)
+            return self.index_records(filepath, presentation_manager.extract_slide_records(data))
+        except Exception as e:
+            logger.error(f"Fehler beim Indizieren von {filepath}: {e}")
+            return 0
+
+# Globaler Suchindex, synchron mit dem ContentManager
+slide_search_index = SlideSearchIndex()
+slide_search_index.attach(content_manager)
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Dynamic Messe Stand V4 - Präsentations-Werkzeug
+Stapelverarbeitung (Konvertieren, Validieren, Vorschaubilder) ohne GUI
+"""
+import sys
+import os
+import time
+import logging
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+# Pfad für Imports hinzufügen
+sys.path.insert(0, os.path.dirname(__file__))
+from core.logger import logger
+
+# Ergebnis einer einzelnen Datei (status: 'ok', 'failed' oder 'skipped')
+BatchResult = namedtuple('BatchResult', ['filepath', 'status', 'message', 'seconds'])
+
+PRESENTATION_EXTENSIONS = ('.json', '.yaml', '.yml', '.dmsz')
+
+# Zielformate und ihre Dateiendungen
+TARGET_EXTENSIONS = {
+    'json': '.json',
+    'yaml': '.yaml',
+    'bundle': '.dmsz'
+}
+
+def find_presentations(paths, recursive=False):
+    """Sammelt Präsentationsdateien aus Dateien und Verzeichnissen"""
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        if not os.path.isdir(path):
+            logger.warning(f"Pfad nicht gefunden: {path}")
+            continue
+
+        if recursive:
+            for directory, _, names in os.walk(path):
+                files.extend(os.path.join(directory, name) for name in names
+                             if name.lower().endswith(PRESENTATION_EXTENSIONS))
+        else:
+            files.extend(entry.path for entry in os.scandir(path)
+                         if entry.is_file() and entry.name.lower().endswith(PRESENTATION_EXTENSIONS))
+    return sorted(files)
+
+def read_slide_records(filepath):
+    """Liest eine Präsentation als ContentManager-Records"""
+    from models.presentation import presentation_manager
+
+    if filepath.lower().endswith('.dmsz'):
+        from models.bundle import PresentationBundle
+        with PresentationBundle(filepath) as bundle:
+            return list(bundle.iter_records())
+
+    return presentation_manager.extract_slide_records(presentation_manager.read_presentation_data(filepath))
+
+def _timed(filepath, func):
+    """Führt func(filepath) aus und verpackt Ergebnis oder Fehler als BatchResult"""
+    start = time.perf_counter()
+    try:
+        status, message = func(filepath)
+    except Exception as e:
+        status, message = 'failed', str(e)
+    return BatchResult(filepath, status, message, time.perf_counter() - start)
+
+def validate_file(filepath):
+    """Prüft Struktur und Slide-Records einer Datei"""
+    def run(filepath):
+        from models.content import ContentManager
+
+        records = read_slide_records(filepath)
+        # Nur prüfen - keine Bilder ins Asset-Store übernehmen
+        slides, errors = ContentManager.build_slides(records, intern_assets=False)
+        if errors:
+            return 'failed', f"{len(errors)} ungültige Folien: {errors[0]}"
+        return 'ok', f"{len(slides)} Folien"
+    return _timed(filepath, run)
+
+def output_paths(files, extension, output_dir=None):
+    """Bestimmt eine eindeutige Ausgabedatei je Quelldatei (ohne output_dir neben der Quelle)
+
+    Würden mehrere Quellen dieselbe Ausgabedatei erzeugen (z.B. deck.json und
+    deck.yaml), erhält der Name die Quell-Endung als Suffix; bleibt er dann noch
+    doppelt (gleichnamige Dateien aus verschiedenen Ordnern), zusätzlich eine Nummer.
+    Eine Quelle, die selbst schon die Ausgabedatei ist, behält ihren Namen.
+    """
+    planned = {}
+    for filepath in files:
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        path = os.path.join(output_dir or os.path.dirname(filepath), stem + extension)
+        planned.setdefault(os.path.abspath(path), []).append(filepath)
+
+    # Eindeutige Namen und Quellen im Zielformat haben Vorrang - Suffixe dürfen sie nicht überschreiben
+    targets = {}
+    for path, sources in planned.items():
+        for filepath in sources:
+            if len(sources) == 1 or os.path.abspath(filepath) == path:
+                targets[filepath] = path
+    used = set(targets.values())
+
+    for path, sources in planned.items():
+        for filepath in sources:
+            if filepath in targets:
+                continue
+            stem, source_ext = os.path.splitext(path)[0], os.path.splitext(filepath)[1]
+            base = f"{stem}_{source_ext.lstrip('.').lower()}"
+            candidate, number = base + extension, 2
+            while candidate in used:
+                candidate, number = f"{base}_{number}{extension}", number + 1
+            used.add(candidate)
+            targets[filepath] = candidate
+    return targets
+
+def conversion_targets(files, target, output_dir=None):
+    """Ausgabedatei je Quelldatei für das Zielformat (Quellen im Zielformat: Ziel = Quelle, wird übersprungen)"""
+    return output_paths(files, TARGET_EXTENSIONS[target], output_dir)
+
+def convert_file(filepath, target, output_path):
+    """Konvertiert eine Datei in das Zielformat (json, yaml oder bundle)"""
+    def run(filepath):
+        from models.content import ContentManager
+        from models.presentation import presentation_manager
+
+        if os.path.abspath(output_path) == os.path.abspath(filepath):
+            return 'skipped', "bereits im Zielformat"
+        name = os.path.splitext(os.path.basename(filepath))[0]
+
+        records = read_slide_records(filepath)
+        if target == 'bundle':
+            from models.bundle import write_bundle
+            slides, errors = ContentManager.build_slides(records)
+            if errors:
+                return 'failed', f"{len(errors)} ungültige Folien: {errors[0]}"
+            write_bundle(output_path, slides, {'title': name, 'format': 'bundle'})
+        else:
+            for record in records:
+                record['last_modified'] = record.get('last_modified') or ''
+            data = presentation_manager.build_presentation_data(records, target)
+            presentation_manager.write_presentation_file(output_path, data, target)
+        return 'ok', f"{len(records)} Folien -> {output_path}"
+    return _timed(filepath, run)
+
+def thumbnail_file(filepath, output_path, size):
+    """Erstellt ein Vorschaubild der ersten Folie (benötigt Pillow)"""
+    def run(filepath):
+        try:
+            from PIL import Image, ImageDraw
+        except ImportError:
+            return 'skipped', "Pillow nicht installiert"
+
+        records = read_slide_records(filepath)
+        if not records:
+            return 'skipped', "keine Folien"
+        first = min(records, key=lambda record: int(record.get('slide_id', 0)))
+
+        width, height = size
+        from models.content import SlideData
+        slide = SlideData.from_dict(first)
+        if slide.display_list:
+            # Gespeichertes Creator-Layout wie in der Demo wiedergeben
+            from ui.components.slide_renderer import SlideRenderer
+            from ui.components.slide_bitmap_cache import rasterize_layout
+            slide_data = {'title': slide.title, 'content': slide.content, 'display_list': slide.display_list}
+            image = rasterize_layout(SlideRenderer.layout_slide(slide_data, width, height), width, height, '#1a1a1a')
+        else:
+            image = Image.new('RGB', (width, height), '#1a1a1a')
+            draw = ImageDraw.Draw(image)
+            margin = max(4, width // 20)
+            draw.text((margin, margin), str(first.get('title', '')), fill='#ffffff')
+
+            y = margin * 3
+            for line in str(first.get('content', '')).split('\n'):
+                line = line.strip()
+                if not line:
+                    continue
+                if y > height - margin:
+                    break
+                draw.text((margin, y), line, fill='#b0b0b0')
+                y += margin
+
+        image.save(output_path)
+        return 'ok', output_path
+    return _timed(filepath, run)
+
+def print_latency_report(stats, width=40):
+    """Gibt Latenz-Statistik und Histogramm je Event-Typ aus"""
+    for name in sorted(stats):
+        entry = stats[name]
+        print(f"\n⏱️ {name}: {entry['count']} Events - p50 {entry['p50']:.1f} ms, p90 {entry['p90']:.1f} ms, "
+              f"p99 {entry['p99']:.1f} ms, max {entry['max']:.1f} ms, Mittel {entry['mean']:.1f} ms")
+        largest = max(count for _, count in entry['buckets']) or 1
+        for bound, count in entry['buckets']:
+            if not count:
+                continue
+            label = f"≤ {bound} ms" if bound is not None else f"> {entry['buckets'][-2][0]} ms"
+            bar = '█' * max(1, round(count / largest * width))
+            print(f"  {label:>10} {bar} {count}")
+
+def analyze_perf(paths, day=None):
+    """Analysiert Performance-Events (Standard: logs/perf_events_*) und gibt Histogramme aus"""
+    from core.perf import find_event_logs, iter_events, latency_histograms
+
+    files = []
+    for path in paths:
+        files.extend(find_event_logs(path, day) if os.path.isdir(path) else [path])
+    if not paths:
+        files = find_event_logs(day=day)
+    if not files:
+        print("Keine Performance-Event-Dateien gefunden")
+        return 1
+
+    stats = latency_histograms(iter_events(files))
+    print(f"📈 {len(files)} Dateien, {sum(entry['count'] for entry in stats.values())} Events mit Dauer")
+    print_latency_report(stats)
+    return 0
+
+def _init_worker(verbose):
+    """Initialisiert einen Worker-Prozess (Konsolen-Logging nur mit --verbose)"""
+    if not verbose:
+        logger.logger.setLevel(logging.WARNING)
+
+def run_batch(files, func, args, jobs, verbose=False):
+    """Verteilt die Dateien auf einen Prozess-Pool und gibt Ergebnisse sofort aus
+
+    args ist ein Tupel gemeinsamer Argumente oder ein Dict {filepath: Tupel}.
+    """
+    counts = {'ok': 0, 'failed': 0, 'skipped': 0}
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(verbose,)) as executor:
+        futures = [
+            executor.submit(func, filepath, *(args[filepath] if isinstance(args, dict) else args))
+            for filepath in files
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            counts[result.status] += 1
+            marker = {'ok': '✅', 'failed': '❌', 'skipped': '⏭️'}[result.status]
+            print(f"{marker} {result.filepath} ({result.seconds * 1000:.0f} ms): {result.message}", flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n📊 {len(files)} Dateien in {elapsed:.2f} s - "
+          f"{counts['ok']} ok, {counts['failed']} fehlgeschlagen, {counts['skipped']} übersprungen")
+    return counts
+
+def main():
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Dynamic Messe Stand V4 - Präsentations-Werkzeug')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Anzahl paralleler Prozesse (Standard: Anzahl CPU-Kerne)')
+    parser.add_argument('--recursive', '-r', action='store_true', help='Verzeichnisse rekursiv durchsuchen')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log-Ausgaben der Worker anzeigen')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    validate_parser = subparsers.add_parser('validate', help='Präsentationen validieren')
+    validate_parser.add_argument('paths', nargs='+', help='Dateien oder Verzeichnisse')
+
+    convert_parser = subparsers.add_parser('convert', help='Präsentationen konvertieren')
+    convert_parser.add_argument('paths', nargs='+', help='Dateien oder Verzeichnisse')
+    convert_parser.add_argument('--to', required=True, choices=sorted(TARGET_EXTENSIONS), help='Zielformat')
+    convert_parser.add_argument('--output', '-o', help='Ausgabeverzeichnis (Standard: neben der Quelldatei)')
+
+    thumbnail_parser = subparsers.add_parser('thumbnails', help='Vorschaubilder erzeugen (Pillow)')
+    thumbnail_parser.add_argument('paths', nargs='+', help='Dateien oder Verzeichnisse')
+    thumbnail_parser.add_argument('--output', '-o', default=os.path.join('presentations', 'thumbnails'),
+                                  help='Ausgabeverzeichnis')
+    thumbnail_parser.add_argument('--size', default='320x180', help='Größe BREITExHÖHE (Standard: 320x180)')
+
+    perf_parser = subparsers.add_parser('perf', help='Latenz-Histogramme aus Performance-Events')
+    perf_parser.add_argument('paths', nargs='*', help='Event-Dateien oder Verzeichnisse (Standard: logs/)')
+    perf_parser.add_argument('--day', help='Nur Events eines Tages (JJJJMMTT)')
+
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logger.logger.setLevel(logging.WARNING)
+
+    if args.command == 'perf':
+        return analyze_perf(args.paths, args.day)
+
+    files = find_presentations(args.paths, args.recursive)
+    if not files:
+        print("Keine Präsentationsdateien gefunden")
+        return 1
+
+    if args.command == 'validate':
+        counts = run_batch(files, validate_file, (), args.jobs, args.verbose)
+
+    elif args.command == 'convert':
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+        targets = conversion_targets(files, args.to, args.output)
+        counts = run_batch(files, convert_file,
+                           {filepath: (args.to, targets[filepath]) for filepath in files},
+                           args.jobs, args.verbose)
+
+    else:
+        try:
+            width, height = (int(value) for value in args.size.lower().split('x'))
+        except ValueError:
+            parser.error(f"Ungültige Größe: {args.size}")
+        os.makedirs(args.output, exist_ok=True)
+        # Eindeutige Namen - deck.json und deck.yaml laufen parallel und würden sonst dieselbe PNG schreiben
+        targets = output_paths(files, '.png', args.output)
+        counts = run_batch(files, thumbnail_file,
+                           {filepath: (targets[filepath], (width, height)) for filepath in files},
+                           args.jobs, args.verbose)
+
+    return 1 if counts['failed'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
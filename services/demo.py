@@ -157,7 +157,7 @@ class DemoService:
             if giga and giga.status == "connected":
                 giga.send_udp_signal("192.168.1.100", f"page_{slide_id}", 1)
             
-            logger.debug(f"Slide-Signal gesendet: page_{slide_id}")
+            logger.debug("Slide-Signal gesendet: page_%s", slide_id)
             
         except Exception as e:
             logger.error(f"Fehler beim Senden des Slide-Signals: {e}")
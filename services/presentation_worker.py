@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Presentation Worker für Dynamic Messe Stand V4
+Hintergrund-Ausführung von Import/Export mit Fortschritt und Abbruch
+"""
+
+import queue
+import threading
+from collections import namedtuple
+from core.logger import logger
+
+# Fortschritt eines Auftrags (done/total in Schritten)
+TaskProgress = namedtuple('TaskProgress', ['name', 'done', 'total', 'message'])
+
+# Endergebnis eines Auftrags - genau eines von value/error/cancelled ist gesetzt
+TaskResult = namedtuple('TaskResult', ['name', 'value', 'error', 'cancelled'])
+
+class TaskCancelled(Exception):
+    """Wird im Worker-Thread ausgelöst, wenn der Auftrag abgebrochen wurde"""
+    pass
+
+class PresentationTask:
+    """Ein Hintergrund-Auftrag; Events werden nur im Tk-Thread zugestellt"""
+
+    def __init__(self, name, work, on_progress=None, on_done=None):
+        self.name = name
+        self.work = work
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.result = None
+        self._cancel_event = threading.Event()
+        self._events = queue.Queue()
+        self._last_progress = None
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self):
+        return self.result is not None
+
+    def cancel(self):
+        """Fordert den Abbruch an - der Worker bricht beim nächsten Prüfpunkt ab"""
+        if not self.finished:
+            self._cancel_event.set()
+            logger.info(f"Abbruch angefordert: {self.name}")
+
+    def check_cancelled(self):
+        """Prüfpunkt im Worker-Thread"""
+        if self._cancel_event.is_set():
+            raise TaskCancelled(self.name)
+
+    def report(self, done, total, message=""):
+        """Meldet Fortschritt aus dem Worker-Thread (und prüft auf Abbruch)"""
+        self.check_cancelled()
+        self._events.put(TaskProgress(self.name, done, total, message))
+
+    def _run(self):
+        """Thread-Einstiegspunkt"""
+        try:
+            value = self.work(self)
+            result = TaskResult(self.name, value, None, False)
+        except TaskCancelled:
+            result = TaskResult(self.name, None, None, True)
+        except Exception as e:
+            logger.error(f"Fehler im Hintergrund-Auftrag {self.name}: {e}")
+            result = TaskResult(self.name, None, e, False)
+        self._events.put(result)
+
+    def dispatch_events(self):
+        """Stellt wartende Events zu (Tk-Thread); True, solange der Auftrag läuft"""
+        progress = None
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if isinstance(event, TaskProgress):
+                # Nur der neueste Fortschritt ist für die Anzeige relevant
+                progress = event
+                continue
+
+            if progress is not None:
+                self._deliver_progress(progress)
+            self.result = event
+            if self.on_done:
+                try:
+                    self.on_done(event)
+                except Exception as e:
+                    logger.error(f"Fehler im Ergebnis-Callback von {self.name}: {e}")
+            return False
+
+        if progress is not None:
+            self._deliver_progress(progress)
+        return True
+
+    def _deliver_progress(self, progress):
+        """Ruft den Fortschritts-Callback auf"""
+        if self.on_progress and progress != self._last_progress:
+            self._last_progress = progress
+            try:
+                self.on_progress(progress)
+            except Exception as e:
+                logger.error(f"Fehler im Fortschritts-Callback von {self.name}: {e}")
+
+class PresentationWorker:
+    """Führt Aufträge in Daemon-Threads aus und pollt deren Events über root.after"""
+
+    def __init__(self, poll_interval=50):
+        self.poll_interval = poll_interval  # Millisekunden
+        self.active_tasks = []
+
+    def submit(self, root, name, work, on_progress=None, on_done=None):
+        """Startet work(task) im Hintergrund; Callbacks laufen im Tk-Thread"""
+        task = PresentationTask(name, work, on_progress, on_done)
+        self.active_tasks.append(task)
+
+        thread = threading.Thread(target=task._run, name=f"presentation-{name}", daemon=True)
+        thread.start()
+        logger.debug(f"Hintergrund-Auftrag gestartet: {name}")
+
+        self._schedule_poll(root, task)
+        return task
+
+    def _schedule_poll(self, root, task):
+        """Plant die nächste Abfrage der Task-Events"""
+        def poll():
+            if task.dispatch_events():
+                root.after(self.poll_interval, poll)
+            elif task in self.active_tasks:
+                self.active_tasks.remove(task)
+
+        root.after(self.poll_interval, poll)
+
+    def is_busy(self):
+        """Prüft ob noch ein Auftrag läuft"""
+        return bool(self.active_tasks)
+
+    def cancel_all(self):
+        """Bricht alle laufenden Aufträge ab"""
+        for task in list(self.active_tasks):
+            task.cancel()
+
+# Globale Worker-Instanz
+presentation_worker = PresentationWorker()
@@ -0,0 +1,33 @@
+"""
+Gemeinsame Fixtures der Tests für Dynamic Messe Stand V4
+Globale Manager (Storage, Assets) werden auf tmp_path umgeleitet
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage import storage_manager
+from core.storage_backends import FileBackend
+from core.assets import asset_store
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Leeres data/-Verzeichnis für storage_manager und asset_store"""
+    data = tmp_path / "data"
+    data.mkdir()
+    monkeypatch.setattr(storage_manager, 'data_dir', str(data))
+    monkeypatch.setattr(storage_manager, 'exports_dir', str(tmp_path / "exports"))
+    monkeypatch.setattr(storage_manager, 'backend', FileBackend(str(data)))
+    monkeypatch.setattr(asset_store, 'root', str(data / "assets"))
+    monkeypatch.setattr(asset_store, 'objects_dir', str(data / "assets" / "objects"))
+    return data
+
+@pytest.fixture
+def manager(data_dir):
+    """Frischer ContentManager mit den Standard-Folien"""
+    from models.content import ContentManager
+    return ContentManager()
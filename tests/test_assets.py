@@ -0,0 +1,24 @@
+"""Tests für AssetStore (core/assets.py)"""
+
+import hashlib
+import os
+import threading
+
+from core.assets import AssetStore
+
+def _files(root):
+    return [name for _, _, names in os.walk(root) for name in names]
+
+def test_concurrent_puts_of_the_same_asset(tmp_path):
+    store = AssetStore(str(tmp_path / "assets"), cache_bytes=0)
+    data = os.urandom(256 * 1024)
+    refs = []
+    threads = [threading.Thread(target=lambda: refs.append(store.put_bytes(data))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(refs) == {f"sha256:{hashlib.sha256(data).hexdigest()}"}
+    assert store.read_bytes(refs[0]) == data
+    assert not [name for name in _files(store.root) if name.endswith('.tmp')]
@@ -0,0 +1,50 @@
+"""Tests für ContentManager (models/content.py)"""
+
+from core.storage import storage_manager
+from models.content import SlideData
+
+def _lazy_slide(slide_id):
+    def loader():
+        return {
+            'content': f"Inhalt {slide_id}",
+            'config_data': {'layout': 'text'},
+            'last_modified': '2025-01-01T12:00:00'
+        }
+    return SlideData.lazy(slide_id, f"Folie {slide_id}", loader)
+
+def test_replace_slides_keeps_lazy_slides_unloaded(manager, data_dir):
+    manager.enable_journal(str(data_dir / "slides.journal"))
+
+    manager.replace_slides({slide_id: _lazy_slide(slide_id) for slide_id in (1, 2, 3)})
+    manager.compact_journal()  # wartet auf die Kompaktierung im Hintergrund
+
+    assert all(not slide.is_loaded for slide in manager.get_all_slides().values())
+    stored = {record['slide_id']: record for record in storage_manager.load_slides()}
+    assert sorted(stored) == [1, 2, 3]
+    assert stored[2]['title'] == "Folie 2"
+    assert stored[2]['content'] == "Inhalt 2"
+    assert stored[2]['last_modified'] == '2025-01-01T12:00:00'
+
+def test_edited_lazy_slide_is_saved_with_changes(manager, data_dir):
+    manager.replace_slides({1: _lazy_slide(1)}, journal=False)
+
+    manager.update_slide_content(1, "Neu", "Geändert")
+    manager.save_to_storage()
+
+    record = storage_manager.load_slides()[0]
+    assert (record['title'], record['content']) == ("Neu", "Geändert")
+
+def test_compaction_keeps_entries_written_during_save(manager, data_dir, monkeypatch):
+    journal = manager.enable_journal(str(data_dir / "slides.journal"))
+    manager.update_slide_content(1, "Vorher", "a")
+    original_write = storage_manager.write_slides
+
+    def write_and_edit(upserts, deletes):
+        # Bearbeitung im Tk-Thread, während die Kompaktierung speichert
+        manager.update_slide_content(2, "Während", "b")
+        return original_write(upserts, deletes)
+
+    monkeypatch.setattr(storage_manager, 'write_slides', write_and_edit)
+    assert manager.compact_journal()
+
+    assert [(entry['slide_id'], entry['record']['title']) for entry in journal.read_entries()] == [(2, "Während")]
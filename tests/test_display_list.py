@@ -0,0 +1,64 @@
+"""Tests für compile_canvas_elements (models/display_list.py)"""
+
+import pytest
+
+from models.content import CanvasElement
+from models.display_list import EDITOR_SCALE, compile_canvas_elements, parse_font
+
+def _element(type, coords, widget_type='', text='', font='', fill='', outline='', width=0, tags=()):
+    return CanvasElement(type, widget_type, tuple(coords), text, font, '#000000', '',
+                         fill, outline, width, 0, '', tuple(tags), '')
+
+@pytest.mark.parametrize("value, expected", [
+    ("{Segoe UI} 28 bold", ('Segoe UI', 28, 'bold')),
+    ("Arial 12", ('Arial', 12)),
+    (('Arial', '14.0', 'italic'), ('Arial', 14, 'italic')),
+    (None, ('Segoe UI', 12)),
+])
+def test_parse_font(value, expected):
+    assert parse_font(value) == expected
+
+def test_editor_chrome_is_dropped_and_coords_are_normalized():
+    elements = [
+        # Schatten des Creators: größer als die Folie und verschoben
+        _element('rectangle', (45, 45, 1020, 600), fill='#cccccc'),
+        _element('rectangle', (40, 40, 1000, 580), fill='#ffffff', tags=('slide_background_main',)),
+        _element('rectangle', (140, 140, 240, 240), fill='#ff0000'),
+    ]
+
+    display_list = compile_canvas_elements(elements)
+
+    assert [op.op for op in display_list.ops] == ['rect', 'rect']
+    assert display_list.ops[0].coords == (0.0, 0.0, 1920.0, 1080.0)
+    assert display_list.ops[1].coords == (200.0, 200.0, 400.0, 400.0)
+    assert display_list.font_scale == pytest.approx(1.0 / EDITOR_SCALE)
+
+def test_shapes_before_text_and_duplicates_removed():
+    text = _element('text', (100, 100), text="Hallo", font="Arial 12")
+    line = _element('line', (0, 0, 10, 10), fill='#000000', width=2)
+
+    display_list = compile_canvas_elements([text, line, text, line])
+
+    assert [op.op for op in display_list.ops] == ['line', 'text']
+
+def test_text_windows_get_title_and_body_roles():
+    elements = [
+        _element('window', (50, 40), widget_type='Text', text="Titel", font="{Segoe UI} 15 bold"),
+        _element('window', (50, 120), widget_type='Text', text="Inhalt", font="{Segoe UI} 8"),
+        _element('window', (50, 300), widget_type='Text', text="Mehr", font="{Segoe UI} 8 bold"),
+    ]
+
+    ops = compile_canvas_elements(elements).ops
+
+    assert [op.role for op in ops] == ['title', 'body', 'body']
+    assert ops[0].wrap == 1920 - 2 * 50
+
+def test_image_label_keeps_its_pixel_box():
+    logo = CanvasElement('window', 'Label', (140, 140), '', '', '', '', '', '', 100, 50, '', (), 'sha256:' + 'a' * 64)
+    elements = [_element('rectangle', (40, 40, 1000, 580), fill='#ffffff', tags=('slide_background_main',)), logo]
+
+    op = compile_canvas_elements(elements).ops[-1]
+
+    assert op.op == 'image'
+    assert op.coords == (200.0, 200.0, 400.0, 300.0)
+    assert op.image == logo.image
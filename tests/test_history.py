@@ -0,0 +1,69 @@
+"""Tests für EditHistory (models/history.py)"""
+
+import pytest
+
+from models.history import EditHistory
+
+@pytest.fixture
+def history(manager):
+    history = EditHistory(merge_window=0)
+    history.attach(manager)
+    return history
+
+def _state(manager, slide_id):
+    slide = manager.get_slide(slide_id)
+    return slide.title, slide.content, dict(slide.config_data)
+
+def test_undo_redo_round_trip(manager, history):
+    original = _state(manager, 1)
+    manager.update_slide_content(1, "Titel A", "Inhalt A")
+    edited = _state(manager, 1)
+    manager.update_slide_content(1, "Titel B", "Inhalt B", {'layout': 'image'})
+    final = _state(manager, 1)
+
+    assert history.undo() == 1
+    assert _state(manager, 1) == edited
+    assert history.undo() == 1
+    assert _state(manager, 1) == original
+    assert history.undo() is None
+
+    assert history.redo() == 1
+    assert _state(manager, 1) == edited
+    assert history.redo() == 1
+    assert _state(manager, 1) == final
+    assert history.redo() is None
+
+def test_undo_restores_config_in_one_journaled_step(manager, history, data_dir):
+    journal = manager.enable_journal(str(data_dir / "slides.journal"))
+    events = []
+    manager.add_observer(lambda slide_id, slide, action='update': events.append((slide_id, action)))
+    manager.update_slide_content(2, "Layout", "Neu", {'layout': 'image'})
+    entries_before = journal.entry_count
+    events.clear()
+
+    history.undo()
+
+    assert 'layout' not in manager.get_slide(2).config_data
+    assert journal.entry_count == entries_before + 1
+    assert events == [(2, 'update')]
+    assert 2 in manager._dirty_slides
+
+def test_new_edit_discards_redo_chain(manager, history):
+    manager.update_slide_content(1, "Titel A", "Inhalt A")
+    history.undo()
+    assert history.can_redo()
+
+    manager.update_slide_content(1, "Titel C", "Inhalt C")
+
+    assert not history.can_redo()
+    assert history.get_status()['undo_entries'] == 1
+
+def test_undo_recreates_deleted_slide(manager, history):
+    original = _state(manager, 3)
+    manager.delete_slide(3)
+    assert manager.get_slide(3) is None
+
+    history.undo()
+
+    assert _state(manager, 3) == original
+    assert 3 in manager.get_slide_ids()
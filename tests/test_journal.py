@@ -0,0 +1,63 @@
+"""Tests für SlideJournal (core/journal.py)"""
+
+from core.journal import SlideJournal
+
+def _write_entries(path, count):
+    journal = SlideJournal(str(path), fsync=False)
+    journal.append_many([
+        ('upsert', slide_id, {'slide_id': slide_id, 'title': f"Folie {slide_id}"})
+        for slide_id in range(1, count + 1)
+    ])
+    journal.close()
+
+def test_truncated_tail_is_discarded(tmp_path):
+    path = tmp_path / "slides.journal"
+    _write_entries(path, 3)
+    # Stromausfall mitten im letzten Eintrag
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+
+    journal = SlideJournal(str(path), fsync=False)
+
+    assert journal.damaged
+    assert [entry['slide_id'] for entry in journal.read_entries()] == [1, 2]
+    assert journal.entry_count == 2
+
+def test_checksum_mismatch_stops_reading(tmp_path):
+    path = tmp_path / "slides.journal"
+    _write_entries(path, 3)
+    lines = path.read_text(encoding='utf-8').splitlines(keepends=True)
+    lines[1] = lines[1].replace("Folie 2", "Folie X")
+    path.write_text(''.join(lines), encoding='utf-8')
+
+    journal = SlideJournal(str(path), fsync=False)
+
+    assert [entry['slide_id'] for entry in journal.read_entries()] == [1]
+
+def test_append_after_damaged_tail_is_readable(tmp_path):
+    path = tmp_path / "slides.journal"
+    _write_entries(path, 2)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("deadbeef\t{\"seq\": 3")
+
+    journal = SlideJournal(str(path), fsync=False)
+    journal.append_many([('delete', 1, None)])
+    journal.close()
+
+    entries = SlideJournal(str(path), fsync=False).read_entries()
+    assert [(entry['op'], entry['seq']) for entry in entries] == [('upsert', 1), ('upsert', 2), ('delete', 3)]
+
+def test_fsync_runs_off_the_appending_thread(tmp_path, monkeypatch):
+    import os
+    import threading
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, 'fsync', lambda fd: (synced.append(threading.current_thread().name), real_fsync(fd)))
+    journal = SlideJournal(str(tmp_path / "slides.journal"), fsync=True, sync_delay=0.01)
+
+    for slide_id in range(20):
+        journal.append('upsert', slide_id, {'slide_id': slide_id})
+    journal.close()
+
+    assert synced.count(threading.current_thread().name) == 1  # nur close()
+    assert len(SlideJournal(str(tmp_path / "slides.journal"), fsync=False).read_entries()) == 20
@@ -0,0 +1,78 @@
+"""Tests für RotatingLogFileHandler/LogArchiver und AsyncQueueHandler (core/logger.py)"""
+
+import logging
+import os
+import time
+
+from core.logger import AsyncQueueHandler, RotatingLogFileHandler
+
+def _touch(path, age_seconds):
+    path.write_text("x")
+    timestamp = time.time() - age_seconds
+    os.utime(path, (timestamp, timestamp))
+
+def test_handler_creation_does_not_sweep(tmp_path):
+    old = tmp_path / "dynamic_messe_stand_20200101.log"
+    _touch(old, 3600)
+
+    RotatingLogFileHandler(str(tmp_path))
+    time.sleep(0.1)
+
+    assert old.exists()
+
+def test_sweep_only_touches_own_inactive_files(tmp_path):
+    for name in ("dynamic_messe_stand_20200101.log", "dynamic_messe_stand_20200101_120000.log",
+                 "perf_events_20200101.log", "BertrandtGUI_20200101.log"):
+        _touch(tmp_path / name, 3600)
+    _touch(tmp_path / "dynamic_messe_stand_20200102.log", 10)  # kürzlich von anderem Prozess geschrieben
+
+    handler = RotatingLogFileHandler(str(tmp_path), active_grace=300)
+    handler.archiver.sweep()
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "BertrandtGUI_20200101.log",
+        "dynamic_messe_stand_20200101.log.gz",
+        "dynamic_messe_stand_20200101_120000.log.gz",
+        "dynamic_messe_stand_20200102.log",
+        "perf_events_20200101.log",
+    ]
+
+class _SlowHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        time.sleep(0.001)
+        self.records.append(record)
+
+def test_queue_keeps_warnings_and_prepares_records():
+    target = _SlowHandler()
+    handler = AsyncQueueHandler([target], maxsize=4, batch_size=2, flush_interval=0.05)
+    args = {'value': 1}
+    record = logging.LogRecord("test", logging.INFO, __file__, 0, "value %s", (args,), None)
+    handler.handle(record)
+    args['value'] = 2
+    for number in range(50):
+        handler.handle(logging.LogRecord("test", logging.DEBUG, __file__, 0, "debug %d", (number,), None))
+    for number in range(20):
+        handler.handle(logging.LogRecord("test", logging.WARNING, __file__, 0, "warning %d", (number,), None))
+
+    assert handler.flush(5.0)
+    handler.close()
+
+    messages = [record.getMessage() for record in target.records]
+    assert messages[0] == "value {'value': 1}"
+    assert [message for message in messages if message.startswith("warning")] == [f"warning {n}" for n in range(20)]
+
+def test_size_rollover_counts_encoded_bytes(tmp_path):
+    handler = RotatingLogFileHandler(str(tmp_path), max_bytes=1000, compress=False)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    message = "Привіт Größe " * 10  # 130 Zeichen, 210 Bytes in UTF-8
+    for _ in range(8):
+        handler.emit(logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None))
+    handler.close()
+
+    sizes = [os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path)]
+    assert len(sizes) > 1
+    assert max(sizes) <= 1000 + len((message + "\n").encode('utf-8'))
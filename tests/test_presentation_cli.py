@@ -0,0 +1,59 @@
+"""Tests für conversion_targets (presentation_cli.py)"""
+
+import os
+
+from presentation_cli import conversion_targets, convert_file, output_paths
+
+def test_targets_are_placed_next_to_sources(tmp_path):
+    source = str(tmp_path / "deck.json")
+
+    assert conversion_targets([source], 'yaml') == {source: os.path.abspath(str(tmp_path / "deck.yaml"))}
+
+def test_same_stem_gets_source_extension_suffix(tmp_path):
+    json_source, yaml_source = str(tmp_path / "deck.json"), str(tmp_path / "deck.yaml")
+
+    targets = conversion_targets([json_source, yaml_source], 'bundle')
+
+    assert os.path.basename(targets[json_source]) == "deck_json.dmsz"
+    assert os.path.basename(targets[yaml_source]) == "deck_yaml.dmsz"
+
+def test_same_name_from_different_directories_stays_unique(tmp_path):
+    sources = [str(tmp_path / folder / "deck.json") for folder in ("a", "b", "c")]
+    output_dir = str(tmp_path / "out")
+
+    targets = conversion_targets(sources, 'yaml', output_dir)
+
+    assert len(set(targets.values())) == 3
+    assert all(os.path.dirname(path) == os.path.abspath(output_dir) for path in targets.values())
+
+def test_suffixed_name_does_not_take_an_existing_target(tmp_path):
+    sources = [str(tmp_path / name) for name in ("deck.json", "deck.yaml", "deck_json.yaml")]
+
+    targets = conversion_targets(sources, 'bundle')
+
+    assert len(set(targets.values())) == 3
+    assert os.path.basename(targets[sources[2]]) == "deck_json.dmsz"
+
+def test_source_already_in_target_format_keeps_its_name(tmp_path):
+    json_source, yaml_source = str(tmp_path / "deck.json"), str(tmp_path / "deck.yaml")
+
+    targets = conversion_targets([json_source, yaml_source], 'json')
+
+    assert targets[json_source] == os.path.abspath(json_source)
+    assert os.path.basename(targets[yaml_source]) == "deck_yaml.json"
+
+def test_skipped_when_target_is_the_source(tmp_path):
+    source = str(tmp_path / "deck.json")
+
+    result = convert_file(source, 'json', conversion_targets([source], 'json')[source])
+
+    assert result.status == 'skipped'
+
+def test_thumbnail_names_are_unique(tmp_path):
+    sources = [str(tmp_path / "deck.json"), str(tmp_path / "deck.yaml"), str(tmp_path / "sub" / "deck.json")]
+    output_dir = str(tmp_path / "thumbnails")
+
+    targets = output_paths(sources, '.png', output_dir)
+
+    assert len(set(targets.values())) == 3
+    assert all(path.endswith('.png') for path in targets.values())
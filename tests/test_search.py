@@ -0,0 +1,53 @@
+"""Tests für SlideSearchIndex (models/search.py)"""
+
+from models.content import SlideData
+from models.search import SlideSearchIndex, tokenize
+
+def _index(*documents):
+    index = SlideSearchIndex()
+    for slide_id, title, content in documents:
+        index.index_document('current', slide_id, title, content)
+    return index
+
+def test_tokenize_casefolds_and_drops_single_characters():
+    assert tokenize("Hummel-Shuttle a B Straße") == ["hummel", "shuttle", "strasse"]
+
+def test_title_match_ranks_above_content_match():
+    index = _index(
+        (1, "Sicherheit", "Shuttle im Einsatz"),
+        (2, "Shuttle", "Sicherheit für alle"),
+    )
+
+    results = index.search("shuttle")
+
+    assert [result.slide_id for result in results] == [2, 1]
+    assert results[0].score > results[1].score
+
+def test_exact_match_ranks_above_prefix_match():
+    index = _index(
+        (1, "Hummelflug", ""),
+        (2, "Hummel", ""),
+    )
+
+    assert [result.slide_id for result in index.search("hummel")] == [2, 1]
+    assert index.search("hummel", prefix=False)[0].slide_id == 2
+    assert len(index.search("hummel", prefix=False)) == 1
+
+def test_all_terms_must_match():
+    index = _index(
+        (1, "BumbleB Shuttle", ""),
+        (2, "BumbleB Sicherheit", ""),
+    )
+
+    assert [result.slide_id for result in index.search("bumbleb sicher")] == [2]
+    assert index.search("bumbleb unbekannt") == []
+
+def test_lazy_slide_is_reindexed_after_loading():
+    slide = SlideData.lazy(7, "Bundle-Folie", lambda: {'content': "Wasserstoffantrieb", 'config_data': {}})
+    index = SlideSearchIndex()
+    index.index_slide(slide)
+    assert index.search("wasserstoff") == []
+
+    slide.content  # lädt die Slide
+
+    assert [result.slide_id for result in index.search("wasserstoff")] == [7]
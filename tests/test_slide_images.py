@@ -0,0 +1,83 @@
+"""Tests für Bild-Befehle der DisplayList (ui/components/slide_images.py, slide_renderer.py)"""
+
+import struct
+import zlib
+
+import pytest
+
+from core.assets import asset_store
+from models.display_list import DisplayList, DisplayOp
+from ui.components.slide_images import image_header_size, slide_images
+from ui.components.slide_renderer import SlideRenderer
+
+def _png(width, height, rgba=(255, 0, 0, 255)):
+    """Minimales RGBA-PNG in einer Farbe"""
+    def chunk(kind, payload):
+        return struct.pack('>I', len(payload)) + kind + payload + struct.pack('>I', zlib.crc32(kind + payload))
+    rows = b''.join(b'\x00' + bytes(rgba) * width for _ in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(rows)) + chunk(b'IEND', b''))
+
+def _image_op(coords, ref, anchor='nw'):
+    return DisplayOp('image', coords, None, None, 0, '', None, anchor, 0, ref, None)
+
+@pytest.fixture
+def images():
+    """Globaler Bild-Cache, vor und nach dem Test geleert"""
+    slide_images.clear()
+    yield slide_images
+    slide_images.clear()
+
+def test_header_size_of_png():
+    assert image_header_size(_png(7, 3)) == (7, 3)
+    assert image_header_size(b'kein Bild') is None
+
+def test_image_op_is_laid_out_from_asset_store(data_dir, images):
+    ref = asset_store.put_bytes(_png(40, 20))
+    display_list = DisplayList(1920, 1080, (_image_op((960, 540), ref, anchor='center'),), 2.0)
+
+    items = SlideRenderer.layout_display_list(display_list, {}, 1920 + 80, 1080 + 80)
+
+    key, item_type, coords, options = items[-1]
+    assert item_type == 'image'
+    assert options['source'] == ref
+    # Originalgröße * Schriftfaktor, um den Anker zentriert
+    assert options['size'] == (80, 40)
+    assert coords == pytest.approx((40 + 960 - 40, 40 + 540 - 20))
+
+def test_image_box_is_scaled_with_the_slide(data_dir, images):
+    ref = asset_store.put_bytes(_png(10, 10))
+    display_list = DisplayList(1920, 1080, (_image_op((100, 100, 300, 200), ref),), 2.0)
+
+    # Rand 40, Maßstab 2
+    items = SlideRenderer.layout_display_list(display_list, {}, 2 * 1920 + 80, 2 * 1080 + 80)
+
+    _, _, coords, options = items[-1]
+    assert coords == pytest.approx((40 + 200, 40 + 200))
+    assert options['size'] == (400, 200)
+
+def test_missing_image_is_skipped(data_dir, images):
+    display_list = DisplayList(1920, 1080, (_image_op((0, 0), 'sha256:' + '0' * 64),), 2.0)
+
+    items = SlideRenderer.layout_display_list(display_list, {}, 1000, 600)
+
+    assert [item_type for _, item_type, _, _ in items] == ['rectangle']
+
+def test_tk_options_replace_source_and_size(images):
+    options = images.tk_options({'source': 'logo.png', 'size': (10, 10), 'anchor': 'nw'})
+
+    # Ohne Tk-Hauptfenster kein PhotoImage - Tk erhält ein leeres Bild
+    assert options == {'anchor': 'nw', 'image': ''}
+
+def test_image_is_pasted_into_the_bitmap(data_dir, images):
+    pytest.importorskip('PIL')
+    from ui.components.slide_bitmap_cache import rasterize_layout
+
+    ref = asset_store.put_bytes(_png(2, 2))
+    items = [('op_0', 'image', (10, 10), {'source': ref, 'size': (20, 20), 'anchor': 'nw'})]
+
+    bitmap = rasterize_layout(items, 50, 50, background='#FFFFFF')
+
+    assert bitmap.getpixel((20, 20)) == (255, 0, 0)
+    assert bitmap.getpixel((5, 5)) == (255, 255, 255)
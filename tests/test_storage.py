@@ -0,0 +1,68 @@
+"""Tests für StorageManager.restore_archive (core/storage.py)"""
+
+import hashlib
+import os
+
+from core.archives import archive_filename, chunk_records
+from core.storage import storage_manager
+
+def _export(records):
+    return storage_manager.export_archive(records, archive_filename("backup_test"))
+
+def _file(key, payload):
+    yield {'type': 'file', 'key': key, 'size': len(payload)}
+    yield from chunk_records('file_chunk', key, [payload])
+
+def test_restore_archive_writes_safe_files(data_dir, tmp_path):
+    target = tmp_path / "restore"
+    archive = _export(list(_file("slides.json", b"{}")) + list(_file("documents/a b.json", b"[]")))
+
+    assert storage_manager.restore_archive(archive, str(target)) == 2
+    assert (target / "slides.json").read_bytes() == b"{}"
+    assert (target / "documents" / "a b.json").read_bytes() == b"[]"
+
+def test_restore_archive_rejects_path_traversal(data_dir, tmp_path):
+    target = tmp_path / "restore"
+    target.mkdir()
+    keys = ["../escaped.json", "documents/../../escaped.json", "/tmp/absolute.json",
+            "..\\escaped.json", "C:/escaped.json", "./hidden.json"]
+    records = []
+    for key in keys:
+        records.extend(_file(key, b"evil"))
+    records.extend(_file("slides.json", b"ok"))
+
+    assert storage_manager.restore_archive(_export(records), str(target)) == 1
+    assert not (tmp_path / "escaped.json").exists()
+    assert sorted(os.listdir(target)) == ["slides.json"]
+    assert (target / "slides.json").read_bytes() == b"ok"
+
+def test_restore_archive_rejects_invalid_asset_refs(data_dir, tmp_path):
+    payload = b"image"
+    ref = f"sha256:{hashlib.sha256(payload).hexdigest()}"
+    records = [{'type': 'asset', 'key': "sha256:../../escaped"}]
+    records.extend(chunk_records('asset_chunk', "sha256:../../escaped", [b"evil"]))
+    records.append({'type': 'asset', 'key': ref})
+    records.extend(chunk_records('asset_chunk', ref, [payload]))
+
+    assert storage_manager.restore_archive(_export(records), str(tmp_path / "restore")) == 1
+    assert not (tmp_path / "escaped").exists()
+    from core.assets import asset_store
+    assert asset_store.read_bytes(ref) == payload
+
+def test_restore_archive_discards_asset_with_wrong_hash(data_dir, tmp_path):
+    from core.assets import asset_store
+    ref = f"sha256:{hashlib.sha256(b'original').hexdigest()}"
+    records = [{'type': 'asset', 'key': ref}]
+    records.extend(chunk_records('asset_chunk', ref, [b"manipuliert"]))
+
+    assert storage_manager.restore_archive(_export(records), str(tmp_path / "restore")) == 0
+    assert not asset_store.has(ref)
+    assert not [name for _, _, names in os.walk(asset_store.root) for name in names]
+
+def test_restore_archive_removes_partial_files_on_error(data_dir, tmp_path):
+    target = tmp_path / "restore"
+    records = [{'type': 'file', 'key': "slides.json"},
+               {'type': 'file_chunk', 'key': "slides.json", 'offset': 0, 'data': "kein base64!"}]
+
+    assert storage_manager.restore_archive(_export(records), str(target)) is None
+    assert os.listdir(target) == []
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Font Registry für Dynamic Messe Stand V4
+Wiederverwendbare Tk-Schriften und Cache für Textumbruch/-messung
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from collections import OrderedDict, namedtuple
+from core.config import config
+
+# Ergebnis eines Umbruchs: Zeilen, breiteste Zeile und Gesamthöhe in Pixeln
+TextLayout = namedtuple('TextLayout', ['lines', 'width', 'height'])
+
+def parse_font_spec(spec):
+    """Zerlegt ein Tk-Font-Tupel (Familie, Größe, Stile...) in (Familie, Größe, Stärke, Neigung)"""
+    family, size, *styles = spec
+    weight = 'bold' if 'bold' in styles else 'normal'
+    slant = 'italic' if 'italic' in styles else 'roman'
+    return family, int(size), weight, slant
+
+class FontRegistry:
+    """Gemeinsame tkinter.font.Font-Objekte statt Font-Tupeln
+
+    Tk löst ein Tupel bei jedem create_text/itemconfigure neu auf; benannte Fonts
+    werden einmal angelegt und danach nur referenziert. Schlüssel ist
+    (Familie, skalierte Größe, Stärke, Neigung). Optional wird einer Schrift eine
+    Rolle ('title', 'body', ...) zugeordnet, die sich über den Font-Namen abfragen lässt.
+    """
+
+    def __init__(self):
+        self._fonts = {}       # Schlüssel -> Font
+        self._roles = {}       # Font-Name -> Rolle
+        self._linespace = {}   # Font-Name -> Zeilenhöhe
+
+    @staticmethod
+    def is_available():
+        """Gibt es ein Tk-Hauptfenster, an das Fonts gebunden werden können?"""
+        return tk._default_root is not None
+
+    def font(self, spec, scale=1.0, role=None):
+        """Font-Objekt für ein Tupel (Familie, Größe, Stile...), skaliert mit scale"""
+        family, size, weight, slant = parse_font_spec(spec)
+        # Negative Größen sind in Tk Pixelangaben - Vorzeichen beibehalten
+        scaled = int(round(size * scale)) or (1 if size > 0 else -1)
+        key = (family, scaled, weight, slant)
+
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(family=family, size=scaled, weight=weight, slant=slant)
+            self._fonts[key] = font
+        if role:
+            self._roles[font.name] = role
+        return font
+
+    def role_of(self, font):
+        """Rolle einer registrierten Schrift (Font, Font-Name oder cget('font'))"""
+        name = font.name if isinstance(font, tkfont.Font) else str(font)
+        return self._roles.get(name)
+
+    def linespace(self, font):
+        """Zeilenhöhe einer Schrift (einmal von Tk abgefragt)"""
+        value = self._linespace.get(font.name)
+        if value is None:
+            value = self._linespace[font.name] = font.metrics('linespace')
+        return value
+
+    def tk_options(self, options):
+        """Ersetzt ein Font-Tupel in Canvas-Optionen durch das registrierte Font-Objekt"""
+        spec = options.get('font')
+        if isinstance(spec, (tuple, list)) and self.is_available():
+            return dict(options, font=self.font(spec))
+        return options
+
+    def clear(self):
+        """Vergisst alle Fonts (z.B. nach dem Zerstören des Hauptfensters)"""
+        self._fonts.clear()
+        self._roles.clear()
+        self._linespace.clear()
+        text_layouts.clear()
+
+class TextLayoutCache:
+    """LRU-Cache für Textbreiten und Zeilenumbrüche
+
+    Umbrüche werden wie bei Tk (width-Option) an Wortgrenzen berechnet und unter
+    (Text, Font-Name, Breite) abgelegt; Wortbreiten werden einzeln gecacht, sodass
+    ein Relayout mit neuer Breite nur noch addiert statt erneut misst.
+    """
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or config.gui['text_layout_cache_size']
+        self._layouts = OrderedDict()  # (Text, Font-Name, Breite) -> TextLayout
+        self._widths = OrderedDict()   # (Text, Font-Name) -> Pixelbreite
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, cache, key, value):
+        cache[key] = value
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False)
+        return value
+
+    def measure(self, text, font):
+        """Pixelbreite eines einzeiligen Textes"""
+        key = (text, font.name)
+        width = self._widths.get(key)
+        if width is None:
+            width = self._remember(self._widths, key, font.measure(text))
+        else:
+            self._widths.move_to_end(key)
+        return width
+
+    def wrap(self, text, font, width=None):
+        """Bricht Text für die gegebene Breite um; liefert TextLayout"""
+        width = int(width) if width else 0
+        key = (text, font.name, width)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            self.hits += 1
+            return layout
+
+        self.misses += 1
+        space = self.measure(' ', font)
+        lines = []
+        widest = 0
+        for paragraph in text.split('\n'):
+            line, line_width = "", 0
+            for word in paragraph.split(' '):
+                word_width = self.measure(word, font)
+                if line and width and line_width + space + word_width > width:
+                    lines.append(line)
+                    widest = max(widest, line_width)
+                    line, line_width = word, word_width
+                elif line:
+                    line, line_width = f"{line} {word}", line_width + space + word_width
+                else:
+                    line, line_width = word, word_width
+            lines.append(line)
+            widest = max(widest, line_width)
+
+        layout = TextLayout(tuple(lines), widest, len(lines) * font_registry.linespace(font))
+        return self._remember(self._layouts, key, layout)
+
+    def clear(self):
+        self._layouts.clear()
+        self._widths.clear()
+
+# Globale Instanzen
+font_registry = FontRegistry()
+text_layouts = TextLayoutCache()
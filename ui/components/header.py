@@ -18,6 +18,8 @@ class HeaderComponent(ttk.Frame):
         super().__init__(parent, style='Secondary.TFrame')
         self.main_window = main_window
         self.active_tab = "home"
+        self.presentation_task = None  # laufender Import/Export im Hintergrund
+        self.status_before_task = None
         
         self.setup_header()
     
@@ -296,6 +298,22 @@ class HeaderComponent(ttk.Frame):
         )
         save_btn.pack()
         
+        # Bundle-Button (Slides + Assets in einer Datei)
+        bundle_btn = tk.Button(
+            presentation_frame,
+            text="📦 Bundle",
+            font=fonts['button'],
+            bg=colors['accent_primary'],
+            fg='white',
+            relief='flat',
+            bd=0,
+            padx=spacing['md'],
+            pady=spacing['xs'],
+            cursor='hand2',
+            command=self.save_presentation_bundle
+        )
+        bundle_btn.pack(side='left', padx=(0, spacing['sm']))
+        
         # Laden-Button
         load_btn = tk.Button(
             presentation_frame,
@@ -325,6 +343,7 @@ class HeaderComponent(ttk.Frame):
             bg=colors['background_secondary']
         )
         self.status_indicator.pack(side='top')
+        self.status_indicator.bind('<Button-1>', self.cancel_presentation_task)
         
         # Zeit/Datum
         import datetime
@@ -358,51 +377,106 @@ class HeaderComponent(ttk.Frame):
     
     def save_presentation_json(self):
         """Speichert die Präsentation als JSON"""
-        try:
-            from models.presentation import presentation_manager
-            filename = presentation_manager.export_presentation_as_json()
-            if filename:
-                logger.info(f"Präsentation als JSON gespeichert: {filename}")
-                # Status kurz aktualisieren
-                self.show_save_success("JSON")
-        except Exception as e:
-            logger.error(f"Fehler beim JSON-Export: {e}")
-            from tkinter import messagebox
-            messagebox.showerror("Speicher-Fehler", f"Präsentation konnte nicht gespeichert werden:\n{e}")
+        self.start_presentation_export('json')
     
     def save_presentation_yaml(self):
         """Speichert die Präsentation als YAML"""
+        self.start_presentation_export('yaml')
+    
+    def start_presentation_export(self, file_format):
+        """Startet den Export im Hintergrund - die Oberfläche bleibt bedienbar"""
+        label = file_format.upper()
         try:
-            from models.presentation import presentation_manager
-            filename = presentation_manager.export_presentation_as_yaml()
-            if filename:
-                logger.info(f"Präsentation als YAML gespeichert: {filename}")
-                # Status kurz aktualisieren
-                self.show_save_success("YAML")
+            if self.presentation_task is not None:
+                logger.warning("Es läuft bereits ein Import/Export")
+                return
+            
+            from ui.components.presentation_dialogs import presentation_dialogs
+            self.presentation_task = presentation_dialogs.export_presentation_async(
+                self.main_window.root,
+                file_format,
+                on_progress=self.show_task_progress,
+                on_done=lambda result: self.on_export_finished(result, label)
+            )
         except Exception as e:
-            logger.error(f"Fehler beim YAML-Export: {e}")
+            logger.error(f"Fehler beim {label}-Export: {e}")
             from tkinter import messagebox
             messagebox.showerror("Speicher-Fehler", f"Präsentation konnte nicht gespeichert werden:\n{e}")
     
+    def on_export_finished(self, result, format_type):
+        """Ergebnis des Hintergrund-Exports"""
+        self.end_task_progress()
+        if result.cancelled:
+            logger.info(f"{format_type}-Export abgebrochen")
+        elif result.error is not None:
+            from tkinter import messagebox
+            messagebox.showerror("Speicher-Fehler", f"Präsentation konnte nicht gespeichert werden:\n{result.error}")
+        else:
+            logger.info(f"Präsentation als {format_type} gespeichert: {result.value}")
+            # Status kurz aktualisieren
+            self.show_save_success(format_type)
+    
+    def save_presentation_bundle(self):
+        """Speichert die Präsentation als Bundle"""
+        self.start_presentation_export('bundle')
+    
     def load_presentation(self):
-        """Lädt eine Präsentation"""
+        """Lädt eine Präsentation im Hintergrund"""
         try:
-            from models.presentation import presentation_manager
-            success = presentation_manager.load_presentation_from_file()
-            if success:
-                logger.info("Präsentation erfolgreich geladen")
-                # Status kurz aktualisieren
-                self.show_load_success()
-                
-                # Alle Tabs über neue Daten informieren
-                if hasattr(self.main_window, 'refresh_all_tabs'):
-                    self.main_window.refresh_all_tabs()
-                
+            if self.presentation_task is not None:
+                logger.warning("Es läuft bereits ein Import/Export")
+                return
+            
+            from ui.components.presentation_dialogs import presentation_dialogs
+            self.presentation_task = presentation_dialogs.load_presentation_async(
+                self.main_window.root,
+                on_progress=self.show_task_progress,
+                on_done=self.on_load_finished
+            )
         except Exception as e:
             logger.error(f"Fehler beim Laden der Präsentation: {e}")
             from tkinter import messagebox
             messagebox.showerror("Lade-Fehler", f"Präsentation konnte nicht geladen werden:\n{e}")
     
+    def on_load_finished(self, result):
+        """Ergebnis des Hintergrund-Imports"""
+        self.end_task_progress()
+        if result.cancelled:
+            logger.info("Laden der Präsentation abgebrochen")
+        elif result.error is not None:
+            from tkinter import messagebox
+            messagebox.showerror("Lade-Fehler", f"Präsentation konnte nicht geladen werden:\n{result.error}")
+        else:
+            logger.info("Präsentation erfolgreich geladen")
+            # Status kurz aktualisieren
+            self.show_load_success()
+            
+            # Alle Tabs über neue Daten informieren
+            if hasattr(self.main_window, 'refresh_all_tabs'):
+                self.main_window.refresh_all_tabs()
+    
+    def show_task_progress(self, progress):
+        """Zeigt den Fortschritt eines Hintergrund-Auftrags im Status (Klick = Abbrechen)"""
+        if self.status_before_task is None:
+            self.status_before_task = self.status_indicator.cget('text')
+        percent = int(100 * progress.done / progress.total) if progress.total else 0
+        self.status_indicator.configure(
+            text=f"⏳ {progress.message} {percent}% (Klick = Abbrechen)",
+            fg=theme_manager.get_colors()['accent_primary']
+        )
+    
+    def end_task_progress(self):
+        """Stellt den Status nach einem Hintergrund-Auftrag wieder her"""
+        self.presentation_task = None
+        if self.status_before_task is not None:
+            self.status_indicator.configure(text=self.status_before_task, fg=theme_manager.get_colors()['text_secondary'])
+            self.status_before_task = None
+    
+    def cancel_presentation_task(self, event=None):
+        """Bricht den laufenden Import/Export ab"""
+        if self.presentation_task is not None:
+            self.presentation_task.cancel()
+    
     def show_save_success(self, format_type):
         """Zeigt Speicher-Erfolg im Status"""
         original_text = self.status_indicator.cget('text')
@@ -450,7 +524,7 @@ class HeaderComponent(ttk.Frame):
             new_btn.after(50, highlight)
         
         self.active_tab = tab_id
-        logger.debug(f"Header-Navigation aktualisiert: {tab_id}")
+        logger.debug("Header-Navigation aktualisiert: %s", tab_id)
     
     def update_status(self, status_text, status_color="🔴"):
         """Aktualisiert den Status-Indikator"""
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Presentation Dialogs für Dynamic Messe Stand V4
+Tk-Adapter (Datei-Dialoge und Meldungen) für den PresentationManager
+"""
+
+import os
+from datetime import datetime
+from tkinter import filedialog, messagebox
+from core.logger import logger
+from models.bundle import BUNDLE_EXTENSION
+from models.presentation import presentation_manager, PresentationError
+
+# Dateidialog-Einstellungen je Exportformat
+EXPORT_DIALOGS = {
+    'json': {
+        'title': "Präsentation speichern",
+        'extension': ".json",
+        'filetypes': [("JSON-Dateien", "*.json"), ("Alle Dateien", "*.*")]
+    },
+    'yaml': {
+        'title': "Präsentation speichern (YAML)",
+        'extension': ".yaml",
+        'filetypes': [("YAML-Dateien", "*.yaml"), ("YML-Dateien", "*.yml"), ("Alle Dateien", "*.*")]
+    },
+    'bundle': {
+        'title': "Präsentation speichern (Bundle)",
+        'extension': BUNDLE_EXTENSION,
+        'filetypes': [("Präsentations-Bundle", f"*{BUNDLE_EXTENSION}"), ("Alle Dateien", "*.*")]
+    }
+}
+
+class PresentationDialogs:
+    """Dünne GUI-Schicht: fragt nach Dateien/Optionen und zeigt Ergebnisse an"""
+
+    def __init__(self, manager=presentation_manager):
+        self.manager = manager
+
+    def ask_export_filename(self, file_format):
+        """Fragt nach dem Dateinamen für den Export"""
+        dialog = EXPORT_DIALOGS[file_format]
+        return filedialog.asksaveasfilename(
+            title=dialog['title'],
+            defaultextension=dialog['extension'],
+            filetypes=dialog['filetypes'],
+            initialdir=self.manager.presentations_dir,
+            initialfile=f"bumbleb_presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}{dialog['extension']}"
+        )
+
+    def ask_open_filename(self):
+        """Fragt nach der zu ladenden Präsentationsdatei"""
+        return filedialog.askopenfilename(
+            title="Präsentation laden",
+            filetypes=[
+                ("Präsentations-Dateien", f"*.json *.yaml *.yml *{BUNDLE_EXTENSION}"),
+                ("JSON-Dateien", "*.json"),
+                ("YAML-Dateien", "*.yaml *.yml"),
+                ("Präsentations-Bundle", f"*{BUNDLE_EXTENSION}"),
+                ("Alle Dateien", "*.*")
+            ],
+            initialdir=self.manager.presentations_dir
+        )
+
+    def ask_merge_mode(self):
+        """Fragt, ob bestehende Folien ergänzt (True) oder überschrieben (False) werden"""
+        from models.content import content_manager
+        if content_manager.get_slide_count() == 0:
+            return False
+        return not messagebox.askyesno(
+            "Bestehende Folien",
+            "Sollen die bestehenden Folien überschrieben werden?\n\n"
+            "Ja = Alle bestehenden Folien löschen und neue laden\n"
+            "Nein = Neue Folien zu bestehenden hinzufügen"
+        )
+
+    def show_export_success(self, filename, total_slides, file_format):
+        """Meldet einen erfolgreichen Export"""
+        messagebox.showinfo(
+            "Export erfolgreich",
+            f"Präsentation wurde erfolgreich gespeichert:\n{os.path.basename(filename)}\n\n"
+            f"Folien: {total_slides}\n"
+            f"Format: {file_format.upper() if file_format != 'bundle' else 'Bundle'}"
+        )
+
+    def show_load_success(self, result):
+        """Meldet einen erfolgreichen Import"""
+        messagebox.showinfo(
+            "Import erfolgreich",
+            f"Präsentation wurde erfolgreich geladen:\n{os.path.basename(result.filename)}\n\n"
+            f"Folien: {result.slide_count}\n"
+            f"Format: {result.file_format.upper() if result.file_format != 'bundle' else 'Bundle'}"
+        )
+
+    @staticmethod
+    def reset_demo():
+        """Setzt die Demo nach einem Import auf die erste Folie"""
+        try:
+            from services.demo import demo_service
+            demo_service.reset_to_first_slide()
+        except Exception as e:
+            logger.error(f"Demo konnte nicht zurückgesetzt werden: {e}")
+
+    def export_presentation(self, file_format):
+        """Export mit Dialog (blockierend) - gibt den Dateinamen oder None zurück"""
+        filename = self.ask_export_filename(file_format)
+        if not filename:
+            return None
+
+        try:
+            total_slides = self.manager.export_presentation(filename, file_format)
+        except PresentationError as e:
+            messagebox.showerror("Export-Fehler", str(e))
+            return None
+
+        self.show_export_success(filename, total_slides, file_format)
+        return filename
+
+    def export_presentation_async(self, root, file_format, on_progress=None, on_done=None):
+        """Export mit Dialog im Hintergrund - gibt die Task oder None zurück"""
+        filename = self.ask_export_filename(file_format)
+        if not filename:
+            return None
+        return self.manager.export_presentation_async(root, filename, file_format, on_progress, on_done)
+
+    def load_presentation(self):
+        """Import mit Dialogen (blockierend) - gibt das LoadResult oder None zurück"""
+        filename = self.ask_open_filename()
+        if not filename:
+            return None
+
+        try:
+            result = self.manager.load_presentation_from_file(filename, self.ask_merge_mode())
+        except PresentationError as e:
+            logger.error(f"Fehler beim Laden der Präsentation: {e}")
+            messagebox.showerror("Import-Fehler", f"Präsentation konnte nicht geladen werden:\n{e}")
+            return None
+
+        self.reset_demo()
+        self.show_load_success(result)
+        return result
+
+    def load_presentation_async(self, root, on_progress=None, on_done=None):
+        """Import mit Dialogen im Hintergrund - gibt die Task oder None zurück"""
+        filename = self.ask_open_filename()
+        if not filename:
+            return None
+
+        merge = self.ask_merge_mode()
+
+        def finish(result):
+            if result.value is not None:
+                self.reset_demo()
+            if on_done:
+                on_done(result)
+
+        return self.manager.load_presentation_async(root, filename, merge, on_progress, finish)
+
+# Globale Dialog-Instanz
+presentation_dialogs = PresentationDialogs()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Resize Coalescer für Dynamic Messe Stand V4
+Bündelt <Configure>-Ereignisse zu einem Relayout pro Frame-Intervall
+"""
+
+from core.config import config
+from core.logger import logger
+from core.perf import perf_events
+
+class ResizeCoalescer:
+    """Ersetzt einen direkten <Configure>-Handler
+
+    Das erste Ereignis plant über after() ein Relayout am Ende des Intervalls;
+    weitere Ereignisse merken sich nur die neueste Größe. Unveränderte Größen
+    lösen kein Relayout aus. Je Interaktion (Ereignisfolge ohne längere Pause)
+    werden Ereignisse und Relayouts gezählt und als Perf-Event gemeldet.
+    """
+
+    def __init__(self, widget, callback, name="canvas", interval=None, burst_gap=None):
+        self.widget = widget
+        self.callback = callback
+        self.name = name
+        self.interval = interval or config.gui['resize_interval_ms']
+        self.burst_gap = burst_gap or config.gui['resize_burst_gap_ms']
+        self._event = None
+        self._after_id = None
+        self._burst_id = None
+        self._last_size = None
+        # Zähler gesamt und für die laufende Interaktion
+        self.events = 0
+        self.relayouts = 0
+        self._burst_events = 0
+        self._burst_relayouts = 0
+
+    def bind(self):
+        """Registriert den Coalescer als <Configure>-Handler des Widgets"""
+        self.widget.bind('<Configure>', self)
+        return self
+
+    def __call__(self, event):
+        self.events += 1
+        self._burst_events += 1
+        self._event = event
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.interval, self._flush)
+
+    def _flush(self):
+        """Führt das Relayout mit der zuletzt gemeldeten Größe aus"""
+        self._after_id = None
+        event = self._event
+        size = (event.width, event.height)
+
+        if size != self._last_size:
+            self._last_size = size
+            self.relayouts += 1
+            self._burst_relayouts += 1
+            try:
+                self.callback(event)
+            except Exception as e:
+                logger.error(f"Fehler beim Relayout ({self.name}): {e}")
+
+        # Ende der Interaktion erst nach einer Pause ohne Ereignisse
+        if self._burst_id is not None:
+            self.widget.after_cancel(self._burst_id)
+        self._burst_id = self.widget.after(self.burst_gap, self._end_burst)
+
+    def _end_burst(self):
+        """Meldet Ereignisse und Relayouts der abgeschlossenen Interaktion"""
+        self._burst_id = None
+        perf_events.event("resize.burst", widget=self.name,
+                          events=self._burst_events, relayouts=self._burst_relayouts)
+        logger.debug("Resize %s: %d Ereignisse -> %d Relayouts",
+                     self.name, self._burst_events, self._burst_relayouts)
+        self._burst_events = 0
+        self._burst_relayouts = 0
+
+    def force(self):
+        """Nächstes Relayout auch bei unveränderter Größe ausführen"""
+        self._last_size = None
+
+    def cancel(self):
+        """Verwirft geplante Relayouts (z.B. beim Zerstören des Widgets)"""
+        for after_id in (self._after_id, self._burst_id):
+            if after_id is not None:
+                self.widget.after_cancel(after_id)
+        self._after_id = self._burst_id = None
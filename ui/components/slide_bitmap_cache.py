@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Slide Bitmap Cache für Dynamic Messe Stand V4
+Vorgerenderte Folien-Bitmaps (Pillow) für konstante Wiedergabekosten
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from core.logger import logger
+from ui.components.slide_images import TK_ANCHORS, slide_images
+from ui.components.slide_renderer import SlideRenderer
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Ersatzschriften, falls die Tk-Schrift nicht als TrueType-Datei gefunden wird
+FALLBACK_FONTS = {
+    False: ("segoeui.ttf", "DejaVuSans.ttf", "Arial.ttf"),
+    True: ("segoeuib.ttf", "DejaVuSans-Bold.ttf", "Arial Bold.ttf")
+}
+
+@lru_cache(maxsize=64)
+def _load_font(family, size, bold):
+    """Lädt eine Pillow-Schrift (zwischengespeichert je Familie/Größe/Stärke)"""
+    candidates = (f"{family.replace(' ', '').lower()}{'b' if bold else ''}.ttf",) + FALLBACK_FONTS[bold]
+    for filename in candidates:
+        try:
+            return ImageFont.truetype(filename, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 kennt keine Größe für die Standardschrift
+        return ImageFont.load_default()
+
+def _line_height(font):
+    """Zeilenhöhe einer Schrift (Bitmap-Standardschrift ohne getmetrics)"""
+    if hasattr(font, 'getmetrics'):
+        ascent, descent = font.getmetrics()
+        return ascent + descent
+    left, top, right, bottom = font.getbbox("Ag")
+    return bottom - top + 2
+
+def _wrap_text(draw, text, font, width):
+    """Bricht Text wie Tk (width-Option) an Wortgrenzen um"""
+    if not width:
+        return text.split('\n')
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ""
+        for word in paragraph.split(' '):
+            candidate = f"{line} {word}" if line else word
+            if line and draw.textlength(candidate, font=font) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+def rasterize_layout(items, width, height, background='#E8E8E8'):
+    """Zeichnet die Elemente aus SlideRenderer.layout_slide in ein Pillow-Bild"""
+    image = Image.new('RGB', (max(1, int(width)), max(1, int(height))), background)
+    draw = ImageDraw.Draw(image)
+
+    for _, item_type, coords, options in items:
+        if options.get('state') == 'hidden':
+            continue
+
+        if item_type == 'rectangle':
+            draw.rectangle(
+                coords,
+                fill=options.get('fill') or None,
+                outline=options.get('outline') or None,
+                width=int(options.get('width', 1))
+            )
+
+        elif item_type == 'oval':
+            draw.ellipse(
+                coords,
+                fill=options.get('fill') or None,
+                outline=options.get('outline') or None,
+                width=int(options.get('width', 1))
+            )
+
+        elif item_type == 'line':
+            draw.line(coords, fill=options.get('fill'), width=int(options.get('width', 1)))
+
+        elif item_type == 'text':
+            family, size, *style = options.get('font', ('Segoe UI', 12))
+            font = _load_font(family, abs(int(size)), 'bold' in style)
+            lines = _wrap_text(draw, options.get('text', ''), font, options.get('width'))
+
+            line_height = _line_height(font)
+            block_width = max((draw.textlength(line, font=font) for line in lines), default=0)
+            block_height = line_height * len(lines)
+
+            fraction_x, fraction_y = TK_ANCHORS.get(options.get('anchor', 'center'), (0.5, 0.5))
+            left = coords[0] - block_width * fraction_x
+            top = coords[1] - block_height * fraction_y
+            centered = options.get('anchor', 'center') in ('center', 'n', 's')
+
+            for index, line in enumerate(lines):
+                x = left + (block_width - draw.textlength(line, font=font)) / 2 if centered else left
+                draw.text((x, top + index * line_height), line, font=font, fill=options.get('fill'))
+
+        elif item_type == 'image' and 'source' in options:
+            picture = slide_images.pil_image(options['source'], options['size'])
+            if picture is not None:
+                # Alphakanal als Maske - transparente Logos verdecken den Hintergrund nicht
+                image.paste(picture, (int(round(coords[0])), int(round(coords[1]))), picture)
+
+    return image
+
+class SlideBitmapCache:
+    """LRU-Cache gerasterter Folien mit Byte-Budget
+
+    Schlüssel sind (slide_id, Inhalts-Version, Breite, Höhe). Eine neue Canvas-Größe
+    verwirft alle Bitmaps der alten Größe, Inhaltsänderungen über invalidate().
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # Schlüssel -> (PhotoImage, Bytes)
+        self._size = None
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_available():
+        """Pillow installiert?"""
+        return PIL_AVAILABLE
+
+    def _evict(self, key):
+        _, nbytes = self._entries.pop(key)
+        self.used_bytes -= nbytes
+
+    def invalidate(self, slide_id=None):
+        """Verwirft die Bitmaps einer Folie (oder alle)"""
+        for key in [key for key in self._entries if slide_id is None or key[0] == slide_id]:
+            self._evict(key)
+
+    def get(self, slide_id, version, slide_data, width, height):
+        """PhotoImage der Folie in der aktuellen Größe (bei Bedarf gerastert)"""
+        if not PIL_AVAILABLE:
+            return None
+
+        size = (int(width), int(height))
+        if size != self._size:
+            # Größenänderung - Bitmaps anderer Größe werden nie wieder getroffen
+            self.invalidate()
+            self._size = size
+
+        key = (slide_id, version, size[0], size[1])
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        # Veraltete Versionen derselben Folie sofort freigeben
+        self.invalidate(slide_id)
+
+        image = rasterize_layout(SlideRenderer.layout_slide(slide_data, *size), *size)
+        photo = ImageTk.PhotoImage(image)
+        nbytes = size[0] * size[1] * 4
+
+        self._entries[key] = (photo, nbytes)
+        self.used_bytes += nbytes
+        while self.used_bytes > self.max_bytes and len(self._entries) > 1:
+            self._evict(next(iter(self._entries)))
+
+        logger.debug("Slide %s gerastert (%sx%s), Cache %d KB", slide_id, size[0], size[1], self.used_bytes // 1024)
+        return photo
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Folienbilder für Dynamic Messe Stand V4
+Lädt Bilder der DisplayList aus dem Asset-Store und skaliert sie für Canvas und Bitmaps
+"""
+
+import base64
+import io
+import os
+import struct
+import tkinter as tk
+from collections import OrderedDict
+from fractions import Fraction
+from core.assets import asset_store, is_asset_ref
+from core.logger import logger
+
+try:
+    from PIL import Image, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Tk-Anker -> (horizontaler Anteil, vertikaler Anteil) der Text- bzw. Bildbox
+TK_ANCHORS = {
+    'nw': (0, 0), 'n': (0.5, 0), 'ne': (1, 0),
+    'w': (0, 0.5), 'center': (0.5, 0.5), 'e': (1, 0.5),
+    'sw': (0, 1), 's': (0.5, 1), 'se': (1, 1)
+}
+
+def image_header_size(data):
+    """(Breite, Höhe) aus dem PNG-/GIF-Header - ohne Pillow und ohne Tk"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        return struct.unpack('<HH', data[6:10])
+    return None
+
+class SlideImageCache:
+    """Skalierte Folienbilder je (Quelle, Breite, Höhe)
+
+    Quelle ist ein Asset-Verweis oder ein Dateipfad. Die PhotoImages bleiben im
+    Cache referenziert, solange sie auf der Canvas angezeigt werden können.
+    """
+
+    def __init__(self, max_photos=64):
+        self.max_photos = max_photos
+        self._photos = OrderedDict()  # (Quelle, Breite, Höhe) -> PhotoImage
+        self._sizes = {}              # Quelle -> (Breite, Höhe) oder None
+
+    def read_bytes(self, source):
+        """Bilddaten einer Quelle (None, wenn nicht vorhanden)"""
+        if is_asset_ref(source):
+            return asset_store.read_bytes(source)
+        if isinstance(source, str) and os.path.isfile(source):
+            try:
+                with open(source, 'rb') as f:
+                    return f.read()
+            except OSError as e:
+                logger.error("Bild %s nicht lesbar: %s", source, e)
+        return None
+
+    def natural_size(self, source):
+        """Pixelgröße des Originalbilds (einmal je Quelle ermittelt)"""
+        if source in self._sizes:
+            return self._sizes[source]
+
+        size = None
+        data = self.read_bytes(source)
+        if data is not None:
+            size = image_header_size(data)
+            if size is None and PIL_AVAILABLE:
+                try:
+                    size = Image.open(io.BytesIO(data)).size
+                except Exception as e:
+                    logger.warning("Bildformat von %s unbekannt: %s", source, e)
+        if size is None:
+            logger.warning("Folienbild %s nicht darstellbar", source)
+
+        self._sizes[source] = size
+        return size
+
+    def pil_image(self, source, size):
+        """Pillow-Bild (RGBA) in der Zielgröße oder None"""
+        data = self.read_bytes(source)
+        if data is None:
+            return None
+        try:
+            image = Image.open(io.BytesIO(data)).convert('RGBA')
+        except Exception as e:
+            logger.error("Bild %s nicht lesbar: %s", source, e)
+            return None
+        if image.size != tuple(size):
+            image = image.resize(tuple(size), Image.Resampling.LANCZOS)
+        return image
+
+    def photo(self, source, size):
+        """PhotoImage in der Zielgröße (ohne Pillow per zoom/subsample angenähert)"""
+        if tk._default_root is None:
+            return None
+        key = (source, *size)
+        photo = self._photos.get(key)
+        if photo is not None:
+            self._photos.move_to_end(key)
+            return photo
+
+        if PIL_AVAILABLE:
+            image = self.pil_image(source, size)
+            photo = ImageTk.PhotoImage(image) if image is not None else None
+        else:
+            photo = self._tk_photo(source, size)
+        if photo is None:
+            return None
+
+        self._photos[key] = photo
+        while len(self._photos) > self.max_photos:
+            self._photos.popitem(last=False)
+        return photo
+
+    def _tk_photo(self, source, size):
+        """Tk liest PNG/GIF selbst, skaliert aber nur um ganzzahlige Faktoren"""
+        data = self.read_bytes(source)
+        natural = self.natural_size(source)
+        if data is None or natural is None:
+            return None
+        try:
+            photo = tk.PhotoImage(data=base64.b64encode(data))
+        except tk.TclError as e:
+            logger.error("Bild %s nicht lesbar: %s", source, e)
+            return None
+        ratio = max(Fraction(1, 8), Fraction(size[0], max(1, natural[0])).limit_denominator(8))
+        if ratio.numerator > 1:
+            photo = photo.zoom(ratio.numerator)
+        if ratio.denominator > 1:
+            photo = photo.subsample(ratio.denominator)
+        return photo
+
+    def tk_options(self, options):
+        """Ersetzt 'source'/'size' in Canvas-Optionen durch das skalierte PhotoImage"""
+        if 'source' not in options:
+            return options
+        tk_options = {name: value for name, value in options.items() if name not in ('source', 'size')}
+        tk_options['image'] = self.photo(options['source'], options['size']) or ''
+        return tk_options
+
+    def clear(self):
+        """Vergisst alle Bilder (z.B. nach dem Zerstören des Hauptfensters)"""
+        self._photos.clear()
+        self._sizes.clear()
+
+# Globale Instanz
+slide_images = SlideImageCache()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Slide Pager Component für Dynamic Messe Stand V4
+Seitenweise Navigation für Folienlisten (slides_per_page)
+"""
+
+import tkinter as tk
+from core.theme import theme_manager
+
+class SlidePager(tk.Frame):
+    """Kompakte Seiten-Navigation ◀ Seite x/y ▶"""
+
+    def __init__(self, parent, main_window, on_page_changed, bg=None):
+        colors = theme_manager.get_colors()
+        bg = bg or colors['background_secondary']
+        super().__init__(parent, bg=bg)
+        self.main_window = main_window
+        self.on_page_changed = on_page_changed
+        self.page = 0
+        self.page_count = 1
+
+        self.setup_pager(colors, bg)
+
+    def setup_pager(self, colors, bg):
+        """Erstellt die Navigations-Buttons und das Seiten-Label"""
+        fonts = self.main_window.fonts
+
+        self.prev_button = tk.Button(
+            self,
+            text="◀",
+            font=fonts['caption'],
+            bg=colors['background_tertiary'],
+            fg=colors['text_primary'],
+            relief='flat',
+            bd=0,
+            width=3,
+            cursor='hand2',
+            command=lambda: self.set_page(self.page - 1, notify=True)
+        )
+        self.prev_button.pack(side='left')
+
+        self.page_label = tk.Label(
+            self,
+            text="Seite 1/1",
+            font=fonts['caption'],
+            fg=colors['text_secondary'],
+            bg=bg
+        )
+        self.page_label.pack(side='left', expand=True)
+
+        self.next_button = tk.Button(
+            self,
+            text="▶",
+            font=fonts['caption'],
+            bg=colors['background_tertiary'],
+            fg=colors['text_primary'],
+            relief='flat',
+            bd=0,
+            width=3,
+            cursor='hand2',
+            command=lambda: self.set_page(self.page + 1, notify=True)
+        )
+        self.next_button.pack(side='right')
+
+    def update_pages(self, page, page_count):
+        """Aktualisiert die Anzeige ohne Callback"""
+        self.page_count = max(1, page_count)
+        self.page = min(max(0, page), self.page_count - 1)
+        self.page_label.configure(text=f"Seite {self.page + 1}/{self.page_count}")
+        self.prev_button.configure(state='normal' if self.page > 0 else 'disabled')
+        self.next_button.configure(state='normal' if self.page < self.page_count - 1 else 'disabled')
+
+    def set_page(self, page, notify=False):
+        """Wechselt die Seite und benachrichtigt optional den Besitzer"""
+        previous = self.page
+        self.update_pages(page, self.page_count)
+        if notify and self.page != previous:
+            self.on_page_changed(self.page)
@@ -6,127 +6,29 @@ Einheitliches Design für Demo und Creator
 
 import tkinter as tk
 from core.theme import theme_manager
+from core.perf import perf_events
+from ui.components.font_registry import font_registry, text_layouts
+from ui.components.slide_images import TK_ANCHORS, slide_images
+
+def tk_item_options(options):
+    """Layout-Optionen -> Tk-Optionen (registrierte Fonts, skalierte Bilder)"""
+    return slide_images.tk_options(font_registry.tk_options(options))
 
 class SlideRenderer:
     """PowerPoint-ähnlicher Slide Renderer für einheitliches Design"""
     
     @staticmethod
-    def render_slide_to_canvas(canvas, slide_data, canvas_width, canvas_height):
-    # Canvas leeren
-    canvas.delete("all")
-    
-    # EINHEITLICHE FARBEN für bessere Lesbarkeit
-    bg_color = slide_data.get('background_color', '#FFFFFF')
-    text_color = slide_data.get('text_color', '#1F1F1F')
-    title_color = '#1E88E5'   # Bertrandt Blau
-    accent_color = '#FF6600'  # Bertrandt Orange
-    
-    # Optimale Skalierung berechnen
-    margin = 40
-    scale_x = (canvas_width - margin) / 1920
-    scale_y = (canvas_height - margin) / 1080
-    scale_factor = min(scale_x, scale_y, 1.0)  # Nie größer als Original
-    
-    # Zentrierte Position
-    scaled_width = 1920 * scale_factor
-    scaled_height = 1080 * scale_factor
-    offset_x = (canvas_width - scaled_width) / 2
-    offset_y = (canvas_height - scaled_height) / 2
-    
-    # MODERNE SLIDE mit Schatten
-    shadow_offset = max(6, int(8 * scale_factor))
-    
-    # Schatten
-    canvas.create_rectangle(
-        offset_x + shadow_offset, offset_y + shadow_offset,
-        offset_x + scaled_width + shadow_offset, offset_y + scaled_height + shadow_offset,
-        fill='#D0D0D0', outline='', tags='slide_shadow'
-    )
-    
-    # Hauptbereich (weiß für gute Lesbarkeit)
-    canvas.create_rectangle(
-        offset_x, offset_y, offset_x + scaled_width, offset_y + scaled_height,
-        fill=bg_color, outline='#CCCCCC', width=2, tags='slide_background'
-    )
-    
-    # TITEL-BEREICH mit besserer Lesbarkeit
-    title_height = 100 * scale_factor
-    title_y = offset_y + (60 * scale_factor)
-    
-    title = slide_data.get('title', '')
-    if title:
-        canvas.create_text(
-            offset_x + scaled_width / 2, title_y,
-            text=title,
-            font=('Segoe UI', max(24, int(32 * scale_factor)), 'bold'),
-            fill=title_color,  # Bertrandt Blau für Titel
-            anchor='center',
-            width=scaled_width - (80 * scale_factor),
-            tags='slide_title'
-        )
-    
-    # AKZENT-LINIE unter dem Titel
-    line_y = title_y + (50 * scale_factor)
-    canvas.create_line(
-        offset_x + (60 * scale_factor), line_y,
-        offset_x + scaled_width - (60 * scale_factor), line_y,
-        fill=accent_color,  # Bertrandt Orange
-        width=max(3, int(4 * scale_factor)),
-        tags='slide_accent'
-    )
-    
-    # CONTENT-BEREICH mit besserer Formatierung
-    content = slide_data.get('content', '')
-    if content:
-        content_y_start = line_y + (40 * scale_factor)
-        content_lines = content.replace('\n\n', '\n').split('\n')
-        line_height = max(28, int(35 * scale_factor))
+    def layout_slide(slide_data, canvas_width, canvas_height):
+        """Berechnet alle Elemente einer Slide als Liste (Schlüssel, Typ, Koordinaten, Optionen)
         
-        for i, line in enumerate(content_lines[:12]):  # Max 12 Zeilen
-            if line.strip() and content_y_start + (i * line_height) < offset_y + scaled_height - (80 * scale_factor):
-                # Bullet-Points für bessere Struktur
-                display_text = f"• {line.strip()}" if not line.strip().startswith('•') else line.strip()
-                
-                canvas.create_text(
-                    offset_x + (80 * scale_factor),
-                    content_y_start + (i * line_height),
-                    text=display_text,
-                    font=('Segoe UI', max(12, int(16 * scale_factor))),
-                    fill=text_color,  # Dunkler Text für gute Lesbarkeit
-                    anchor='nw',
-                    width=scaled_width - (160 * scale_factor),
-                    tags='slide_content'
-                )
-    
-    # BRANDING (konsistent)
-    # Bertrandt-Logo (unten rechts)
-    canvas.create_text(
-        offset_x + scaled_width - (40 * scale_factor),
-        offset_y + scaled_height - (40 * scale_factor),
-        text="BERTRANDT",
-        font=('Segoe UI', max(10, int(14 * scale_factor)), 'bold'),
-        fill='#003366',  # Bertrandt Corporate Blau
-        anchor='se',
-        tags='slide_branding'
-    )
-    
-    # Folien-Nummer (unten links)
-    slide_number = slide_data.get('slide_number', 1)
-    canvas.create_text(
-        offset_x + (40 * scale_factor),
-        offset_y + scaled_height - (40 * scale_factor),
-        text=f"Folie {slide_number}",
-        font=('Segoe UI', max(8, int(12 * scale_factor))),
-        fill='#666666',
-        anchor='sw',
-        tags='slide_number'
-    )
-    
-    @staticmethod
-    def render_slide_to_canvas(canvas, slide_data, canvas_width, canvas_height):
-        """Rendert eine Slide auf eine Canvas im PowerPoint-Stil"""
-        # Canvas leeren
-        canvas.delete("all")
+        Gemeinsame Grundlage für das direkte und das Retained-Mode-Rendering.
+        Mit 'display_list' wird das gespeicherte Creator-Layout wiedergegeben.
+        """
+        display_list = slide_data.get('display_list')
+        if display_list:
+            return SlideRenderer.layout_display_list(display_list, slide_data, canvas_width, canvas_height)
+        
+        items = []
         
         # PowerPoint-ähnlicher Hintergrund
         bg_color = slide_data.get('background_color', '#FFFFFF')
@@ -137,54 +39,41 @@ class SlideRenderer:
         slide_margin = 40
         
         # Schatten
-        canvas.create_rectangle(
-            slide_margin + shadow_offset, 
+        items.append(('shadow', 'rectangle', (
+            slide_margin + shadow_offset,
             slide_margin + shadow_offset,
             canvas_width - slide_margin + shadow_offset,
-            canvas_height - slide_margin + shadow_offset,
-            fill='#D0D0D0',
-            outline='',
-            tags='slide_shadow'
-        )
+            canvas_height - slide_margin + shadow_offset
+        ), {'fill': '#D0D0D0', 'outline': '', 'tags': 'slide_shadow'}))
         
         # Hauptbereich
-        canvas.create_rectangle(
-            slide_margin, 
+        items.append(('background', 'rectangle', (
+            slide_margin,
             slide_margin,
             canvas_width - slide_margin,
-            canvas_height - slide_margin,
-            fill=bg_color,
-            outline='#CCCCCC',
-            width=2,
-            tags='slide_background'
-        )
+            canvas_height - slide_margin
+        ), {'fill': bg_color, 'outline': '#CCCCCC', 'width': 2, 'tags': 'slide_background'}))
         
         # Titel-Bereich (oberer Teil)
         title_height = 120
-        canvas.create_rectangle(
-            slide_margin + 1, 
+        items.append(('title_area', 'rectangle', (
+            slide_margin + 1,
             slide_margin + 1,
             canvas_width - slide_margin - 1,
-            slide_margin + title_height,
-            fill='#F8F9FA',
-            outline='#E9ECEF',
-            width=1,
-            tags='title_area'
-        )
+            slide_margin + title_height
+        ), {'fill': '#F8F9FA', 'outline': '#E9ECEF', 'width': 1, 'tags': 'title_area'}))
         
         # Titel anzeigen
         title = slide_data.get('title', '')
         if title:
-            canvas.create_text(
-                canvas_width / 2,
-                slide_margin + title_height / 2,
-                text=title,
-                font=('Segoe UI', 24, 'bold'),
-                fill='#2C3E50',
-                anchor='center',
-                width=canvas_width - slide_margin * 2 - 40,
-                tags='slide_title'
-            )
+            items.append(('title', 'text', (canvas_width / 2, slide_margin + title_height / 2), {
+                'text': title,
+                'font': ('Segoe UI', 24, 'bold'),
+                'fill': '#2C3E50',
+                'anchor': 'center',
+                'width': canvas_width - slide_margin * 2 - 40,
+                'tags': 'slide_title'
+            }))
         
         # Content-Bereich
         content = slide_data.get('content', '')
@@ -192,46 +81,151 @@ class SlideRenderer:
             content_y_start = slide_margin + title_height + 40
             
             # Content in Zeilen aufteilen
-            content_lines = content.replace('\n\n', '\n').split('\n')
+            content_lines = slide_data.get('content_lines')
+            if content_lines is None:
+                content_lines = content.replace('\n\n', '\n').split('\n')
             line_height = 35
             y_position = content_y_start
+            line_count = 0
+            
+            content_font = ('Segoe UI', 14)
+            content_width = canvas_width - slide_margin * 2 - 120
+            measure = font_registry.is_available()
             
             for line in content_lines:
                 if line.strip() and y_position < canvas_height - slide_margin - 40:
-                    canvas.create_text(
-                        slide_margin + 60,
-                        y_position,
-                        text=line.strip(),
-                        font=('Segoe UI', 14),
-                        fill=text_color,
-                        anchor='nw',
-                        width=canvas_width - slide_margin * 2 - 120,
-                        tags='slide_content'
-                    )
-                    y_position += line_height
+                    items.append((f'content_{line_count}', 'text', (slide_margin + 60, y_position), {
+                        'text': line.strip(),
+                        'font': content_font,
+                        'fill': text_color,
+                        'anchor': 'nw',
+                        'width': content_width,
+                        'tags': 'slide_content'
+                    }))
+                    # Umgebrochene Zeilen brauchen mehr Platz (Umbruch aus dem Cache)
+                    if measure:
+                        wrapped = text_layouts.wrap(line.strip(), font_registry.font(content_font), content_width)
+                        y_position += max(line_height, wrapped.height)
+                    else:
+                        y_position += line_height
+                    line_count += 1
         
         # Bertrandt-Branding (unten rechts)
-        canvas.create_text(
-            canvas_width - slide_margin - 20,
-            canvas_height - slide_margin - 20,
-            text="BERTRANDT",
-            font=('Segoe UI', 10, 'bold'),
-            fill='#003366',
-            anchor='se',
-            tags='branding'
-        )
+        items.append(('branding', 'text', (canvas_width - slide_margin - 20, canvas_height - slide_margin - 20), {
+            'text': "BERTRANDT",
+            'font': ('Segoe UI', 10, 'bold'),
+            'fill': '#003366',
+            'anchor': 'se',
+            'tags': 'branding'
+        }))
         
         # Folien-Nummer (unten links)
         slide_number = slide_data.get('slide_number', 1)
-        canvas.create_text(
-            slide_margin + 20,
-            canvas_height - slide_margin - 20,
-            text=f"Folie {slide_number}",
-            font=('Segoe UI', 10),
-            fill='#666666',
-            anchor='sw',
-            tags='slide_number'
-        )
+        items.append(('slide_number', 'text', (slide_margin + 20, canvas_height - slide_margin - 20), {
+            'text': f"Folie {slide_number}",
+            'font': ('Segoe UI', 10),
+            'fill': '#666666',
+            'anchor': 'sw',
+            'tags': 'slide_number'
+        }))
+        
+        return items
+    
+    @staticmethod
+    def layout_display_list(display_list, slide_data, canvas_width, canvas_height):
+        """Gibt eine kompilierte DisplayList skaliert und zentriert als Elementliste wieder
+        
+        Nur Multiplikationen je Befehl - kein erneutes Parsen der canvas_elements.
+        Titel/Inhalt-Editoren zeigen den aktuellen Text der Slide.
+        """
+        margin = min(40, canvas_width / 48, canvas_height / 27)
+        scale = max(0.01, min(
+            (canvas_width - 2 * margin) / display_list.width,
+            (canvas_height - 2 * margin) / display_list.height
+        ))
+        offset_x = (canvas_width - display_list.width * scale) / 2
+        offset_y = (canvas_height - display_list.height * scale) / 2
+        font_scale = scale * display_list.font_scale
+        role_texts = {'title': slide_data.get('title'), 'body': slide_data.get('content')}
+        
+        # Schatten wie beim Standard-Layout
+        shadow_offset = max(2, 8 * scale)
+        items = [('shadow', 'rectangle', (
+            offset_x + shadow_offset,
+            offset_y + shadow_offset,
+            offset_x + display_list.width * scale + shadow_offset,
+            offset_y + display_list.height * scale + shadow_offset
+        ), {'fill': '#D0D0D0', 'outline': '', 'tags': 'slide_shadow'})]
+        
+        for index, op in enumerate(display_list.ops):
+            coords = tuple(
+                (offset_x if i % 2 == 0 else offset_y) + value * scale
+                for i, value in enumerate(op.coords)
+            )
+            key = f'op_{index}'
+            
+            if op.op == 'text':
+                text = role_texts.get(op.role)
+                family, size, *styles = op.font
+                options = {
+                    'text': op.text if text is None else text,
+                    # Größe mit Vorzeichen skalieren (negativ = Pixel)
+                    'font': (family, int(round(size * font_scale)) or (1 if size > 0 else -1), *styles),
+                    'fill': op.fill or '#1F1F1F',
+                    'anchor': op.anchor,
+                    'tags': 'slide_content'
+                }
+                if op.wrap:
+                    options['width'] = op.wrap * scale
+                items.append((key, 'text', coords, options))
+            
+            elif op.op in ('rect', 'oval'):
+                items.append((key, 'rectangle' if op.op == 'rect' else 'oval', coords, {
+                    'fill': op.fill or '',
+                    'outline': op.outline or '',
+                    'width': max(1, op.line_width * scale),
+                    'tags': 'slide_background' if index == 0 else 'slide_shape'
+                }))
+            
+            elif op.op == 'line':
+                items.append((key, 'line', coords, {
+                    'fill': op.fill or '#000000',
+                    'width': max(1, op.line_width * scale),
+                    'tags': 'slide_shape'
+                }))
+            
+            elif op.op == 'image':
+                # Bildquelle und Zielgröße; das PhotoImage bzw. Pillow-Bild erzeugt der Zeichenpfad
+                if len(coords) == 4:
+                    left, top = coords[:2]
+                    size = (coords[2] - left, coords[3] - top)
+                else:
+                    natural = slide_images.natural_size(op.image)
+                    if natural is None:
+                        continue
+                    # Bildpixel stammen wie Schriftgrößen aus der verkleinerten Creator-Canvas
+                    size = (natural[0] * font_scale, natural[1] * font_scale)
+                    fraction_x, fraction_y = TK_ANCHORS.get(op.anchor, (0.5, 0.5))
+                    left = coords[0] - size[0] * fraction_x
+                    top = coords[1] - size[1] * fraction_y
+                items.append((key, 'image', (left, top), {
+                    'source': op.image,
+                    'size': (max(1, int(round(size[0]))), max(1, int(round(size[1])))),
+                    'anchor': 'nw',
+                    'tags': 'slide_image'
+                }))
+        
+        return items
+    
+    @staticmethod
+    @perf_events.timed("slide.render")
+    def render_slide_to_canvas(canvas, slide_data, canvas_width, canvas_height):
+        """Rendert eine Slide auf eine Canvas im PowerPoint-Stil"""
+        # Canvas leeren
+        canvas.delete("all")
+        
+        for _, item_type, coords, options in SlideRenderer.layout_slide(slide_data, canvas_width, canvas_height):
+            getattr(canvas, f"create_{item_type}")(*coords, **tk_item_options(options))
     
     @staticmethod
     def render_slide_to_frame(parent_frame, slide_data):
@@ -357,3 +351,109 @@ class SlideRenderer:
             'branding': '#003366',
             'meta_text': '#666666'
         }
+
+class RetainedSlideRenderer:
+    """Retained-Mode-Renderer für eine Canvas
+    
+    Erzeugt die Canvas-Items einmal und aktualisiert danach nur coords/itemconfigure
+    der vorhandenen Items; nicht benötigte Items werden versteckt statt gelöscht.
+    """
+    
+    def __init__(self, canvas, bitmap_cache=None):
+        self.canvas = canvas
+        self.bitmap_cache = bitmap_cache  # optionaler SlideBitmapCache für die Wiedergabe
+        self._items = {}    # Schlüssel -> (Item-ID, Typ)
+        self._state = {}    # Item-ID -> zuletzt gesetzte (coords, options)
+        self.created = 0    # Zähler für Messungen
+        self.updated = 0
+    
+    def clear(self):
+        """Löscht alle eigenen Items (z.B. vor einem Platzhalter)"""
+        for item_id, _ in self._items.values():
+            self.canvas.delete(item_id)
+        self._items.clear()
+        self._state.clear()
+    
+    def _is_valid(self):
+        """Erkennt, ob die Canvas von außen geleert wurde"""
+        if not self._items:
+            return True
+        item_id, _ = next(iter(self._items.values()))
+        return bool(self.canvas.type(item_id))
+    
+    def _restore_stacking(self, item_id, previous_item_id, following):
+        """Neu erzeugte Items landen oben - an ihre Position in der Layout-Reihenfolge schieben"""
+        if previous_item_id is not None:
+            self.canvas.tag_raise(item_id, previous_item_id)
+            return
+        for key, *_ in following:
+            entry = self._items.get(key)
+            if entry is not None:
+                self.canvas.tag_lower(item_id, entry[0])
+                return
+    
+    @perf_events.timed("slide.render")
+    def render(self, slide_data, canvas_width, canvas_height, cache_key=None):
+        """Bringt die Canvas auf den Stand der Slide - ohne Items neu zu erzeugen
+        
+        Mit Bitmap-Cache und cache_key (slide_id, Version) wird die Slide als ein
+        einziges Bild-Item angezeigt.
+        """
+        if not self._is_valid():
+            self._items.clear()
+            self._state.clear()
+        
+        items = None
+        if self.bitmap_cache is not None and cache_key is not None:
+            photo = self.bitmap_cache.get(*cache_key, slide_data, canvas_width, canvas_height)
+            if photo is not None:
+                items = [('bitmap', 'image', (0, 0), {'image': photo, 'anchor': 'nw', 'tags': 'slide_bitmap'})]
+        if items is None:
+            items = SlideRenderer.layout_slide(slide_data, canvas_width, canvas_height)
+        items = list(items)
+        
+        canvas = self.canvas
+        visible = set()
+        previous_item_id = None
+        
+        for index, (key, item_type, coords, options) in enumerate(items):
+            visible.add(key)
+            entry = self._items.get(key)
+            
+            if entry is None or entry[1] != item_type:
+                if entry is not None:
+                    canvas.delete(entry[0])
+                item_id = getattr(canvas, f"create_{item_type}")(*coords, **tk_item_options(options))
+                self._items[key] = (item_id, item_type)
+                self._state[item_id] = (coords, options)
+                self.created += 1
+                self._restore_stacking(item_id, previous_item_id, items[index + 1:])
+                previous_item_id = item_id
+                continue
+            
+            item_id = previous_item_id = entry[0]
+            previous_coords, previous_options = self._state.get(item_id, (None, {}))
+            if coords != previous_coords:
+                canvas.coords(item_id, *coords)
+            changed = {
+                name: value for name, value in options.items()
+                if name != 'tags' and previous_options.get(name) != value
+            }
+            if previous_options.get('state') == 'hidden':
+                changed['state'] = 'normal'
+            if 'source' in changed or 'size' in changed:
+                # Das PhotoImage hängt von Quelle und Größe gemeinsam ab
+                changed.update(source=options['source'], size=options['size'])
+            if changed:
+                canvas.itemconfigure(item_id, **tk_item_options(changed))
+            if coords != previous_coords or changed:
+                self._state[item_id] = (coords, options)
+                self.updated += 1
+        
+        # Überzählige Items (z.B. weniger Content-Zeilen) verstecken
+        for key, (item_id, _) in self._items.items():
+            if key not in visible:
+                coords, options = self._state.get(item_id, (None, {}))
+                if options.get('state') != 'hidden':
+                    canvas.itemconfigure(item_id, state='hidden')
+                    self._state[item_id] = (coords, dict(options, state='hidden'))
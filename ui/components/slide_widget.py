@@ -197,7 +197,7 @@ class SlideWidget(tk.Frame):
                     self.content_label.insert('1.0', content_text)
                     self.content_label.configure(state='disabled')
                     
-                logger.debug(f"Slide {self.slide_id} content loaded successfully")
+                logger.debug("Slide %s content loaded successfully", self.slide_id)
             else:
                 # Встановлюємо контент за замовчуванням
                 self.set_default_content()
@@ -262,7 +262,7 @@ class SlideWidget(tk.Frame):
                         'content': content_text
                     })
                     
-                logger.debug(f"Slide {self.slide_id} content updated")
+                logger.debug("Slide %s content updated", self.slide_id)
                 
             except Exception as e:
                 logger.error(f"Error updating slide content: {e}")
@@ -300,7 +300,7 @@ class SlideWidget(tk.Frame):
                     self.content_label.insert('1.0', content_data['content'])
                     self.content_label.configure(state='disabled')
                     
-            logger.debug(f"Slide {self.slide_id} content updated externally")
+            logger.debug("Slide %s content updated externally", self.slide_id)
             
         except Exception as e:
             logger.error(f"Error updating slide content externally: {e}")
@@ -11,6 +11,7 @@ import subprocess
 from core.config import config
 from core.theme import theme_manager, THEME_VARS, _mix
 from core.logger import logger
+from core.perf import perf_events
 from ui.components.header import HeaderComponent
 from ui.components.status_panel import StatusPanelComponent
 from ui.components.footer import FooterComponent
@@ -78,7 +79,7 @@ def on_content_changed(self, slide_id, slide_data, action='update'):
             if hasattr(self.home_tab, 'refresh_content'):
                 self.home_tab.refresh_content()
         
-        logger.debug(f"All tabs synchronized for slide {slide_id} change")
+        logger.debug("All tabs synchronized for slide %s change", slide_id)
         
     except Exception as e:
         logger.error(f"Error synchronizing tabs: {e}")
@@ -138,7 +139,7 @@ def switch_tab(self, tab_name):
                 self.header.update_active_tab(tab_name)
         
         self.current_tab = tab_name
-        logger.debug(f"Switched to {tab_name} tab with synchronization")
+        logger.debug("Switched to %s tab with synchronization", tab_name)
         
     except Exception as e:
         logger.error(f"Error switching to {tab_name} tab: {e}")
@@ -326,7 +327,7 @@ def load_presentation(self):
         # Responsive Schriftarten
         self.fonts = theme_manager.get_fonts(self.window_width, self.window_height)
         
-        logger.debug(f"Responsive Design: {self.window_width}x{self.window_height}, Scale: {self.scale_factor:.2f}")
+        logger.debug("Responsive Design: %sx%s, Scale: %.2f", self.window_width, self.window_height, self.scale_factor)
     
     def setup_styles(self):
         """Wendet das komplette Bertrandt Dark Theme an - überschreibt alle anderen Styles"""
@@ -788,18 +789,19 @@ def load_presentation(self):
             logger.error(f"Unbekannter Tab: {tab_name}")
             return False
         
-        # Aktuellen Tab verstecken
-        if self.current_tab in self.tabs:
-            self.tabs[self.current_tab].hide()
-        
-        # Neuen Tab anzeigen
-        self.tabs[tab_name].show()
-        self.current_tab = tab_name
-        
-        # Navbar-Navigation aktualisieren
-        self.update_navbar_active_tab(tab_name)
+        with perf_events.span("tab.switch", tab=tab_name):
+            # Aktuellen Tab verstecken
+            if self.current_tab in self.tabs:
+                self.tabs[self.current_tab].hide()
+            
+            # Neuen Tab anzeigen
+            self.tabs[tab_name].show()
+            self.current_tab = tab_name
+            
+            # Navbar-Navigation aktualisieren
+            self.update_navbar_active_tab(tab_name)
         
-        logger.debug(f"Tab gewechselt: {tab_name}")
+        logger.debug("Tab gewechselt: %s", tab_name)
         return True
     
     def toggle_fullscreen(self, event=None):
@@ -12,6 +12,8 @@ from PIL import Image, ImageTk
 from core.theme import theme_manager
 from core.logger import logger
 from ui.components.slide_widget import SlideWidget
+from ui.components.resize_coalescer import ResizeCoalescer
+from ui.components.font_registry import font_registry
 from datetime import datetime
 
 class CreatorTabQt(QWidget):
@@ -305,6 +307,13 @@ class CreatorTab:
         
         self.create_creator_content()
         
+        # Tastenkürzel einmalig binden - der Header wird bei Theme-Wechseln neu aufgebaut
+        # (nur aktiv, wenn der Creator-Tab sichtbar ist)
+        root = self.main_window.root
+        root.bind_all('<Control-z>', self.on_undo_shortcut, add='+')
+        root.bind_all('<Control-y>', self.on_redo_shortcut, add='+')
+        root.bind_all('<Control-Shift-Z>', self.on_redo_shortcut, add='+')
+        
         self.schedule_auto_save()
         
     def schedule_auto_save(self):
@@ -335,24 +344,14 @@ def save_current_slide_content(self):
                     if isinstance(widget, tk.Text):
                         text_content = widget.get('1.0', 'end-1c')
                         
-                        # Визначити тип на основі font або положення
-                        font = widget.cget('font')
-                        if isinstance(font, tuple) and len(font) >= 2:
-                            font_size = font[1] if isinstance(font[1], int) else int(font[1])
-                            
-                            # Великий шрифт = заголовок
-                            if font_size >= 20 or 'bold' in str(font):
-                                if not title_text:  # Перший великий текст = заголовок
-                                    title_text = text_content
-                                else:
-                                    content_text += text_content + "\n"
-                            else:
-                                content_text += text_content + "\n"
+                        # Тип визначає роль шрифту з реєстру, а не розбір font-кортежу
+                        if font_registry.role_of(widget.cget('font')) == 'title' and not title_text:
+                            title_text = text_content  # Перший заголовок
                         else:
                             content_text += text_content + "\n"
                             
                 except Exception as e:
-                    logger.debug(f"Could not process canvas widget: {e}")
+                    logger.debug("Could not process canvas widget: %s", e)
                     continue
         
         # Очистити зайві переноси рядків
@@ -391,7 +390,7 @@ def save_current_slide_content(self):
                 
                 self.main_window.root.after(3000, restore_text)
             
-            logger.info(f"Successfully saved slide {self.current_edit_slide}: {title_text[:30]}...")
+            logger.info("Successfully saved slide %s: %.30s...", self.current_edit_slide, title_text)
         else:
             logger.error(f"Failed to save slide {self.current_edit_slide}")
             
@@ -425,7 +424,13 @@ def load_slide_to_editor(self, slide_id):
             self.add_slide_frame()
             
             # Додати контент як редагуємі widgets
-            self.add_editable_content_widgets(slide.title, slide.content)
+            self.add_editable_content_widgets(slide.title, slide.content, slide.content_lines)
+            
+            # Сторінку з thumbnail поточного слайду зробити видимою
+            page = content_manager.get_page_for_slide(slide_id)
+            if page != getattr(self, 'thumbnail_page', 0):
+                self.thumbnail_page = page
+                self.create_slide_thumbnails()
             
             # Оновити UI
             self.update_thumbnail_selection()
@@ -436,7 +441,7 @@ def load_slide_to_editor(self, slide_id):
                     text=f"Demo-Folie {slide_id}: {slide.title}"
                 )
             
-            logger.debug(f"Loaded slide {slide_id} into editor: {slide.title}")
+            logger.debug("Loaded slide %s into editor: %s", slide_id, slide.title)
             
         else:
             logger.warning(f"Slide {slide_id} not found")
@@ -446,7 +451,7 @@ def load_slide_to_editor(self, slide_id):
 
 # ДОДАТИ НОВИЙ МЕТОД add_editable_content_widgets
 
-def add_editable_content_widgets(self, title, content):
+def add_editable_content_widgets(self, title, content, content_lines=None):
     """Додає редагуємі widgets з контентом на canvas"""
     try:
         colors = theme_manager.get_colors()
@@ -458,7 +463,7 @@ def add_editable_content_widgets(self, title, content):
                 self.slide_canvas,
                 width=60,
                 height=3,
-                font=(fonts['title'][0], 28, 'bold'),
+                font=font_registry.font((fonts['title'][0], 28, 'bold'), role='title'),
                 bg='white',
                 fg='#1E88E5',
                 relief='flat',
@@ -482,14 +487,16 @@ def add_editable_content_widgets(self, title, content):
         
         # Контент як редагуємий Text widget
         if content:
-            content_lines = content.split('\n')
-            clean_content = '\n'.join([line.strip() for line in content_lines if line.strip()])
+            # Готові рядки зі SlideData, щоб не розбирати текст повторно
+            if content_lines is None:
+                content_lines = [line.strip() for line in content.split('\n') if line.strip()]
+            clean_content = '\n'.join(content_lines)
             
             content_widget = tk.Text(
                 self.slide_canvas,
                 width=70,
                 height=min(20, max(8, len(content_lines) + 2)),
-                font=(fonts['body'][0], 16),
+                font=font_registry.font((fonts['body'][0], 16), role='body'),
                 bg='white',
                 fg='#2C3E50',
                 relief='flat',
@@ -556,7 +563,7 @@ def update_thumbnail_selection(self):
                     fg=colors['text_primary']
                 )
         
-        logger.debug(f"Updated thumbnail selection for slide {self.current_edit_slide}")
+        logger.debug("Updated thumbnail selection for slide %s", self.current_edit_slide)
         
     except Exception as e:
         logger.error(f"Error updating thumbnail selection: {e}")
@@ -566,9 +573,10 @@ def update_thumbnail_selection(self):
 def update_slide_counter(self):
     """Оновлює лічильник слайдів"""
     try:
+        from models.content import content_manager
         if hasattr(self, 'slide_counter'):
             self.slide_counter.configure(
-                text=f"Demo-Folie {self.current_edit_slide} von {len(self.thumbnail_buttons)}"
+                text=f"Demo-Folie {self.current_edit_slide} von {content_manager.get_slide_count()}"
             )
     except Exception as e:
         logger.error(f"Error updating slide counter: {e}")
@@ -690,6 +698,37 @@ def update_slide_counter(self):
         )
         preview_btn.pack(side='left', padx=(0, 10), pady=15)
         
+        # Rückgängig / Wiederholen
+        undo_btn = tk.Button(
+            actions_frame,
+            text="↶",
+            font=fonts['button'],
+            bg=colors['background_tertiary'],
+            fg=colors['text_primary'],
+            relief='flat',
+            bd=0,
+            padx=12,
+            pady=10,
+            cursor='hand2',
+            command=self.undo_edit
+        )
+        undo_btn.pack(side='left', padx=(0, 5), pady=15)
+        
+        redo_btn = tk.Button(
+            actions_frame,
+            text="↷",
+            font=fonts['button'],
+            bg=colors['background_tertiary'],
+            fg=colors['text_primary'],
+            relief='flat',
+            bd=0,
+            padx=12,
+            pady=10,
+            cursor='hand2',
+            command=self.redo_edit
+        )
+        redo_btn.pack(side='left', padx=(0, 10), pady=15)
+        
         # Slide-Navigation
         nav_frame = tk.Frame(header_frame, bg=colors['background_secondary'])
         nav_frame.pack(side='right', fill='y', padx=(20, 15))
@@ -738,6 +777,46 @@ def update_slide_counter(self):
         )
         next_btn.pack(side='left', padx=(5, 0))
     
+    def undo_edit(self):
+        """Macht die letzte Folien-Bearbeitung rückgängig"""
+        from models.history import edit_history
+        # Offene Eingaben zuerst übernehmen, damit sie Teil der Historie sind
+        if self.current_slide:
+            self.save_current_slide_content()
+        self.show_history_result(edit_history.undo())
+    
+    def redo_edit(self):
+        """Stellt die zuletzt rückgängig gemachte Bearbeitung wieder her"""
+        from models.history import edit_history
+        self.show_history_result(edit_history.redo())
+    
+    def show_history_result(self, slide_id):
+        """Lädt die von Undo/Redo betroffene Folie ohne erneutes Speichern"""
+        if slide_id is None:
+            return
+        from models.content import content_manager
+        if content_manager.get_slide(slide_id) is None:
+            if content_manager.get_slide(self.current_edit_slide):
+                slide_id = self.current_edit_slide
+            else:
+                slide_ids = content_manager.get_slide_ids()
+                slide_id = slide_ids[0] if slide_ids else self.current_edit_slide
+        # current_slide zurücksetzen, damit load_slide_to_editor nicht zuerst speichert
+        self.current_slide = None
+        self.load_slide_to_editor(slide_id)
+    
+    def on_undo_shortcut(self, event=None):
+        """Strg+Z im Creator-Tab"""
+        if getattr(self.main_window, 'current_tab', None) == 'creator':
+            self.undo_edit()
+            return 'break'
+    
+    def on_redo_shortcut(self, event=None):
+        """Strg+Y / Strg+Umschalt+Z im Creator-Tab"""
+        if getattr(self.main_window, 'current_tab', None) == 'creator':
+            self.redo_edit()
+            return 'break'
+    
     def create_slides_overview_panel(self, parent):
         """Erstellt die Folien-Übersicht (links) - Demo-Folien"""
         colors = theme_manager.get_colors()
@@ -777,6 +856,20 @@ def update_slide_counter(self):
         )
         info_label.pack(anchor='w', pady=(5, 0))
         
+        # Suche über alle Folien
+        self.slide_search_var = tk.StringVar()
+        search_entry = tk.Entry(
+            header_frame,
+            textvariable=self.slide_search_var,
+            font=fonts['caption'],
+            bg=colors['background_tertiary'],
+            fg=colors['text_primary'],
+            insertbackground=colors['text_primary'],
+            relief='flat'
+        )
+        search_entry.pack(fill='x', pady=(8, 0), ipady=3)
+        search_entry.bind('<Return>', self.on_slide_search)
+        
         # Scrollable Thumbnail List
         canvas = tk.Canvas(panel_frame, bg=colors['background_secondary'], highlightthickness=0)
         scrollbar = tk.Scrollbar(panel_frame, orient="vertical", command=canvas.yview)
@@ -790,6 +883,11 @@ def update_slide_counter(self):
         canvas.create_window((0, 0), window=self.thumbnail_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
+        # Seitenweise Navigation (slides_per_page)
+        from ui.components.slide_pager import SlidePager
+        self.thumbnail_pager = SlidePager(panel_frame, self.main_window, self.on_thumbnail_page_changed)
+        self.thumbnail_pager.pack(fill='x', padx=15, pady=(0, 5))
+        
         canvas.pack(side="left", fill="both", expand=True, padx=(15, 0), pady=(0, 15))
         scrollbar.pack(side="right", fill="y", pady=(0, 15))
         
@@ -801,17 +899,23 @@ def update_slide_counter(self):
         colors = theme_manager.get_colors()
         fonts = self.main_window.fonts
         
+        # Alte Thumbnails entfernen
+        for widget in self.thumbnail_frame.winfo_children():
+            widget.destroy()
+        
         self.thumbnail_buttons = {}
         
-        # Content-Manager verwenden (Demo-Folien)
+        # Content-Manager verwenden (Demo-Folien) - nur die aktuelle Seite aufbauen
         from models.content import content_manager
-        slides = content_manager.get_all_slides()
-        
-        if not slides:
+        if content_manager.get_slide_count() == 0:
             logger.warning("Keine Demo-Folien gefunden")
             return
         
-        for slide_id, slide in slides.items():
+        page_count = content_manager.get_page_count()
+        self.thumbnail_page = min(getattr(self, 'thumbnail_page', 0), page_count - 1)
+        self.thumbnail_pager.update_pages(self.thumbnail_page, page_count)
+        
+        for slide_id, slide in content_manager.get_page(self.thumbnail_page):
             try:
                 # Thumbnail-Container
                 thumb_container = tk.Frame(
@@ -848,6 +952,20 @@ def update_slide_counter(self):
             except Exception as e:
                 logger.error(f"Fehler beim Erstellen von Thumbnail für Slide {slide_id}: {e}")
     
+    def on_thumbnail_page_changed(self, page):
+        """Wechselt die angezeigte Thumbnail-Seite"""
+        self.thumbnail_page = page
+        self.create_slide_thumbnails()
+    
+    def on_slide_search(self, event=None):
+        """Springt zur besten passenden Folie aus dem Suchindex"""
+        from models.search import slide_search_index, CURRENT_SOURCE
+        results = slide_search_index.search(self.slide_search_var.get(), limit=1, source=CURRENT_SOURCE)
+        if results:
+            self.load_slide_to_editor(results[0].slide_id)
+        else:
+            logger.debug("Keine Folie gefunden für: %s", self.slide_search_var.get())
+    
     def create_main_editor_panel(self, parent):
         """Erstellt den Haupt-Editor (mitte) - immer weiße Canvas"""
         colors = theme_manager.get_colors()
@@ -894,8 +1012,8 @@ def update_slide_counter(self):
         )
         self.slide_canvas.pack(fill='both', expand=True)
         
-        # Canvas-Größe überwachen und Folie entsprechend skalieren
-        self.slide_canvas.bind('<Configure>', self.on_canvas_resize)
+        # Canvas-Größe überwachen und Folie entsprechend skalieren (gebündelt je Frame)
+        self.resize_coalescer = ResizeCoalescer(self.slide_canvas, self.on_canvas_resize, "creator").bind()
         
         # Initiale Drop-Zone erstellen (unsichtbar)
         self.create_slide_content()
@@ -967,11 +1085,9 @@ def update_slide_counter(self):
         self.add_slide_frame()
         
         # Debug-Info für optimale Skalierung
-        logger.debug(f"Canvas: {canvas_width}x{canvas_height}, "
-                    f"Slide: {self.slide_width}x{self.slide_height}, "
-                    f"Scale: {self.scale_factor:.3f}, "
-                    f"Scaled: {scaled_width:.0f}x{scaled_height:.0f}, "
-                    f"Offset: ({self.offset_x:.0f}, {self.offset_y:.0f})")
+        logger.debug("Canvas: %sx%s, Slide: %sx%s, Scale: %.3f, Scaled: %.0fx%.0f, Offset: (%.0f, %.0f)",
+                     canvas_width, canvas_height, self.slide_width, self.slide_height,
+                     self.scale_factor, scaled_width, scaled_height, self.offset_x, self.offset_y)
         
         # Alle bestehenden Elemente neu skalieren
         self.rescale_existing_elements()
@@ -6,10 +6,15 @@ Demo Tab для Dynamic Messe Stand V4
 
 import tkinter as tk
 from tkinter import ttk
+from bisect import bisect_left
+from core.config import config
 from core.theme import theme_manager
 from core.logger import logger
 from models.content import content_manager
-from ui.components.slide_renderer import SlideRenderer
+from ui.components.slide_renderer import RetainedSlideRenderer
+from ui.components.slide_bitmap_cache import SlideBitmapCache
+from ui.components.slide_pager import SlidePager
+from ui.components.resize_coalescer import ResizeCoalescer
 
 class DemoTab:
     """Demo Tab для автоматичного відтворення презентацій"""
@@ -22,6 +27,7 @@ class DemoTab:
         self.is_running = False
         self.slide_duration = 5000  # мілісекунди
         self.demo_timer = None
+        self.list_page = 0  # Поточна сторінка списку слайдів
         
         # Підписка на зміни контенту
         content_manager.add_observer(self.on_content_changed)
@@ -173,8 +179,15 @@ class DemoTab:
         )
         self.slide_canvas.pack(fill='both', expand=True, padx=20, pady=20)
         
-        # Bind resize для адаптивності
-        self.slide_canvas.bind('<Configure>', self.on_canvas_resize)
+        # Bind resize для адаптивності - серія <Configure> дає один перерахунок на кадр
+        self.resize_coalescer = ResizeCoalescer(self.slide_canvas, self.on_canvas_resize, "demo").bind()
+        
+        # Items створюються один раз, при зміні розміру чи слайду лише оновлюються
+        # Опційно: слайди як готові bitmap-и (Pillow) - перехід коштує одне зображення
+        self.bitmap_cache = None
+        if config.content['bitmap_playback'] and SlideBitmapCache.is_available():
+            self.bitmap_cache = SlideBitmapCache(config.content['bitmap_cache_bytes'])
+        self.slide_renderer = RetainedSlideRenderer(self.slide_canvas, self.bitmap_cache)
     
     def create_navigation_controls(self):
         """Створює навігаційні контроли"""
@@ -280,6 +293,10 @@ class DemoTab:
         canvas.create_window((0, 0), window=self.slides_list_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
+        # Посторінкова навігація (slides_per_page)
+        self.slides_pager = SlidePager(self.sidebar_frame, self.main_window, self.on_list_page_changed)
+        self.slides_pager.pack(fill='x', padx=15, pady=(0, 5))
+        
         canvas.pack(side="left", fill="both", expand=True, padx=(15, 0), pady=(0, 15))
         scrollbar.pack(side="right", fill="y", pady=(0, 15))
         
@@ -314,13 +331,12 @@ class DemoTab:
         
         self.slide_buttons = {}
         
-        # Отримуємо слайди з content_manager
-        slides = content_manager.get_all_slides()
-        self.total_slides = len(slides)
+        # Будуємо лише поточну сторінку - вартість не залежить від розміру презентації
+        self.total_slides = content_manager.get_slide_count()
+        page_count = content_manager.get_page_count()
+        self.list_page = min(self.list_page, page_count - 1)
         
-        for slide_id in sorted(slides.keys()):
-            slide = slides[slide_id]
-            
+        for slide_id, slide in content_manager.get_page(self.list_page):
             # Контейнер для кнопки слайду
             slide_container = tk.Frame(
                 self.slides_list_frame,
@@ -355,9 +371,23 @@ class DemoTab:
             
             self.slide_buttons[slide_id] = slide_button
         
+        self.slides_pager.update_pages(self.list_page, page_count)
+        
         # Оновити лічильник
         self.update_slide_counter()
     
+    def on_list_page_changed(self, page):
+        """Обробник перемикання сторінки у списку слайдів"""
+        self.list_page = page
+        self.create_slides_list()
+    
+    def ensure_slide_page_visible(self):
+        """Перемикає список на сторінку з поточним слайдом"""
+        page = content_manager.get_page_for_slide(self.current_slide)
+        if page != self.list_page:
+            self.list_page = page
+            self.create_slides_list()
+    
     def on_canvas_resize(self, event):
         """Обробник зміни розміру canvas для адаптивності"""
         # Оновити відображення поточного слайду
@@ -366,6 +396,7 @@ class DemoTab:
     def load_current_slide(self):
         """Завантажує поточний слайд"""
         self.render_current_slide()
+        self.ensure_slide_page_visible()
         self.update_slide_list_selection()
         self.update_slide_counter()
     
@@ -381,24 +412,20 @@ class DemoTab:
                 canvas_height = self.slide_canvas.winfo_height()
                 
                 if canvas_width > 10 and canvas_height > 10:
-                    # Підготувати дані слайду для рендерера
-                    slide_data = {
-                        'title': slide.title,
-                        'content': slide.content,
-                        'slide_number': self.current_slide,
-                        'background_color': '#FFFFFF',
-                        'text_color': '#1F1F1F'
-                    }
-                    
-                    # Використати SlideRenderer для єдиного стилю
-                    SlideRenderer.render_slide_to_canvas(
-                        self.slide_canvas,
-                        slide_data,
+                    # Retained-рендерер: лише coords/itemconfigure існуючих items
+                    self.slide_canvas.delete('placeholder')
+                    self.slide_renderer.render(
+                        self.build_slide_data(self.current_slide, slide),
                         canvas_width,
-                        canvas_height
+                        canvas_height,
+                        cache_key=(self.current_slide, (slide.content_hash, slide.config_version))
                     )
                     
-                    logger.debug(f"Rendered slide {self.current_slide} in demo")
+                    if self.bitmap_cache is not None:
+                        # Наступний слайд растеризується у вільний час Tk
+                        self.slide_canvas.after_idle(self.prefetch_next_slide)
+                    
+                    logger.debug("Rendered slide %s in demo", self.current_slide)
             else:
                 # Показати заглушку якщо слайд не знайдено
                 self.render_placeholder()
@@ -407,8 +434,39 @@ class DemoTab:
             logger.error(f"Error rendering slide {self.current_slide}: {e}")
             self.render_placeholder()
     
+    @staticmethod
+    def build_slide_data(slide_id, slide):
+        """Дані слайду для рендерера"""
+        return {
+            'title': slide.title,
+            'content': slide.content,
+            'content_lines': slide.content_lines,
+            'display_list': slide.display_list,
+            'slide_number': slide_id,
+            'background_color': '#FFFFFF',
+            'text_color': '#1F1F1F'
+        }
+    
+    def prefetch_next_slide(self):
+        """Заздалегідь растеризує наступний слайд у bitmap-кеш"""
+        try:
+            slide_id = content_manager.get_adjacent_slide_id(self.current_slide, 1)
+            slide = content_manager.get_slide(slide_id) if slide_id is not None else None
+            if slide is None or self.bitmap_cache is None:
+                return
+            self.bitmap_cache.get(
+                slide_id,
+                (slide.content_hash, slide.config_version),
+                self.build_slide_data(slide_id, slide),
+                self.slide_canvas.winfo_width(),
+                self.slide_canvas.winfo_height()
+            )
+        except Exception as e:
+            logger.error(f"Error prefetching slide bitmap: {e}")
+    
     def render_placeholder(self):
         """Відображає заглушку коли слайд не може бути завантажений"""
+        self.slide_renderer.clear()
         self.slide_canvas.delete("all")
         
         canvas_width = self.slide_canvas.winfo_width()
@@ -423,7 +481,8 @@ class DemoTab:
             text="📽️",
             font=('Arial', 48),
             fill='#CCCCCC',
-            anchor='center'
+            anchor='center',
+            tags='placeholder'
         )
         
         self.slide_canvas.create_text(
@@ -431,7 +490,8 @@ class DemoTab:
             text="Slide wird geladen...",
             font=('Segoe UI', 16),
             fill='#999999',
-            anchor='center'
+            anchor='center',
+            tags='placeholder'
         )
     
     def update_slide_list_selection(self):
@@ -540,25 +600,53 @@ class DemoTab:
         speed_seconds = int(speed_text.replace('s', ''))
         self.slide_duration = speed_seconds * 1000  # конвертувати в мілісекунди
         
-        logger.debug(f"Demo speed changed to {speed_seconds} seconds")
+        logger.debug("Demo speed changed to %s seconds", speed_seconds)
     
     def on_content_changed(self, slide_id, slide_data, action='update'):
         """Обробник зміни контенту (синхронізація з Creator)"""
         try:
+            if self.bitmap_cache is not None:
+                # Змінений контент - bitmap-и застаріли
+                self.bitmap_cache.invalidate(None if action == 'reload' else slide_id)
+            
             if action == 'update' or action == 'load':
-                # Оновити список слайдів
-                self.create_slides_list()
+                # Оновити лише кнопку зміненого слайду, якщо вона на поточній сторінці
+                button = self.slide_buttons.get(slide_id)
+                if button is not None and slide_data is not None:
+                    title = slide_data.title
+                    display_title = title[:20] + "..." if len(title) > 20 else title
+                    button.configure(text=f"{slide_id}\n{display_title}")
+                elif content_manager.get_slide(slide_id) is not None \
+                        and content_manager.get_page_for_slide(slide_id) == self.list_page:
+                    # Новий слайд на поточній сторінці
+                    self.create_slides_list()
+                elif self.total_slides != content_manager.get_slide_count():
+                    # Слайд на іншій сторінці - лише лічильники, без перебудови списку
+                    self.total_slides = content_manager.get_slide_count()
+                    self.slides_pager.update_pages(self.list_page, content_manager.get_page_count())
+                    self.update_slide_counter()
                 
                 # Перемалювати поточний слайд якщо він був змінений
                 if slide_id == self.current_slide:
                     self.render_current_slide()
                 
-                logger.debug(f"Demo synchronized with content changes for slide {slide_id}")
+                logger.debug("Demo synchronized with content changes for slide %s", slide_id)
+                
+            elif action == 'reload':
+                # Масовий імпорт - одна перебудова списку замість N
+                if content_manager.get_slide(self.current_slide) is None:
+                    self.current_slide = self.first_slide_id()
+                
+                self.create_slides_list()
+                self.load_current_slide()
                 
             elif action == 'delete':
                 # Обробити видалення слайду
-                if slide_id == self.current_slide and self.current_slide > 1:
-                    self.current_slide -= 1
+                if slide_id == self.current_slide:
+                    # Попередній існуючий ID (або перший), а не просто slide_id - 1
+                    slide_ids = content_manager.get_slide_ids()
+                    position = bisect_left(slide_ids, slide_id)
+                    self.current_slide = slide_ids[position - 1] if position else self.first_slide_id()
                 
                 self.create_slides_list()
                 self.load_current_slide()
@@ -566,6 +654,11 @@ class DemoTab:
         except Exception as e:
             logger.error(f"Error handling content change in demo: {e}")
     
+    def first_slide_id(self):
+        """Перший ID у порядку content_manager (ID можуть починатися не з 1)"""
+        slide_ids = content_manager.get_slide_ids()
+        return slide_ids[0] if slide_ids else self.current_slide
+    
     def show(self):
         """Показати Demo Tab"""
         self.container.pack(fill='both', expand=True)
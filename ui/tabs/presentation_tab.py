@@ -9,7 +9,9 @@ from tkinter import ttk
 from core.theme import theme_manager
 from core.logger import logger
 from models.content import content_manager
+from models.search import slide_search_index, CURRENT_SOURCE
 from models.hardware import hardware_manager
+from ui.components.slide_pager import SlidePager
 
 class PresentationTab:
     """Presentation-Tab für manuelle Steuerung"""
@@ -19,6 +21,9 @@ class PresentationTab:
         self.main_window = main_window
         self.visible = False
         self.current_slide = 1
+        self.grid_page = 0
+        self.slide_buttons = {}        # slide_id -> Button der angezeigten Seite
+        self.highlighted_slide = None  # aktuell markierter Button
         
         self.create_presentation_content()
     
@@ -103,10 +108,18 @@ class PresentationTab:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
+        # Seitenweise Navigation (slides_per_page)
+        self.slide_pager = SlidePager(
+            grid_frame, self.main_window, self.on_grid_page_changed,
+            bg=colors['background_tertiary']
+        )
+        self.slide_pager.pack(fill='x', padx=15, pady=(0, 10))
+        
         canvas.pack(side="left", fill="both", expand=True, padx=15, pady=(0, 15))
         scrollbar.pack(side="right", fill="y", pady=(0, 15))
         
         # Slide-Buttons erstellen
+        self.slide_grid_frame = scrollable_frame
         self.create_slide_buttons(scrollable_frame)
     
     def create_slide_buttons(self, parent):
@@ -114,12 +127,21 @@ class PresentationTab:
         colors = theme_manager.get_colors()
         fonts = self.main_window.fonts
         
-        slides = content_manager.get_all_slides()
+        # Alte Buttons entfernen
+        for widget in parent.winfo_children():
+            widget.destroy()
+        self.slide_buttons = {}
+        self.highlighted_slide = None
+        
+        # Nur die aktuelle Seite aufbauen
+        page_count = content_manager.get_page_count()
+        self.grid_page = min(self.grid_page, page_count - 1)
+        self.slide_pager.update_pages(self.grid_page, page_count)
         
         # Grid-Layout: 4 Spalten
         cols = 4
         
-        for i, (slide_id, slide) in enumerate(slides.items()):
+        for i, (slide_id, slide) in enumerate(content_manager.get_page(self.grid_page)):
             row = i // cols
             col = i % cols
             
@@ -139,12 +161,13 @@ class PresentationTab:
                 command=lambda sid=slide_id: self.goto_slide(sid)
             )
             slide_btn.pack(fill='both', expand=True)
+            self.slide_buttons[slide_id] = slide_btn
             
             # Hover-Effekte
             def on_enter(e, btn=slide_btn):
                 btn.configure(bg=colors['background_hover'])
             
-            def on_leave(e, btn=slide_btn):
+            def on_leave(e, btn=slide_btn, slide_id=slide_id):
                 if slide_id != self.current_slide:
                     btn.configure(bg=colors['background_secondary'])
             
@@ -154,6 +177,7 @@ class PresentationTab:
             # Aktuelle Slide markieren
             if slide_id == self.current_slide:
                 slide_btn.configure(bg=colors['accent_primary'], fg='white')
+                self.highlighted_slide = slide_id
         
         # Grid-Spalten konfigurieren
         for i in range(cols):
@@ -188,6 +212,34 @@ class PresentationTab:
         )
         self.current_info.pack(pady=(0, 20))
         
+        # Slide-Suche
+        search_frame = tk.Frame(control_frame, bg=colors['background_tertiary'])
+        search_frame.pack(fill='x', padx=15, pady=(0, 20))
+        
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(
+            search_frame,
+            textvariable=self.search_var,
+            font=fonts['body'],
+            bg=colors['background_secondary'],
+            fg=colors['text_primary'],
+            insertbackground=colors['text_primary'],
+            relief='flat'
+        )
+        search_entry.pack(fill='x', ipady=4)
+        search_entry.bind('<KeyRelease>', self.on_search_changed)
+        search_entry.bind('<Return>', self.on_search_submit)
+        
+        self.search_result_label = tk.Label(
+            search_frame,
+            text="🔍 Suche: Enter springt zum Treffer",
+            font=fonts['caption'],
+            fg=colors['text_secondary'],
+            bg=colors['background_tertiary'],
+            anchor='w'
+        )
+        self.search_result_label.pack(fill='x', pady=(5, 0))
+        
         # Navigation Buttons
         nav_frame = tk.Frame(control_frame, bg=colors['background_tertiary'])
         nav_frame.pack(pady=(0, 20))
@@ -265,21 +317,33 @@ class PresentationTab:
         
         logger.info(f"Zu Slide {slide_id} gewechselt")
     
+    def on_search_changed(self, event=None):
+        """Zeigt den besten Treffer für die aktuelle Sucheingabe"""
+        results = slide_search_index.search(self.search_var.get(), limit=1, source=CURRENT_SOURCE)
+        if results:
+            self.search_result_label.configure(text=f"➡ Slide {results[0].slide_id}: {results[0].title[:30]}")
+        elif self.search_var.get().strip():
+            self.search_result_label.configure(text="Keine Treffer")
+        else:
+            self.search_result_label.configure(text="🔍 Suche: Enter springt zum Treffer")
+    
+    def on_search_submit(self, event=None):
+        """Springt zum besten Suchtreffer"""
+        results = slide_search_index.search(self.search_var.get(), limit=1, source=CURRENT_SOURCE)
+        if results:
+            self.goto_slide(results[0].slide_id)
+    
     def previous_slide(self):
         """Geht zur vorherigen Slide"""
-        slides = list(content_manager.get_all_slides().keys())
-        if slides:
-            current_index = slides.index(self.current_slide) if self.current_slide in slides else 0
-            prev_index = (current_index - 1) % len(slides)
-            self.goto_slide(slides[prev_index])
+        slide_id = content_manager.get_adjacent_slide_id(self.current_slide, -1)
+        if slide_id is not None:
+            self.goto_slide(slide_id)
     
     def next_slide(self):
         """Geht zur nächsten Slide"""
-        slides = list(content_manager.get_all_slides().keys())
-        if slides:
-            current_index = slides.index(self.current_slide) if self.current_slide in slides else 0
-            next_index = (current_index + 1) % len(slides)
-            self.goto_slide(slides[next_index])
+        slide_id = content_manager.get_adjacent_slide_id(self.current_slide, 1)
+        if slide_id is not None:
+            self.goto_slide(slide_id)
     
     def send_hardware_signal(self):
         """Sendet Signal an Hardware"""
@@ -309,10 +373,26 @@ class PresentationTab:
             self.hw_status_label.configure(text="Fehler beim Senden")
             logger.error(f"Fehler beim Hardware-Signal: {e}")
     
+    def on_grid_page_changed(self, page):
+        """Wechselt die angezeigte Seite im Slide-Grid"""
+        self.grid_page = page
+        self.create_slide_buttons(self.slide_grid_frame)
+    
     def refresh_slide_buttons(self):
-        """Aktualisiert die Slide-Button-Anzeige"""
-        # Einfache Implementierung - in einer echten App würde man die Buttons direkt aktualisieren
-        pass
+        """Markiert die aktuelle Slide; neu aufgebaut wird nur beim Seitenwechsel"""
+        page = content_manager.get_page_for_slide(self.current_slide)
+        if page != self.grid_page or self.current_slide not in self.slide_buttons:
+            self.grid_page = page
+            self.create_slide_buttons(self.slide_grid_frame)
+            return
+        
+        # Gleiche Seite: nur die Farben der beiden betroffenen Buttons ändern
+        colors = theme_manager.get_colors()
+        previous = self.slide_buttons.get(self.highlighted_slide)
+        if previous is not None and self.highlighted_slide != self.current_slide:
+            previous.configure(bg=colors['background_secondary'], fg=colors['text_primary'])
+        self.slide_buttons[self.current_slide].configure(bg=colors['accent_primary'], fg='white')
+        self.highlighted_slide = self.current_slide
     
     def refresh_theme(self):
         """Aktualisiert das Theme für den Presentation-Tab"""